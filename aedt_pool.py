@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+AEDT SESSION POOL – run many jobs across several local AEDT sessions
+  • one worker process per session, each owning a warm Desktop (one licence)
+  • per-session job queues, longest-job-first placement, work stealing when
+    a session runs dry
+  • failed jobs are retried on another session; a crashed / hung session is
+    restarted and its in-flight job re-queued
+  • every attempt is reported with session, attempt number and wall time
+  • messages carry the session generation and the job id + attempt; a late
+    reply from a killed session is dropped, never credited to the next job
+
+A job target is "module:function"; the worker imports it and calls
+    function(desktop, **kwargs)  →  any picklable result
+"""
+
+import time, heapq, traceback, importlib, queue
+import multiprocessing as mp
+from collections import deque
+
+
+class Job(object):
+    """One unit of work for the pool."""
+    __slots__ = ("job_id", "target", "kwargs", "cost", "priority", "timeout",
+                 "attempt", "tried_on")
+
+    def __init__(self, job_id, target, kwargs=None, cost=1.0, priority=0,
+                 timeout=None):
+        self.job_id   = job_id
+        self.target   = target
+        self.kwargs   = kwargs or {}
+        self.cost     = float(cost)         # e.g. dump size – used for balancing
+        self.priority = priority            # higher runs first
+        self.timeout  = timeout             # seconds, None = unlimited
+        self.attempt  = 0
+        self.tried_on = set()
+
+
+def _resolve(target):
+    mod, fn = target.split(":")
+    return getattr(importlib.import_module(mod), fn)
+
+
+# ───────── worker process ───────── #
+def _session_main(slot, gen, version, non_graphical, inbox, outbox):
+    try:
+        from pyaedt import Desktop
+        desktop = Desktop(specified_version=version, non_graphical=non_graphical,
+                          new_desktop=True, close_on_exit=False)
+    except Exception:
+        outbox.put(("dead", slot, gen, traceback.format_exc()))
+        return
+    outbox.put(("ready", slot, gen, None))
+    while True:
+        job = inbox.get()
+        if job is None:
+            break
+        job_id, attempt, target, kwargs = job
+        t0 = time.perf_counter()
+        try:
+            value, status, err = _resolve(target)(desktop, **kwargs), "ok", None
+        except Exception:
+            value, status, err = None, "error", traceback.format_exc()
+        outbox.put(("done", slot, gen, {"job": job_id, "attempt": attempt,
+                                        "status": status, "value": value, "error": err,
+                                        "seconds": time.perf_counter() - t0}))
+    try:
+        desktop.release_desktop(close_projects=True, close_desktop=True)
+    except Exception:
+        pass
+
+
+# ───────── pool ───────── #
+class SessionPool(object):
+    """
+    sessions      : number of concurrent AEDT sessions (= licences to use)
+    retries       : extra attempts per job after the first failure
+    on_result     : optional callback(result_dict) per finished attempt
+    """
+
+    def __init__(self, sessions=2, version=None, non_graphical=True,
+                 retries=1, on_result=None):
+        self.sessions      = max(1, int(sessions))
+        self.version       = version
+        self.non_graphical = non_graphical
+        self.retries       = retries
+        self.on_result     = on_result
+        self._ctx          = mp.get_context("spawn")
+        self._outbox       = self._ctx.Queue()
+        self._procs, self._inbox = {}, {}
+        self._gen          = {}             # slot → generation of its session
+
+    # -- session lifecycle ------------------------------------------------ #
+    def _start(self, slot):
+        gen = self._gen[slot] = self._gen.get(slot, -1) + 1
+        inbox = self._ctx.Queue()
+        p = self._ctx.Process(target=_session_main, daemon=True,
+                              args=(slot, gen, self.version, self.non_graphical,
+                                    inbox, self._outbox))
+        p.start()
+        self._procs[slot], self._inbox[slot] = p, inbox
+
+    def _kill(self, slot):
+        p = self._procs.pop(slot, None)
+        if p is not None and p.is_alive():
+            p.terminate()
+            p.join(10)
+        self._inbox.pop(slot, None)
+
+    # -- scheduling ------------------------------------------------------- #
+    def _place(self, jobs):
+        """longest-processing-time first onto the least loaded session queue"""
+        queues = {s: deque() for s in range(self.sessions)}
+        heap = [(0.0, s) for s in range(self.sessions)]
+        for job in sorted(jobs, key=lambda j: (-j.priority, -j.cost)):
+            load, s = heapq.heappop(heap)
+            queues[s].append(job)
+            heapq.heappush(heap, (load + job.cost, s))
+        return queues
+
+    @staticmethod
+    def _next_for(slot, queues):
+        if queues[slot]:
+            return queues[slot].popleft()
+        # steal from the tail of the busiest other queue
+        donor = max(queues, key=lambda s: len(queues[s]))
+        if queues[donor]:
+            # prefer a job that has not failed on this slot before
+            for i in range(len(queues[donor]) - 1, -1, -1):
+                if slot not in queues[donor][i].tried_on:
+                    job = queues[donor][i]
+                    del queues[donor][i]
+                    return job
+            return queues[donor].pop()
+        return None
+
+    def _requeue(self, job, queues, results, status, error, slot, seconds):
+        rec = {"job": job.job_id, "session": slot, "attempt": job.attempt,
+               "status": status, "error": error, "seconds": seconds,
+               "value": None}
+        self._emit(rec)
+        if job.attempt <= self.retries:
+            # retry on a different session if there is one
+            others = [s for s in queues if s not in job.tried_on] or list(queues)
+            target = min(others, key=lambda s: len(queues[s]))
+            queues[target].appendleft(job)
+        else:
+            results[job.job_id] = rec
+
+    def _emit(self, rec):
+        if self.on_result:
+            self.on_result(rec)
+
+    def run(self, jobs):
+        """Run every job; returns {job_id: final result dict}."""
+        jobs = list(jobs)
+        ids = [j.job_id for j in jobs]
+        if len(set(ids)) != len(ids):           # results are keyed by id – never completes
+            dup = sorted({i for i in ids if ids.count(i) > 1})
+            raise ValueError(f"duplicate job ids: {', '.join(map(str, dup))}")
+        queues = self._place(jobs)
+        results, running, ready = {}, {}, set()
+        for s in range(self.sessions):
+            self._start(s)
+
+        while len(results) < len(jobs):
+            # feed idle sessions
+            for slot in sorted(ready):
+                if slot in running:
+                    continue
+                job = self._next_for(slot, queues)
+                if job is None:
+                    continue
+                job.attempt += 1
+                job.tried_on.add(slot)
+                running[slot] = (job, time.perf_counter())
+                self._inbox[slot].put((job.job_id, job.attempt, job.target, job.kwargs))
+
+            if not ready and not any(p.is_alive() for p in self._procs.values()):
+                raise RuntimeError("no AEDT session could be started")
+
+            try:
+                kind, slot, gen, payload = self._outbox.get(timeout=1.0)
+            except queue.Empty:
+                kind = None
+            if kind is not None and gen != self._gen.get(slot):
+                kind = None                     # from a session killed since
+            if kind == "done":
+                job = running.get(slot, (None,))[0]
+                if job is None or (job.job_id, job.attempt) != (payload["job"],
+                                                                payload["attempt"]):
+                    kind = None                 # not what this slot is running
+
+            if kind == "ready":
+                ready.add(slot)
+            elif kind == "dead":
+                ready.discard(slot)
+                self._kill(slot)
+                print(f"⚠ session {slot} failed to start:\n{payload}")
+            elif kind == "done":
+                job, t0 = running.pop(slot)
+                if payload["status"] == "ok":
+                    rec = dict(payload, session=slot, attempt=job.attempt)
+                    results[job.job_id] = rec
+                    self._emit(rec)
+                else:
+                    self._requeue(job, queues, results, "error", payload["error"],
+                                  slot, payload["seconds"])
+
+            # timeouts and crashed sessions → restart, re-queue in-flight job
+            now = time.perf_counter()
+            for slot, (job, t0) in list(running.items()):
+                hung = job.timeout is not None and now - t0 > job.timeout
+                dead = not self._procs[slot].is_alive()
+                if hung or dead:
+                    running.pop(slot)
+                    ready.discard(slot)
+                    self._kill(slot)
+                    self._start(slot)
+                    self._requeue(job, queues, results,
+                                  "timeout" if hung else "crashed",
+                                  None, slot, now - t0)
+
+        self.close()
+        return results
+
+    def close(self):
+        for slot, inbox in list(self._inbox.items()):
+            try:
+                inbox.put(None)
+            except Exception:
+                pass
+        for slot, p in list(self._procs.items()):
+            p.join(30)
+            if p.is_alive():
+                p.terminate()
+        self._procs.clear()
+        self._inbox.clear()
@@ -4,18 +4,49 @@ HFSS EXTRACTOR — full history + all entities
 Creates HFSS_Extract_<project>_<design>_<timestamp>.json (+ _variables.csv)
 """
 
-import os, json, csv
+import os, sys, json, csv
 from datetime import datetime
 from pyaedt import Desktop, Hfss
 
+from extract_cache import ExtractionCache
+from capabilities import get_probe, VARIABLE_STRATEGIES, OBJECT_NAME_STRATEGIES
+
 # ───────── user options ───────── #
 PROJECT_PATH = None        # r"C:\file.aedt"  or None  to attach
 DESIGN_NAME  = None        # "Design1"       or None  for active
 AEDT_VERSION = None        # "2024.2"        or None
 EXPORT_CSV   = True
+USE_CACHE    = True        # needs PROJECT_PATH + DESIGN_NAME
 # ──────────────────────────────── #
 
 ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+# ───────── output writer (shared by cache hit + fresh extraction) ───────── #
+def save(data):
+    meta = data["meta"]
+    base = f"HFSS_Extract_{meta['project']}_{meta['design']}_{ts}"
+    with open(base + ".json", "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    print("JSON  →", base + ".json")
+
+    if EXPORT_CSV:
+        with open(base + "_variables.csv", "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f); w.writerow(["Variable", "Value"])
+            for k, v in data["variables"].items(): w.writerow([k, v])
+        print("CSV   →", base + "_variables.csv")
+
+# 0 ▪ extraction cache – unchanged project file + design → no AEDT at all
+cache = cache_key = None
+if USE_CACHE and PROJECT_PATH and DESIGN_NAME and os.path.isfile(PROJECT_PATH):
+    cache = ExtractionCache()
+    cache_key = cache.key(PROJECT_PATH, DESIGN_NAME, "alv")
+    cached = cache.load(cache_key)
+    if cached is not None:
+        cached["meta"]["served_from_cache"] = ts
+        save(cached)
+        print("✅  Served from cache (project file unchanged).")
+        sys.exit(0)
+
 desktop = Desktop(specified_version=AEDT_VERSION, new_desktop=False)
 
 # 1 ▪ open / attach project
@@ -48,19 +79,19 @@ mdl = hfss.modeler
 
 # ───────── helper collectors ───────── #
 def grab_vars():
-    vm = hfss.variable_manager
-    return getattr(vm, "variables", getattr(vm, "properties", {}))
+    return get_probe(hfss).call("variables", VARIABLE_STRATEGIES, hfss)
 
 def grab_mats():
     return list(hfss.materials.material_keys)
 
 def grab_objects():
-    out = {}
-    for h in mdl.objects:
-        names = [h.name] if hasattr(h, "name") else mdl.get_object_name(h)
-        if isinstance(names, str):
-            names = [names]
-        for n in names:
+    out, handles = {}, list(mdl.objects)
+    if not handles:
+        return out
+    names_of = get_probe(hfss).bind("object_names", OBJECT_NAME_STRATEGIES,
+                                    mdl, handles[0])
+    for h in handles:
+        for n in names_of(mdl, h):
             if not mdl.does_object_exist(n) or mdl.is_group(n):
                 continue
             try:
@@ -117,16 +148,10 @@ data = {
 data["boundaries"], data["excitations"] = grab_bounds_ports()
 
 # ───────── save ───────── #
-base = f"HFSS_Extract_{hfss.project_name}_{hfss.design_name}_{ts}"
-with open(base + ".json", "w", encoding="utf-8") as f:
-    json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-print("JSON  →", base + ".json")
-
-if EXPORT_CSV:
-    with open(base + "_variables.csv", "w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f); w.writerow(["Variable", "Value"])
-        for k, v in data["variables"].items(): w.writerow([k, v])
-    print("CSV   →", base + "_variables.csv")
+if cache is not None:
+    if not cache.store(cache_key, json.loads(json.dumps(data, default=str))):
+        print("⚠ dump larger than the cache limit – not cached")
+save(data)
 
 hfss.release_desktop(close_projects=False, close_desktop=False)
 print("✅  Extraction complete.")
\ No newline at end of file
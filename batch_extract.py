@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS BATCH EXTRACTOR – a manifest of projects, several AEDT sessions
+Replaces editing PROJECT_PATH / DESIGN_NAME per run: every manifest entry is
+one job (a project + its designs) scheduled on aedt_pool.SessionPool
+  • priority  : higher runs first;  cost = .aedt size → longest-first placement
+  • timeout   : per job – a hung session is killed, restarted and the job
+                retried (--retries) on another session
+  • warm      : sessions live for the whole batch, so AEDT start-up and the
+                capability probe are paid once per session, not per project
+  • filters   : sections / objects / materials / region per entry
+                (extract_filter.ExtractFilter)
+One project is never opened in two sessions at once – its designs are
+extracted back to back inside the same job, and manifest entries naming
+the same .aedt are merged into one job (designs united; differing filters
+are an error).
+
+Manifest (JSON; relative paths are relative to the manifest)
+--------
+  {"defaults": {"timeout": 1800, "sections": ["!history"]},
+   "jobs": [{"project": "a.aedt", "designs": ["HFSSDesign1"], "priority": 5},
+            {"project": "b.aedt"}]}               # no designs → all of them
+  A bare list of job entries works too.
+
+Outputs
+  • <out_dir>/<project>/HFSS_Extract_<project>_<design>_<ts>.json
+    (<project>_2, _3 … for further projects sharing a file name)
+  • <out_dir>/batch_attempts_<ts>.csv   – one row per attempt
+  • <out_dir>/batch_report_<ts>.json    – per job / design status, totals
+
+Examples
+--------
+  python batch_extract.py nightly.json -o dumps -n 4
+  python batch_extract.py nightly.json -o dumps -n 6 -v 2024.2 --retries 2
+"""
+import os, csv, json, time, argparse
+from datetime import datetime
+
+from aedt_pool import Job, SessionPool
+
+JOB_KEYS = {"project", "designs", "design", "priority", "timeout", "sections",
+            "objects", "materials", "region"}
+
+
+# ───────── extraction of one design (inside a pool session) ───────── #
+def extract_design(hfss, base, flt=None):
+    """united.py-layout dump of the open *hfss* design → (path, object count)"""
+    from extract_filter import ALL
+    from capabilities import get_probe, OBJECT_NAME_STRATEGIES
+    from extract_pipeline import (object_items, fetch_object, normalize_object,
+                                  run_pipeline, SectionSpool, save_dump)
+    from dump_digest import add_digests, DIGEST_FIELDS, merkle_root
+    from dump_schema import SCHEMA_VERSION
+    from extract_sections import collect_sections, material_index
+
+    flt = flt or ALL
+    sections = collect_sections(hfss, flt)
+    data = {"meta": {"timestamp": datetime.now().strftime("%Y%m%d_%H%M%S"),
+                     "project": hfss.project_name, "design": hfss.design_name,
+                     "aedt_version": getattr(hfss, "aedt_version_id", None),
+                     "schema": SCHEMA_VERSION}}
+    if flt.selective or flt.sections != ALL.sections:
+        data["meta"]["filter"] = flt.describe()
+    for key in ("variables", "materials", "material_library"):
+        if key in sections:
+            data[key] = sections.pop(key)
+
+    with SectionSpool(base + ".objects.part") as spool:    # .part removed, error or not
+        if flt.wants("objects"):
+            mdl = hfss.modeler
+            mat_index = material_index(data)
+            names = flt.object_names(mdl)
+            names_of = None
+            if names is None:
+                handles = list(mdl.objects)
+                if handles:
+                    names_of = get_probe(hfss).bind("object_names", OBJECT_NAME_STRATEGIES,
+                                                    mdl, handles[0])
+            if names is not None or names_of is not None:
+                items = (flt.object_items(mdl, names_of, names) if flt.selective
+                         else object_items(mdl, names_of))
+                region = flt.keep_bbox if flt.region else None
+                data["objects"] = run_pipeline(
+                    items, lambda it: fetch_object(mdl, *it, region=region),
+                    lambda raw: normalize_object(raw, mat_index), spool.write)
+            else:
+                data["objects"] = {}
+        data.update(sections)
+
+        roots = add_digests(data, {k: v for k, v in DIGEST_FIELDS.items() if k != "objects"})
+        if "objects" in data:
+            roots["objects"] = merkle_root(data["objects"])          # {name: digest}
+        path = save_dump(data, base + ".json", {"objects": spool})
+    return path, len(data.get("objects") or ())
+
+
+def extract_project(desktop, project, out_dir, designs=None, version=None,
+                    sections=None, objects=None, materials=None, region=None,
+                    folder=None):
+    """All requested designs of one project; returns one record per design."""
+    from pyaedt import Hfss
+    from extract_filter import ExtractFilter
+
+    flt = ExtractFilter(sections, objects, materials, region)
+    stem = os.path.splitext(os.path.basename(project))[0]
+    folder = os.path.join(out_dir, folder or stem)
+    os.makedirs(folder, exist_ok=True)
+
+    hfss = Hfss(projectname=project, designname=(designs or [None])[0],
+                specified_version=version, new_desktop=False, close_on_exit=False)
+    out = []
+    try:
+        for design in designs or list(hfss.design_list):
+            t0 = time.perf_counter()
+            rec = {"design": design, "dump": None, "objects": 0, "error": None}
+            try:
+                if design != hfss.design_name:
+                    hfss.set_active_design(design)
+                ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+                base = os.path.join(folder, f"HFSS_Extract_{stem}_{design}_{ts}")
+                rec["dump"], rec["objects"] = extract_design(hfss, base, flt)
+            except Exception as e:
+                rec["error"] = f"{type(e).__name__}: {e}"
+            rec["seconds"] = round(time.perf_counter() - t0, 2)
+            out.append(rec)
+    finally:
+        desktop.odesktop.CloseProject(hfss.project_name)
+    if out and all(r["error"] for r in out):
+        raise RuntimeError("every design failed: " + "; ".join(r["error"] for r in out))
+    return out
+
+
+# ───────── manifest ───────── #
+FILTER_KEYS = ("sections", "objects", "materials", "region")
+
+
+def _merge_entry(a, b, i):
+    """second manifest entry for the same project → folded into *a*"""
+    for k in FILTER_KEYS:
+        if a.get(k) != b.get(k):
+            raise ValueError(f"manifest job {i}: {b['project']} listed twice "
+                             f"with different {k!r}")
+    if a.get("designs") is None or b.get("designs") is None:
+        a["designs"] = None                                  # all designs
+    else:
+        a["designs"] = a["designs"] + [d for d in b["designs"] if d not in a["designs"]]
+    a["priority"] = max(a.get("priority", 0), b.get("priority", 0))
+    if "timeout" in a or "timeout" in b:
+        t = [x for x in (a.get("timeout"), b.get("timeout")) if x is not None]
+        a["timeout"] = max(t) if t else None
+
+
+def read_manifest(path):
+    """→ list of job entries with defaults applied and absolute project paths;
+    entries for the same project (normalised path) are merged into one"""
+    with open(path, "r", encoding="utf-8") as f:
+        doc = json.load(f)
+    defaults, entries = ({}, doc) if isinstance(doc, list) else \
+        (doc.get("defaults") or {}, doc.get("jobs") or [])
+    root = os.path.dirname(os.path.abspath(path))
+    out, by_path = [], {}
+    for i, e in enumerate(entries):
+        e = dict(defaults, **({"project": e} if isinstance(e, str) else e))
+        unknown = set(e) - JOB_KEYS
+        if unknown:
+            raise ValueError(f"manifest job {i}: unknown keys {sorted(unknown)}")
+        if "project" not in e:
+            raise ValueError(f"manifest job {i}: no project")
+        e["project"] = os.path.normpath(os.path.join(root, e["project"]))
+        if "design" in e:
+            e["designs"] = [e.pop("design")]
+        same = os.path.normcase(os.path.realpath(e["project"]))
+        if same in by_path:
+            _merge_entry(by_path[same], e, i)
+            continue
+        by_path[same] = e
+        out.append(e)
+    return out
+
+
+def make_jobs(entries, out_dir, version=None, timeout=None):
+    jobs, seen = [], {}
+    for e in entries:
+        stem = os.path.splitext(os.path.basename(e["project"]))[0]
+        seen[stem] = seen.get(stem, 0) + 1
+        job_id = stem if seen[stem] == 1 else f"{stem}#{seen[stem]}"
+        kwargs = {"project": e["project"], "out_dir": out_dir, "version": version,
+                  "designs": e.get("designs")}
+        if seen[stem] > 1:
+            kwargs["folder"] = f"{stem}_{seen[stem]}"
+        for k in FILTER_KEYS:
+            if e.get(k) is not None:
+                kwargs[k] = e[k]
+        cost = os.path.getsize(e["project"]) if os.path.isfile(e["project"]) else 1.0
+        jobs.append(Job(job_id, "batch_extract:extract_project", kwargs, cost=cost,
+                        priority=e.get("priority", 0),
+                        timeout=e.get("timeout", timeout)))
+    return jobs
+
+
+def main():
+    cli = argparse.ArgumentParser(description="Extract many HFSS projects from a manifest")
+    cli.add_argument("manifest", help="JSON manifest of projects / designs")
+    cli.add_argument("-o", "--out-dir", default="dumps", help="output folder")
+    cli.add_argument("-n", "--sessions", type=int, default=2,
+                     help="parallel AEDT sessions (≈ licences available)")
+    cli.add_argument("-v", "--version", help="AEDT version, e.g. 2024.2")
+    cli.add_argument("--retries", type=int, default=1, help="retries per job")
+    cli.add_argument("--timeout", type=float, help="default seconds per job")
+    cli.add_argument("--graphical", action="store_true", help="show AEDT UI")
+    args = cli.parse_args()
+
+    entries = read_manifest(args.manifest)
+    missing = [e["project"] for e in entries if not os.path.isfile(e["project"])]
+    if missing:
+        raise FileNotFoundError("not found: " + ", ".join(missing))
+    out_dir = os.path.abspath(args.out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = make_jobs(entries, out_dir, args.version, args.timeout)
+
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    attempts_path = os.path.join(out_dir, f"batch_attempts_{ts}.csv")
+    report_path = os.path.join(out_dir, f"batch_report_{ts}.json")
+    fh = open(attempts_path, "w", newline="", encoding="utf-8")
+    w = csv.writer(fh)
+    w.writerow(["Job", "Session", "Attempt", "Status", "Seconds", "Designs", "Error"])
+
+    def log(rec):
+        err = (rec.get("error") or "").strip().splitlines()
+        designs = rec.get("value") or []
+        w.writerow([rec["job"], rec["session"], rec["attempt"], rec["status"],
+                    f'{rec["seconds"]:.1f}', len(designs), err[-1] if err else ""])
+        fh.flush()
+        mark = "✓" if rec["status"] == "ok" else "❌"
+        print(f'{mark} {rec["job"]}  session {rec["session"]}  '
+              f'try {rec["attempt"]}  {rec["seconds"]:.1f}s')
+
+    print(f"→ {len(jobs)} projects over {args.sessions} AEDT sessions")
+    t0 = time.time()
+    pool = SessionPool(args.sessions, version=args.version,
+                       non_graphical=not args.graphical,
+                       retries=args.retries, on_result=log)
+    try:
+        results = pool.run(jobs)
+    finally:
+        fh.close()
+
+    report = {"manifest": os.path.abspath(args.manifest), "started": ts,
+              "seconds": round(time.time() - t0, 1), "sessions": args.sessions,
+              "jobs": []}
+    n_designs = n_failed = n_objects = 0
+    for job in jobs:
+        r = results[job.job_id]
+        designs = r.get("value") or []
+        err = (r.get("error") or "").strip().splitlines()
+        n_designs += len(designs)
+        n_failed += sum(1 for d in designs if d["error"])
+        n_objects += sum(d["objects"] for d in designs)
+        report["jobs"].append({"job": job.job_id, "project": job.kwargs["project"],
+                               "priority": job.priority, "status": r["status"],
+                               "session": r["session"], "attempts": r["attempt"],
+                               "seconds": round(r["seconds"], 1),
+                               "error": err[-1] if err else None,
+                               "designs": designs})
+    failed_jobs = [j["job"] for j in report["jobs"] if j["status"] != "ok"]
+    report["totals"] = {"jobs": len(jobs), "jobs_failed": len(failed_jobs),
+                        "designs": n_designs, "designs_failed": n_failed,
+                        "objects": n_objects}
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"✅  {len(jobs) - len(failed_jobs)}/{len(jobs)} projects, "
+          f"{n_designs - n_failed}/{n_designs} designs, {n_objects} objects – "
+          f"report → {report_path}")
+    if failed_jobs:
+        print("❌ failed:", ", ".join(failed_jobs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS BATCH REBUILDER – many dumps, several AEDT sessions in parallel
+Each dump is rebuilt with histr.rebuild_design() into its own project
+  <out_dir>/<dump-stem>_rebuilt.aedt  (design "Rebuilt_Model");
+  dumps sharing a stem (other folders) become <stem>_2_rebuilt.aedt, …
+  and jobs <stem>#2, …
+Jobs are spread over a pool of local AEDT sessions (aedt_pool.SessionPool),
+so throughput scales with the number of licences you give it (-n).
+
+Outputs
+  • the rebuilt projects
+  • <out_dir>/rebuild_timing_<timestamp>.csv   – one row per attempt
+
+Examples
+--------
+  python batch_rebuild.py -d dumps\\*.json -o rebuilt -n 4
+  python batch_rebuild.py -d dumps -o rebuilt -n 6 -v 2024.2 --retries 2
+"""
+import os, csv, glob, argparse
+from datetime import datetime
+
+from aedt_pool import Job, SessionPool
+
+
+# ───────── job executed inside a pool session ───────── #
+def rebuild_job(desktop, dump, output, version=None):
+    """Rebuild one dump into a fresh project; returns the saved path."""
+    from pyaedt import Hfss
+    from histr import rebuild_design
+    from design_model import load_design
+
+    data = load_design(dump)
+    hfss = Hfss(projectname=output, designname="Rebuilt_Model",
+                solution_type="DrivenModal", specified_version=version,
+                new_desktop=False, close_on_exit=False)
+    try:
+        rebuild_design(hfss, data, os.path.dirname(dump))
+        hfss.save_project()
+        return hfss.project_path
+    finally:
+        # free the session for the next job
+        desktop.odesktop.CloseProject(hfss.project_name)
+
+
+def collect_dumps(patterns):
+    out = []
+    for pat in patterns:
+        if os.path.isdir(pat):
+            pat = os.path.join(pat, "*.json")
+        out.extend(sorted(glob.glob(pat)) or ([pat] if os.path.isfile(pat) else []))
+    return [os.path.abspath(p) for p in dict.fromkeys(out)]
+
+
+def make_jobs(dumps, out_dir, version=None, timeout=None):
+    """one job per dump – ids and output projects unique per stem"""
+    jobs, seen = [], {}
+    for p in dumps:
+        stem = os.path.splitext(os.path.basename(p))[0]
+        seen[stem] = seen.get(stem, 0) + 1
+        n = seen[stem]
+        job_id, name = (stem, stem) if n == 1 else (f"{stem}#{n}", f"{stem}_{n}")
+        jobs.append(Job(job_id, "batch_rebuild:rebuild_job",
+                        {"dump": p, "version": version,
+                         "output": os.path.join(out_dir, name + "_rebuilt.aedt")},
+                        cost=os.path.getsize(p), timeout=timeout))
+    return jobs
+
+
+def main():
+    cli = argparse.ArgumentParser(description="Rebuild many HFSS dumps in parallel")
+    cli.add_argument("-d", "--dumps", nargs="+", required=True,
+                     help="dump files, globs or directories")
+    cli.add_argument("-o", "--out-dir", default="rebuilt", help="output folder")
+    cli.add_argument("-n", "--sessions", type=int, default=2,
+                     help="parallel AEDT sessions (≈ licences available)")
+    cli.add_argument("-v", "--version", help="AEDT version, e.g. 2024.2")
+    cli.add_argument("--retries", type=int, default=1, help="retries per dump")
+    cli.add_argument("--timeout", type=float, help="seconds per rebuild")
+    cli.add_argument("--graphical", action="store_true", help="show AEDT UI")
+    args = cli.parse_args()
+
+    dumps = collect_dumps(args.dumps)
+    if not dumps:
+        raise FileNotFoundError("no dumps match " + " ".join(args.dumps))
+    out_dir = os.path.abspath(args.out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+
+    jobs = make_jobs(dumps, out_dir, args.version, args.timeout)
+
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timing_path = os.path.join(out_dir, f"rebuild_timing_{ts}.csv")
+    fh = open(timing_path, "w", newline="", encoding="utf-8")
+    w = csv.writer(fh)
+    w.writerow(["Job", "Session", "Attempt", "Status", "Seconds", "Output", "Error"])
+
+    def log(rec):
+        err = (rec.get("error") or "").strip().splitlines()
+        w.writerow([rec["job"], rec["session"], rec["attempt"], rec["status"],
+                    f'{rec["seconds"]:.1f}', rec.get("value") or "",
+                    err[-1] if err else ""])
+        fh.flush()
+        mark = "✓" if rec["status"] == "ok" else "❌"
+        print(f'{mark} {rec["job"]}  session {rec["session"]}  '
+              f'try {rec["attempt"]}  {rec["seconds"]:.1f}s')
+
+    print(f"→ {len(jobs)} dumps over {args.sessions} AEDT sessions")
+    pool = SessionPool(args.sessions, version=args.version,
+                       non_graphical=not args.graphical,
+                       retries=args.retries, on_result=log)
+    try:
+        results = pool.run(jobs)
+    finally:
+        fh.close()
+
+    failed = [j for j, r in results.items() if r["status"] != "ok"]
+    print(f"✅  {len(results) - len(failed)}/{len(results)} rebuilt – timing →",
+          timing_path)
+    if failed:
+        print("❌ failed:", ", ".join(failed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS BOUNDARY REGISTRY – table-driven creation of every dumped boundary / port
+  • BOUNDARY_REGISTRY maps each dumped type ("Perfect E", "Wave Port", …) to
+    its BoundarySetup method; register() adds / overrides an entry
+  • the dumped props are already the AEDT definition – props_to_args() turns
+    them back into the ["NAME:<name>", "Key:=", value, …] argument array
+  • create_boundaries() groups records by type:
+      small groups → one direct oModule.Assign*() call per record
+      large groups → rendered with the "assign" template into one IronPython
+                     script and run with a single RunScript() round-trip
+  • types without an entry are reported, never silently dropped
+"""
+import os, io, tempfile
+from collections import OrderedDict
+
+from script_templates import ScriptTemplates, ScriptWriter
+
+# ───────── registry ───────── #
+def _key(type_name):
+    return "".join((type_name or "").split()).lower()
+
+
+def _default_args(rec):
+    props = dict(rec.props)
+    if rec.faces:
+        props["Faces"] = list(rec.faces)
+    if rec.objects and not rec.faces:
+        props["Objects"] = list(rec.objects)
+    return ["NAME:" + rec.name] + props_to_args(props)
+
+
+BOUNDARY_REGISTRY = {}
+
+
+def register(type_name, method, args_fn=None, *aliases):
+    """type_name (as dumped) → BoundarySetup method; args_fn(record) → arg array"""
+    for t in (type_name,) + aliases:
+        BOUNDARY_REGISTRY[_key(t)] = (method, args_fn or _default_args)
+
+
+for _t, _m, _a in (
+        ("Radiation", "AssignRadiation", ()),
+        ("Perfect E", "AssignPerfectE", ("pec",)),
+        ("Perfect H", "AssignPerfectH", ("pmc",)),
+        ("Finite Conductivity", "AssignFiniteCond", ()),
+        ("Impedance", "AssignImpedance", ()),
+        ("Layered Impedance", "AssignLayeredImp", ()),
+        ("Anisotropic Impedance", "AssignAnisotropicImpedance", ()),
+        ("Screening Impedance", "AssignScreeningImpedance", ()),
+        ("Lumped RLC", "AssignLumpedRLC", ()),
+        ("Master", "AssignMaster", ()),
+        ("Slave", "AssignSlave", ()),
+        ("Symmetry", "AssignSymmetry", ()),
+        ("Aperture", "AssignAperture", ()),
+        ("Wave Port", "AssignWavePort", ()),
+        ("Lumped Port", "AssignLumpedPort", ()),
+        ("Floquet Port", "AssignFloquetPort", ()),
+        ("Circuit Port", "AssignCircuitPort", ()),
+        ("Terminal", "AssignTerminal", ()),
+        ("Voltage", "AssignVoltage", ()),
+        ("Current", "AssignCurrent", ()),
+        ("Incident Wave", "AssignPlaneWave", ()),
+        ("Magnetic Bias", "AssignMagneticBias", ())):
+    register(_t, _m, None, *_a)
+
+
+def lookup(type_name):
+    """→ (method, args_fn) or None"""
+    return BOUNDARY_REGISTRY.get(_key(type_name))
+
+
+_ITEM_NAME = ("NAME", "Name", "name")
+
+
+def _item(k, i, x):
+    """one dict of a list → ["NAME:<its name>", …]; unnamed items become k1, k2, …"""
+    name = next((x[n] for n in _ITEM_NAME if n in x), None)
+    rest = {n: v for n, v in x.items() if n not in _ITEM_NAME}
+    if name is None:
+        name = "%s%d" % (k, i + 1)
+    return ["NAME:%s" % name] + props_to_args(rest)
+
+
+def props_to_args(props):
+    """{k: v, k2: {…}} → ["k:=", v, ["NAME:k2", …]]  (AEDT argument array)"""
+    out = []
+    for k, v in props.items():
+        if isinstance(v, dict):
+            out.append(["NAME:" + k] + props_to_args(v))
+        elif isinstance(v, list) and v and all(isinstance(x, dict) for x in v):
+            out.append(["NAME:" + k] + [_item(k, i, x) for i, x in enumerate(v)])
+        else:
+            out += [k + ":=", v]
+    return out
+
+
+# ───────── creation ───────── #
+_PREAMBLE = '''# -*- coding: utf-8 -*-
+import ScriptEnv
+ScriptEnv.Initialize("Ansoft.ElectronicsDesktop")
+oProject = oDesktop.SetActiveProject(%(project)r)
+oDesign  = oProject.SetActiveDesign(%(design)r)
+oModule  = oDesign.GetModule("BoundarySetup")
+_failed  = []
+'''
+_EPILOGUE = '''
+_out = open(%(out)r, "w")
+_out.write("\\n".join(_failed))
+_out.close()
+'''
+
+
+def _run_batched(hfss, rows):
+    """rows: [{"method", "args", "name"}] → failure messages (one RunScript)"""
+    fd, out = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    script = out[:-4] + "_bnd.py"
+    with ScriptWriter(script, ScriptTemplates(module="oModule")) as w:
+        w.write_block(_PREAMBLE % {"project": hfss.project_name,
+                                   "design": hfss.design_name})
+        w.write_rows("assign", rows)
+        w.write_block(_EPILOGUE % {"out": out})
+    try:
+        hfss.odesktop.RunScript(script)
+        with io.open(out, "r", encoding="utf-8") as f:
+            return [l for l in f.read().splitlines() if l]
+    finally:
+        for p in (script, out):
+            try:
+                os.remove(p)
+            except OSError:
+                pass
+
+
+def create_boundaries(hfss, table, skip=(), batch_min=8):
+    """
+    Create every record of a BoundaryTable in the *hfss* design.
+    skip      : names already present (left untouched)
+    batch_min : groups with at least this many records go through one script
+    → {"created": [...], "failed": [...], "unknown": [...]}
+    """
+    skip = set(skip)
+    groups, unknown = OrderedDict(), []
+    for rec in table:
+        if rec.name in skip:
+            continue
+        if not (rec.faces or rec.objects or rec.props.get("Faces")
+                or rec.props.get("Objects")):
+            unknown.append(rec.name + " (no assignment)")
+            continue
+        entry = lookup(rec.type)
+        if entry is None:
+            unknown.append("%s (%s)" % (rec.name, rec.type))
+            continue
+        groups.setdefault(entry[0], []).append((rec, entry[1]))
+
+    created, failed, batched = [], [], []
+    omod = hfss.oboundary
+    for method, recs in groups.items():
+        if len(recs) >= batch_min:
+            batched += [(rec, method, fn(rec)) for rec, fn in recs]
+            continue
+        for rec, fn in recs:
+            try:
+                getattr(omod, method)(fn(rec))
+                created.append(rec.name)
+            except Exception as e:
+                failed.append("%s: %s" % (rec.name, e))
+
+    if batched:
+        rows = [{"method": m, "args": repr(args), "name": repr(rec.name)}
+                for rec, m, args in batched]
+        try:
+            errs = _run_batched(hfss, rows)
+        except Exception as e:
+            print("⚠ batched boundary script failed, assigning one by one:", e)
+            errs = []
+            for rec, m, args in batched:
+                try:
+                    getattr(omod, m)(args)
+                except Exception as e2:
+                    errs.append("%s: %s" % (rec.name, e2))
+        bad = {m.split(": ", 1)[0] for m in errs}
+        created += [rec.name for rec, _, _ in batched if rec.name not in bad]
+        failed += errs
+
+    print(f"✓ boundaries/ports: {len(created)} created"
+          + (f", {len(batched)} in one script" if batched else ""))
+    for m in failed:
+        print("  ❌", m)
+    if unknown:
+        print("⚠ not rebuilt:", ", ".join(unknown))
+    return {"created": created, "failed": failed, "unknown": unknown}
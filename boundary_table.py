@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS BOUNDARY TABLE – every boundary / port in one pass, as typed records
+  • PyAEDT: walk hfss.boundaries once and take faces / objects straight
+    from each definition's props (the assignment is already in there) –
+    get_boundary_faces() only for the rare entry that carries neither
+  • COM: GetBoundaries() / GetExcitations() already return flat
+    [name, type, name, type, …] lists – split them instead of asking
+    GetBoundaryType() per name
+  • BoundaryRecord (__slots__) rows; BoundaryTable.to_dump() gives the usual
+    {name: {...}} sections, BoundaryTable.from_dump() rebuilds the rows
+"""
+from extract_log import get_logger
+
+# types AEDT reports through GetBoundaries() / GetExcitations()
+KNOWN_TYPES = {
+    "Radiation", "Perfect E", "Perfect H", "Finite Conductivity", "Impedance",
+    "Layered Impedance", "Lumped RLC", "Master", "Slave", "Symmetry",
+    "Aperture", "Anisotropic Impedance", "Screening Impedance",
+    "Wave Port", "Lumped Port", "Floquet Port", "Terminal", "Voltage",
+    "Current", "Magnetic Bias", "Incident Wave", "Circuit Port",
+}
+
+log = get_logger("boundary")
+
+
+def _face_id(f):
+    try:
+        return int(f)
+    except (TypeError, ValueError):
+        return f
+
+
+class BoundaryRecord(object):
+    __slots__ = ("name", "type", "is_port", "faces", "objects", "props")
+
+    def __init__(self, name, type, faces=(), objects=(), props=None):
+        self.name    = name
+        self.type    = type or "Unknown"
+        self.is_port = "port" in self.type.lower()
+        self.faces   = tuple(_face_id(f) for f in faces or ())
+        self.objects = tuple(objects or ())
+        self.props   = props or {}
+
+    @property
+    def port_number(self):
+        return int(self.props.get("PortNum", 1) or 1)
+
+    def to_dict(self):
+        return {"name": self.name, "type": self.type, "props": self.props,
+                "faces": list(self.faces), "objects": list(self.objects)}
+
+
+class BoundaryTable(object):
+    """Ordered records split into boundaries and excitations."""
+
+    def __init__(self, records=()):
+        self.records = list(records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def boundaries(self):
+        return [r for r in self.records if not r.is_port]
+
+    @property
+    def excitations(self):
+        return [r for r in self.records if r.is_port]
+
+    def to_dump(self):
+        """→ (boundaries dict, excitations dict) in the extractor layout"""
+        bnd, exc = {}, {}
+        for r in self.records:
+            (exc if r.is_port else bnd)[r.name] = r.to_dict()
+        return bnd, exc
+
+    @classmethod
+    def from_dump(cls, dump):
+        recs = []
+        for section in ("boundaries", "excitations"):
+            for name, e in (dump.get(section) or {}).items():
+                recs.append(BoundaryRecord(e.get("name", name), e.get("type"),
+                                           e.get("faces"), e.get("objects"),
+                                           e.get("props")))
+        return cls(recs)
+
+
+# ───────── collectors ───────── #
+def collect_boundaries(hfss, keep=None):
+    """
+    PyAEDT: all boundaries + assignments + excitation props, one pass.
+    keep: (name, type) → bool, checked before the props are read
+    """
+    bmod, recs = hfss.boundaries, []
+    for b in bmod:
+        if keep is not None and not keep(b.name, b.type):
+            continue
+        props = dict(b.props) if b.props else {}
+        faces = props.get("Faces") or []
+        objects = props.get("Objects") or []
+        if not faces and not objects:
+            try:
+                faces = bmod.get_boundary_faces(b.name)
+            except Exception:
+                faces = []
+        recs.append(BoundaryRecord(b.name, b.type, faces, objects, props))
+    return BoundaryTable(recs)
+
+
+def split_name_type_pairs(flat):
+    """[n1, t1, n2, t2 …] → {name: type};  plain name lists → {name: None}
+
+    Split by position – an unknown type (newer release, "PML" …) is logged
+    and kept; only odd-length lists or lists without a single known type at
+    an odd position are taken as bare names.
+    """
+    flat = list(flat or [])
+    names, types = flat[0::2], flat[1::2]
+    if not flat or len(flat) % 2 or not any(t in KNOWN_TYPES for t in types):
+        return dict.fromkeys(flat)
+    unknown = sorted({str(t) for t in types if t not in KNOWN_TYPES})
+    if unknown:
+        log.warn("unknown boundary types (kept as reported): %s", ", ".join(unknown))
+    return dict(zip(names, types))
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS CAPABILITY PROBE – resolve version-dependent API paths once
+  • a capability ("variables", "object_names", …) is an ordered tuple of
+    (name, callable) strategies – the old try / except / hasattr chains
+  • bind() tries them once on a sample call, records the first that works
+    and returns it as a direct callable for the hot loop
+  • results are kept per AEDT version in memory and persisted to
+    ~/.hfss_extract_cache/capabilities.json, so later sessions bind
+    without probing at all
+  • a persisted path is tried once per session before it is trusted
+    (bind() on its sample, call() on the real arguments); one that fails is
+    dropped and the table re-probed
+
+Usage
+-----
+    probe = get_probe(hfss)
+    variables = probe.call("variables", VARIABLE_STRATEGIES, hfss)
+    names_of = probe.bind("object_names", OBJECT_NAME_STRATEGIES, mdl, handle)
+    for h in mdl.objects:
+        names = names_of(mdl, h)
+"""
+import os, json, threading
+
+from extract_cache import DEFAULT_ROOT
+
+DEFAULT_PATH = os.path.join(DEFAULT_ROOT, "capabilities.json")
+
+
+class CapabilityError(RuntimeError):
+    pass
+
+
+class CapabilityProbe(object):
+    """Resolved strategy names for one AEDT version."""
+
+    def __init__(self, version, path=DEFAULT_PATH):
+        self.version = str(version or "unknown")
+        self.path = path
+        self._lock = threading.Lock()
+        self.resolved = self._read().get(self.version, {})
+        self._verified = set()                        # worked in this session
+
+    def _read(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _persist(self):
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            merged = self._read()                     # keep other versions' entries
+            merged[self.version] = self.resolved
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(merged, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    def _probe(self, capability, strategies, args):
+        errors = []
+        for name, fn in strategies:
+            try:
+                result = fn(*args)
+            except Exception as e:
+                errors.append(f"{name}: {e}")
+                continue
+            with self._lock:
+                self.resolved[capability] = name
+                self._verified.add(capability)
+                self._persist()
+            return fn, result
+        raise CapabilityError(f"{capability}: no working API path "
+                              f"({'; '.join(errors)})")
+
+    def _drop(self, capability):
+        with self._lock:
+            self.resolved.pop(capability, None)
+            self._verified.discard(capability)
+
+    def bind(self, capability, strategies, *sample):
+        """
+        → the working strategy callable; a remembered one is tried once on
+        *sample* first and the table re-probed if it fails there
+        """
+        fn = dict(strategies).get(self.resolved.get(capability))
+        if fn is not None:
+            if capability in self._verified:
+                return fn
+            try:
+                fn(*sample)
+            except Exception:
+                self._drop(capability)
+            else:
+                self._verified.add(capability)
+                return fn
+        return self._probe(capability, strategies, sample)[0]
+
+    def call(self, capability, strategies, *args):
+        """resolve + call in one go; a stale path is re-probed once"""
+        fn = dict(strategies).get(self.resolved.get(capability))
+        if fn is not None:
+            try:
+                result = fn(*args)
+            except Exception:
+                self._drop(capability)
+            else:
+                self._verified.add(capability)
+                return result
+        return self._probe(capability, strategies, args)[1]
+
+
+# ───────── per-session probes ───────── #
+_PROBES = {}
+
+
+def aedt_version(app):
+    """version string of a PyAEDT app / Desktop or a COM oDesktop"""
+    for attr in ("aedt_version_id", "release"):
+        v = getattr(app, attr, None)
+        if isinstance(v, str) and v:
+            return v
+    desktop = getattr(app, "odesktop", None) or app
+    try:
+        return str(desktop.GetVersion())
+    except Exception:
+        return "unknown"
+
+
+def get_probe(app_or_version, path=DEFAULT_PATH):
+    """one CapabilityProbe per AEDT version and session"""
+    v = app_or_version if isinstance(app_or_version, str) else aedt_version(app_or_version)
+    probe = _PROBES.get((v, path))
+    if probe is None:
+        probe = _PROBES[(v, path)] = CapabilityProbe(v, path)
+    return probe
+
+
+# ───────── shared strategy tables ───────── #
+def _vars_attr(app):
+    return app.variable_manager.variables
+
+
+def _vars_props(app):
+    return app.variable_manager.properties
+
+
+def _vars_design(app):
+    return {n: app.odesign.GetVariableValue(n) for n in app.odesign.GetVariables()}
+
+
+VARIABLE_STRATEGIES = (("variable_manager.variables", _vars_attr),
+                       ("variable_manager.properties", _vars_props),
+                       ("oDesign.GetVariables", _vars_design))
+
+
+def _name_attr(mdl, handle):
+    return [handle.name]
+
+
+def _name_lookup(mdl, handle):
+    names = mdl.get_object_name(handle)
+    return [names] if isinstance(names, str) else list(names)
+
+
+OBJECT_NAME_STRATEGIES = (("handle.name", _name_attr), ("get_object_name", _name_lookup))
+
+
+# COM (oEditor) object enumeration – used by woohoo.py; model objects only,
+# so no GetMatchedObjectName("*") (it also returns groups / non-model items)
+def _com_groups(editor):
+    names = []
+    for group in ("Solids", "UnClassified"):
+        names.extend(editor.GetObjectsInGroup(group) or [])
+    if not names:
+        raise CapabilityError("no objects in Solids / UnClassified")
+    return names
+
+
+def _com_object_name(editor):
+    names = editor.GetObjectName()
+    return [names] if isinstance(names, str) else list(names)
+
+
+COM_OBJECT_LIST_STRATEGIES = (("GetObjectsInGroup", _com_groups),
+                              ("GetObjectName", _com_object_name))
+
+
+def _com_material_prop(editor, name):
+    return editor.GetPropertyValue("Attributes", "Material", name)
+
+
+def _com_material_get(editor, name):
+    return editor.GetMaterial(name)
+
+
+COM_MATERIAL_STRATEGIES = (("GetPropertyValue", _com_material_prop),
+                           ("GetMaterial", _com_material_get))
+
+
+# COM creation history of one object → ["CreateBox:1", "Move:1", …]
+def _com_history_children(editor, name):
+    return [str(c) for c in editor.GetChildObject(name).GetChildNames()]
+
+
+def _com_history_cmd_tab(editor, name):
+    for cmd in ("CreateBox", "CreateCylinder", "CreateSphere"):
+        try:
+            editor.GetProperties("Geometry3DCmdTab", f"{name}:{cmd}:1")
+            return [f"{cmd}:1"]
+        except Exception:
+            continue
+    return []
+
+
+COM_HISTORY_STRATEGIES = (("GetChildObject", _com_history_children),
+                          ("Geometry3DCmdTab", _com_history_cmd_tab))
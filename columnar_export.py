@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS COLUMNAR EXPORT – typed tables of a dump for pandas / pyarrow
+  <base>_objects.parquet     name, material, material_id (int32), primitive,
+                             x_min … z_max (float64), face_count (int32)
+  <base>_boundaries.parquet  name, type, is_port, port_number, face_count,
+                             object_count      (boundaries + excitations)
+  <base>_variables.parquet   name, value, number (float64), unit
+  • repeated strings (material, primitive, type, unit) are dictionary
+    encoded, so 100k-object tables stay small and filter fast
+  • accepts every dump layout in the repo (objects / objects_3d / solids,
+    bbox as list or as {x_min: …} dict)
+  • pyarrow is optional – without it the export is skipped with a notice
+
+    pd.read_parquet("…_objects.parquet").query("material == 'copper'")
+"""
+import re
+
+try:                                    # optional – columnar files
+    import pyarrow as _pa
+    import pyarrow.parquet as _pq
+except ImportError:                     # pragma: no cover
+    _pa = _pq = None
+
+_BBOX = ("x_min", "y_min", "z_min", "x_max", "y_max", "z_max")
+_NUM = re.compile(r"^\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*([A-Za-z_]*)\s*$")
+DICT_COLUMNS = {"material", "primitive", "type", "unit"}
+
+
+def _float(v):
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        m = _NUM.match(str(v)) if v is not None else None
+        return float(m.group(1)) if m else None
+
+
+def _int(v):
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return None
+
+
+def _bbox(e):
+    bb = e.get("bounding_box") or e.get("bbox") or []
+    if isinstance(bb, dict):
+        bb = [bb.get(k) for k in _BBOX]
+    bb = list(bb)[:6]
+    return [_float(v) for v in bb] + [None] * (6 - len(bb))
+
+
+# ───────── column builders (plain Python lists) ───────── #
+class ObjectColumns(object):
+    """
+    Objects table filled one (name, entry) pair at a time – usable as a
+    run_pipeline write sink, so the table needs no {name: entry} dict
+    """
+
+    def __init__(self):
+        self.cols = {k: [] for k in ("name", "material", "material_id", "primitive")
+                     + _BBOX + ("face_count",)}
+
+    def write(self, pair):
+        name, e = pair
+        if not isinstance(e, dict):
+            return
+        cols = self.cols
+        cols["name"].append(name)
+        cols["material"].append(str(e.get("material") or e.get("Material") or "Unknown"))
+        cols["material_id"].append(_int(e.get("material_id")))
+        cols["primitive"].append(str(e.get("primitive") or e.get("object_type") or "Unknown"))
+        for k, v in zip(_BBOX, _bbox(e)):
+            cols[k].append(v)
+        faces = e.get("faces")
+        cols["face_count"].append(len(faces) if isinstance(faces, (list, tuple)) else None)
+
+
+def object_columns(objects):
+    oc = ObjectColumns()
+    for pair in objects.items():
+        oc.write(pair)
+    return oc.cols
+
+
+def boundary_columns(boundaries, excitations):
+    cols = {k: [] for k in ("name", "type", "is_port", "port_number",
+                            "face_count", "object_count")}
+    for section, is_port in ((boundaries, False), (excitations, True)):
+        for name, e in (section or {}).items():
+            if not isinstance(e, dict):
+                continue
+            props = e.get("props") if isinstance(e.get("props"), dict) else {}
+            cols["name"].append(name)
+            cols["type"].append(str(e.get("type") or "Unknown"))
+            cols["is_port"].append(is_port)
+            pn = _float(props.get("PortNum")) if is_port else None
+            cols["port_number"].append(int(pn) if pn is not None else None)
+            cols["face_count"].append(len(e.get("faces") or props.get("Faces") or []))
+            cols["object_count"].append(len(e.get("objects") or props.get("Objects") or []))
+    return cols
+
+
+def variable_columns(variables):
+    cols = {"name": [], "value": [], "number": [], "unit": []}
+    for name, v in (variables or {}).items():
+        text = str(getattr(v, "expression", v))
+        m = _NUM.match(text)
+        cols["name"].append(name)
+        cols["value"].append(text)
+        cols["number"].append(float(m.group(1)) if m else None)
+        cols["unit"].append((m.group(2) or None) if m else None)
+    return cols
+
+
+# ───────── writers ───────── #
+_TYPES = {"material_id": "int32", "face_count": "int32", "object_count": "int32", "port_number": "int32",
+          "is_port": "bool", "number": "float64"}
+
+
+def _table(cols):
+    arrays, names = [], []
+    for k, v in cols.items():
+        if k in _BBOX or k in _TYPES:
+            arr = _pa.array(v, type=_pa.type_for_alias(_TYPES.get(k, "float64")))
+        else:
+            arr = _pa.array(v, type=_pa.string())
+            if k in DICT_COLUMNS:
+                arr = arr.dictionary_encode()
+        arrays.append(arr)
+        names.append(k)
+    return _pa.Table.from_arrays(arrays, names=names)
+
+
+def write_table(cols, path, compression="zstd"):
+    _pq.write_table(_table(cols), path, compression=compression, use_dictionary=True)
+    return path
+
+
+def export_tables(data, base, objects=None):
+    """
+    dump → {"objects" | "boundaries" | "variables": parquet path}
+    objects: ObjectColumns filled by the extraction pipeline – used when the
+             dump's objects section was spooled (data["objects"] = digests)
+    """
+    if _pa is None:
+        print("⚠ pyarrow not installed – columnar export skipped")
+        return {}
+    if objects is None:
+        objects = ObjectColumns()
+        for pair in (data.get("objects") or data.get("objects_3d")
+                     or data.get("solids") or {}).items():
+            objects.write(pair)
+    out = {
+        "objects": write_table(objects.cols, base + "_objects.parquet"),
+        "boundaries": write_table(boundary_columns(data.get("boundaries"),
+                                                   data.get("excitations")),
+                                  base + "_boundaries.parquet"),
+        "variables": write_table(variable_columns(data.get("variables")),
+                                 base + "_variables.parquet"),
+    }
+    for p in out.values():
+        print("TABLE →", p)
+    return out
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS COORDINATE SYSTEMS + MESH OPERATIONS – bulk collectors
+  • every API path that can list them is a strategy; the capability probe
+    (capabilities.py) resolves the working one once per AEDT version and
+    reuses it for every later design / session – no repeated hasattr /
+    try-except chains per call
+  • preferred strategies read PyAEDT's already-loaded objects
+    (modeler.coordinate_systems, mesh.meshoperations) → all entries in one
+    pass, zero extra COM calls; the name-by-name getters are fallbacks
+
+Usage
+-----
+    cs   = collect_coord_systems(hfss)      # {name: props}
+    mops = collect_mesh_ops(hfss)           # {name: props}
+"""
+from capabilities import get_probe, CapabilityError
+
+# ───────── coordinate systems ───────── #
+def _cs_objects(app):
+    return {cs.name: dict(cs.props or {}) for cs in app.modeler.coordinate_systems}
+
+
+def _cs_manager(app):
+    mdl = app.modeler
+    csm = getattr(mdl, "coordinate_system_manager", None) or mdl.CoordinateSystemManager
+    if hasattr(csm, "list_coordinate_systems"):
+        names, get = csm.list_coordinate_systems(), csm.get_coordinate_system
+    else:
+        names, get = csm.ListCoordinateSystems(), csm.GetCoordinateSystem
+    return {n: get(n) for n in names}
+
+
+def _cs_editor(app):
+    ed, out = app.modeler.oeditor, {}
+    for n in ed.GetCoordinateSystems():
+        out[n] = {p: ed.GetPropertyValue("Geometry3DCSTab", n, p)
+                  for p in ed.GetProperties("Geometry3DCSTab", n)}
+    return out
+
+
+CS_STRATEGIES = (("objects", _cs_objects), ("manager", _cs_manager),
+                 ("editor", _cs_editor))
+
+
+# ───────── mesh operations ───────── #
+def _mesh_objects(app):
+    return {m.name: dict(m.props or {}) for m in app.mesh.meshoperations}
+
+
+def _mesh_indexed(app):
+    mm = app.mesh
+    return {m: mm.meshoperations[m].props for m in mm.meshoperations}
+
+
+MESH_STRATEGIES = (("objects", _mesh_objects), ("indexed", _mesh_indexed))
+
+
+# ───────── collectors ───────── #
+def _collect(kind, strategies, app):
+    try:
+        return get_probe(app).call(kind, strategies, app)
+    except CapabilityError as e:
+        print(f"⚠ {e}")
+        return {}
+
+
+def collect_coord_systems(app):
+    """{cs name: props} through the resolved API path for this AEDT version"""
+    return _collect("coord_systems", CS_STRATEGIES, app)
+
+
+def collect_mesh_ops(app):
+    """{mesh-op name: props} through the resolved API path for this AEDT version"""
+    return _collect("mesh_ops", MESH_STRATEGIES, app)
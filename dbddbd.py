@@ -13,6 +13,8 @@ import os, json, csv
 from datetime import datetime
 from pyaedt import Desktop, Hfss
 
+from dump_digest import add_digests
+
 
 # ───── user tweakables ───── #
 PROJECT_PATH = None     # r"C:\path\project.aedt" or None
@@ -127,6 +129,7 @@ data = {
     "history": hfss.odesign.GetModelHistory()
 }
 data["boundaries"], data["excitations"] = boundary_and_ports()
+add_digests(data)                     # per-entry digest + per-section roots
 
 # ───────── save ───────── #
 base = f"HFSS_Extract_{hfss.project_name}_{hfss.design_name}_{ts}"
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS DESIGN MODEL – compact, array-backed objects section for rebuilders
+  • ObjectTable keeps one column per field instead of one dict per object:
+      names        list[str]  (sys.intern)
+      material / primitive    uint32 index → interned string pool
+      bbox         float64 [6·n]          (NaN = missing)
+      faces        int64 CSR  (offsets [n+1] + ids); an object with a
+                   non-numeric face ref keeps its raw list in odd_faces
+      color        int32 packed RGB       (-1 = none)
+      digest       16-byte blake2b slots in one bytearray
+    params / history stay Python objects, but empty ones are stored as None
+  • ObjectView (__slots__: table, index) has the ObjectRecord attributes,
+    so histr / together / verya iterate it unchanged
+  • load_design() streams the objects section with ijson when installed
+    (one entry alive at a time, no full dict tree ever built); without ijson the dump is
+    json.load()-ed and compacted right away – the dict tree is freed before
+    the rebuild starts
+  • other sections go through dump_schema (upgrade + validate) as before
+
+Usage
+-----
+    design = load_design("HFSS_Extract_….json")
+    for name, obj in design.objects.items():
+        print(name, obj.material, obj.bbox, len(obj.faces))
+"""
+import sys, json, math
+from array import array
+
+from dump_schema import Design, upgrade, validate, detect_version, upgrade_object
+
+try:                                    # optional – streaming parse
+    import ijson as _ijson
+except ImportError:                     # pragma: no cover
+    _ijson = None
+
+_BBOX = ("x_min", "y_min", "z_min", "x_max", "y_max", "z_max")
+_NAN = float("nan")
+_NO_DIGEST = bytes(16)
+
+
+def _num(v):
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return _NAN
+
+
+class _Pool(object):
+    """Interned string pool: str ↔ small int."""
+
+    def __init__(self):
+        self.strings, self._ix = [], {}
+
+    def add(self, s):
+        i = self._ix.get(s)
+        if i is None:
+            i = self._ix[s] = len(self.strings)
+            self.strings.append(sys.intern(s))
+        return i
+
+
+class ObjectView(object):
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table, self.index = table, index
+
+    @property
+    def name(self):
+        return self.table.names[self.index]
+
+    @property
+    def material(self):
+        return self.table.materials.strings[self.table.material[self.index]]
+
+    @property
+    def material_id(self):
+        return self.table.material_ids.get(self.index)
+
+    @property
+    def primitive(self):
+        return self.table.primitives.strings[self.table.primitive[self.index]]
+
+    @property
+    def bbox(self):
+        i = 6 * self.index
+        bb = self.table.bbox[i:i + 6]
+        return () if all(math.isnan(v) for v in bb) else tuple(bb)
+
+    @property
+    def faces(self):
+        t = self.table
+        odd = t.odd_faces.get(self.index)
+        if odd is not None:
+            return odd
+        return tuple(t.face_ids[t.face_off[self.index]:t.face_off[self.index + 1]])
+
+    @property
+    def color(self):
+        c = self.table.color[self.index]
+        if c < 0:
+            return self.table.odd_colors.get(self.index)
+        return ((c >> 16) & 255, (c >> 8) & 255, c & 255)
+
+    @property
+    def params(self):
+        return self.table.params[self.index] or {}
+
+    @property
+    def history(self):
+        return self.table.history[self.index]
+
+    @property
+    def digest(self):
+        i = 16 * self.index
+        d = bytes(self.table.digests[i:i + 16])
+        return None if d == _NO_DIGEST else d.hex()
+
+
+class ObjectTable(object):
+    """Column store of the objects section; reads like {name: ObjectView}."""
+
+    def __init__(self):
+        self.names, self._ix = [], {}
+        self.materials, self.primitives = _Pool(), _Pool()
+        self.material  = array("I")
+        self.primitive = array("I")
+        self.material_ids = {}          # index → id (only objects that have one)
+        self.bbox      = array("d")
+        self.face_off  = array("q", [0])
+        self.face_ids  = array("q")
+        self.odd_faces = {}             # index → raw face list with non-numeric refs
+        self.color     = array("i")
+        self.odd_colors = {}            # index → colour that is not an RGB triple
+        self.digests   = bytearray()
+        self.params, self.history = [], []
+
+    def append(self, name, e):
+        i = len(self.names)
+        name = sys.intern(name)
+        self.names.append(name)
+        self._ix[name] = i
+        self.material.append(self.materials.add(str(e.get("material") or "Unknown")))
+        self.primitive.append(self.primitives.add(str(e.get("primitive") or "Unknown")))
+        if e.get("material_id") is not None:
+            self.material_ids[i] = e["material_id"]
+        bb = e.get("bounding_box") or ()
+        if isinstance(bb, dict):
+            bb = [bb.get(k) for k in _BBOX]
+        bb = [_num(v) for v in list(bb)[:6]]
+        self.bbox.extend(bb + [_NAN] * (6 - len(bb)))
+        faces = list(e.get("faces") or ())
+        try:
+            self.face_ids.extend(int(f) for f in faces)
+        except (TypeError, ValueError):
+            del self.face_ids[self.face_off[-1]:]
+            self.odd_faces[i] = tuple(faces)      # kept as-is, like odd_colors
+        self.face_off.append(len(self.face_ids))
+        c = e.get("color")
+        try:
+            r, g, b = (int(x) for x in c)
+            self.color.append((r & 255) << 16 | (g & 255) << 8 | (b & 255))
+        except (TypeError, ValueError):
+            self.color.append(-1)
+            if c is not None:
+                self.odd_colors[i] = tuple(c) if isinstance(c, list) else c
+        d = e.get("digest")
+        try:
+            self.digests += bytes.fromhex(d) if d and len(d) == 32 else _NO_DIGEST
+        except ValueError:
+            self.digests += _NO_DIGEST
+        self.params.append(e.get("params") or None)
+        self.history.append(e.get("history") or None)
+
+    # -- mapping interface ------------------------------------------------ #
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __contains__(self, name):
+        return name in self._ix
+
+    def __getitem__(self, name):
+        return ObjectView(self, self._ix[name])
+
+    def get(self, name, default=None):
+        i = self._ix.get(name)
+        return default if i is None else ObjectView(self, i)
+
+    def keys(self):
+        return list(self.names)
+
+    def values(self):
+        return (ObjectView(self, i) for i in range(len(self.names)))
+
+    def items(self):
+        return ((n, ObjectView(self, i)) for i, n in enumerate(self.names))
+
+    @classmethod
+    def from_dict(cls, objects):
+        t = cls()
+        for name, e in objects.items():
+            if isinstance(e, dict):
+                t.append(name, e)
+        return t
+
+
+# ───────── streaming load ───────── #
+_START, _END = ("start_map", "start_array"), ("end_map", "end_array")
+
+
+def _value(events, event, value):
+    """rebuild one JSON value from ijson events (scalars pass through)"""
+    if event not in _START:
+        return value
+    b = _ijson.common.ObjectBuilder()
+    b.event(event, value)
+    depth = 1
+    for _, ev, val in events:
+        b.event(ev, val)
+        if ev in _START:
+            depth += 1
+        elif ev in _END:
+            depth -= 1
+            if depth == 0:
+                return b.value
+
+
+def _skip(events):
+    """consume the rest of a map / array whose start event was just read"""
+    depth = 1
+    for _, ev, _ in events:
+        if ev in _START:
+            depth += 1
+        elif ev in _END:
+            depth -= 1
+            if depth == 0:
+                return
+
+
+def _stream(f, check=True):
+    """
+    → (top-level dict without "objects", ObjectTable or None)
+    pass 1: small sections via events, the objects map is only skipped
+    pass 2: ijson.kvitems(…, "objects") – entries built in C, one at a time
+    """
+    events = _ijson.parse(f, use_float=True)
+    top, has_objects = {}, False
+    for prefix, event, value in events:
+        if prefix != "" or event != "map_key":
+            continue
+        key = value
+        _, event, value = next(events)
+        if key == "objects" and event == "start_map":
+            has_objects = True
+            _skip(events)
+        else:
+            top[key] = _value(events, event, value)
+    if not has_objects:
+        return top, None
+    f.seek(0)
+    v1 = detect_version(top) == 1              # entries upgraded like upgrade() would
+    table = ObjectTable()
+    for name, entry in _ijson.kvitems(f, "objects", use_float=True):
+        if v1:
+            upgrade_object(entry)
+        if check:                              # same compiled checker, per entry
+            validate({"objects": {name: entry}}, strict=True)
+        table.append(name, entry)
+    return top, table
+
+
+def load_design(path, check=True):
+    """dump file → dump_schema.Design whose .objects is an ObjectTable"""
+    with open(path, "rb") as f:
+        if _ijson is not None:
+            top, table = _stream(f, check)
+        else:
+            top, table = json.load(f), None
+    if table is None:                          # other layouts / no ijson
+        top = upgrade(top)
+        if check:
+            validate(top, strict=True)
+        table = ObjectTable.from_dict(top.pop("objects", None) or {})
+    else:
+        top["objects"] = {}                    # streamed – keep upgrade happy
+        top = upgrade(top)
+        if check:
+            validate(top, strict=True)
+    return Design(top, objects=table)
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS DUMP DIFF – verify a rebuild against its source
+Compares two extractor JSONs (source vs. re-extracted rebuild):
+  • object sets, material, primitive, params
+  • bounding boxes within a length tolerance, face counts
+  • boundaries / excitations (type, face count, props)
+  • analysis setups and sweeps (grid-compressed sweeps expanded first)
+Sections whose Merkle roots (dump_digest.py) agree are skipped outright;
+entries with equal stored digests are identical.  Otherwise every object
+gets a geometry digest (face IDs and history excluded, bbox snapped to the
+tolerance grid, lengths in the source's model units) – equal digests are skipped in O(1), only mismatches are
+examined field by field.
+
+Examples
+--------
+  python dump_diff.py source.json rebuilt.json
+  python dump_diff.py source.json rebuilt.json --tol 1e-4 --json diff.json
+"""
+import re, sys, json, argparse
+
+from dump_digest import canonical, digest as _digest
+from freq_grid import expand_props
+
+_NUM = re.compile(r"([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*([a-zA-Zµ]*)")
+# length units AEDT writes (→ metres)
+_LEN = {"m": 1.0, "meter": 1.0, "cm": 1e-2, "mm": 1e-3, "um": 1e-6, "µm": 1e-6,
+        "nm": 1e-9, "in": 0.0254, "mil": 2.54e-5, "uin": 2.54e-8, "ft": 0.3048}
+_BBOX_KEYS = ("x_min", "y_min", "z_min", "x_max", "y_max", "z_max")
+# props that only carry design-local IDs – never comparable across a rebuild
+_ID_PROPS = {"Faces", "Objects", "ID", "Edges", "Vertices"}
+
+
+# ───────── normalisation ───────── #
+def bbox6(bb, units="mm", model_units=None):
+    """[xmin, ymin, zmin, xmax, ymax, zmax] as floats in *units*, or None
+
+    "2.5mm" / "0.1in" are converted by their suffix; bare numbers are in
+    *model_units* (kept as they are when that is unknown).
+    """
+    if isinstance(bb, dict):
+        bb = [bb.get(k) for k in _BBOX_KEYS]
+    if not bb or len(bb) < 6:
+        return None
+    to = _LEN.get(str(units).lower(), 1.0)
+    bare = _LEN[model_units.lower()] / to if str(model_units).lower() in _LEN else 1.0
+    out = []
+    for v in bb[:6]:
+        if isinstance(v, (int, float)):
+            out.append(float(v) * bare)
+            continue
+        m = _NUM.search(str(v))
+        if not m:
+            return None
+        unit = m.group(2).lower()
+        out.append(float(m.group(1)) * (_LEN[unit] / to if unit in _LEN else bare))
+    return out
+
+
+def model_units(dump):
+    """length unit of a dump's bare numbers ("mm" …), or None"""
+    meta = dump.get("meta") if isinstance(dump.get("meta"), dict) else {}
+    return meta.get("model_units") or dump.get("model_units")
+
+
+def _section(dump, *keys):
+    for k in keys:
+        if isinstance(dump.get(k), dict):
+            return dump[k]
+    return {}
+
+
+def _face_count(entry):
+    faces = entry.get("faces") or []
+    return len(faces) if isinstance(faces, (list, tuple)) else 0
+
+
+def _clean_props(props):
+    if not isinstance(props, dict):
+        return props
+    return {k: v for k, v in props.items() if k not in _ID_PROPS}
+
+
+def geo_digest(obj, tol):
+    bb = bbox6(obj.get("bounding_box"))
+    grid = [round(v / tol) for v in bb] if bb and tol > 0 else bb
+    return _digest([str(obj.get("material", "")).lower(), obj.get("primitive"),
+                    obj.get("params") or {}, grid, _face_count(obj)])
+
+
+def bnd_digest(entry):
+    return _digest([entry.get("type"), _face_count(entry),
+                    _clean_props(entry.get("props"))])
+
+
+# ───────── detailed comparison (mismatches only) ───────── #
+def _cmp_object(a, b, tol):
+    diffs = {}
+    ma, mb = str(a.get("material", "")), str(b.get("material", ""))
+    if ma.lower() != mb.lower():
+        diffs["material"] = [ma, mb]
+    if a.get("primitive") != b.get("primitive"):
+        diffs["primitive"] = [a.get("primitive"), b.get("primitive")]
+    fa, fb = _face_count(a), _face_count(b)
+    if fa != fb:
+        diffs["face_count"] = [fa, fb]
+    ba, bb = bbox6(a.get("bounding_box")), bbox6(b.get("bounding_box"))
+    if (ba is None) != (bb is None):
+        diffs["bounding_box"] = [ba, bb]
+    elif ba is not None:
+        dev = max(abs(x - y) for x, y in zip(ba, bb))
+        if dev > tol:
+            diffs["bounding_box"] = {"source": ba, "rebuilt": bb, "max_dev": dev}
+    pa, pb = a.get("params") or {}, b.get("params") or {}
+    if pa != pb:
+        keys = sorted(set(pa) | set(pb))
+        diffs["params"] = {k: [pa.get(k), pb.get(k)]
+                           for k in keys if pa.get(k) != pb.get(k)}
+    return diffs
+
+
+def _cmp_boundary(a, b):
+    diffs = {}
+    if a.get("type") != b.get("type"):
+        diffs["type"] = [a.get("type"), b.get("type")]
+    fa, fb = _face_count(a), _face_count(b)
+    if fa != fb:
+        diffs["face_count"] = [fa, fb]
+    pa, pb = _clean_props(a.get("props")) or {}, _clean_props(b.get("props")) or {}
+    if pa != pb:
+        keys = sorted(set(pa) | set(pb))
+        diffs["props"] = {k: [pa.get(k), pb.get(k)]
+                          for k in keys if pa.get(k) != pb.get(k)}
+    return diffs
+
+
+def _diff_section(src, dst, digest, compare):
+    only_src = sorted(set(src) - set(dst))
+    only_dst = sorted(set(dst) - set(src))
+    changed, same = {}, 0
+    for name in src.keys() & dst.keys():
+        a, b = src[name], dst[name]
+        if not (isinstance(a, dict) and isinstance(b, dict)):
+            if canonical(a) == canonical(b):
+                same += 1
+            else:
+                changed[name] = {"value": [a, b]}
+            continue
+        stored = a.get("digest")
+        if (stored is not None and stored == b.get("digest")) or digest(a) == digest(b):
+            same += 1
+            continue
+        d = compare(a, b)
+        if d:
+            changed[name] = d
+        else:
+            same += 1                   # digest differed only by tolerance snap
+    return {"identical": same, "only_in_source": only_src,
+            "only_in_rebuilt": only_dst, "changed": dict(sorted(changed.items()))}
+
+
+def _cmp_setup(a, b):
+    diffs = {}
+    if canonical(a.get("props")) != canonical(b.get("props")):
+        pa, pb = a.get("props") or {}, b.get("props") or {}
+        diffs["props"] = {k: [pa.get(k), pb.get(k)]
+                          for k in sorted(set(pa) | set(pb)) if pa.get(k) != pb.get(k)}
+    sa, sb = a.get("sweeps") or {}, b.get("sweeps") or {}
+    if set(sa) != set(sb):
+        diffs["sweep_names"] = [sorted(sa), sorted(sb)]
+    bad = [n for n in set(sa) & set(sb) if canonical(sa[n]) != canonical(sb[n])]
+    if bad:
+        diffs["sweeps_changed"] = sorted(bad)
+    return diffs
+
+
+# ───────── public API ───────── #
+def diff_dumps(src, dst, tol=1e-6):
+    """Structural + geometric diff of two loaded dumps → report dict."""
+    roots_a, roots_b = src.get("digests") or {}, dst.get("digests") or {}
+    units = model_units(src) or model_units(dst) or "mm"
+
+    def in_units(objects, dump):
+        mu = model_units(dump)
+        return {n: dict(o, bounding_box=bbox6(o.get("bounding_box"), units, mu))
+                   if isinstance(o, dict) else o for n, o in objects.items()}
+
+    def expanded(setups, dump):
+        return {n: expand_props(s) for n, s in setups.items()}
+
+    def section(name, keys, digest, compare, prep=None):
+        a, b = _section(src, *keys), _section(dst, *keys)
+        if roots_a.get(name) is not None and roots_a.get(name) == roots_b.get(name):
+            return {"identical": len(a), "only_in_source": [],
+                    "only_in_rebuilt": [], "changed": {}}
+        if prep is not None:
+            a, b = prep(a, src), prep(b, dst)
+        return _diff_section(a, b, digest, compare)
+
+    report = {
+        "objects": section("objects", ("objects", "solids", "objects_3d"),
+                           lambda o: geo_digest(o, tol),
+                           lambda a, b: _cmp_object(a, b, tol), in_units),
+        "boundaries": section("boundaries", ("boundaries",),
+                              bnd_digest, _cmp_boundary),
+        "excitations": section("excitations", ("excitations",),
+                               bnd_digest, _cmp_boundary),
+        "analysis_setups": section("analysis_setups", ("analysis_setups", "setups"),
+                                   _digest, _cmp_setup, expanded),
+    }
+    ma = {str(m).lower() for m in (src.get("materials") or [])}
+    mb = {str(m).lower() for m in (dst.get("materials") or [])}
+    report["materials"] = {"only_in_source": sorted(ma - mb),
+                           "only_in_rebuilt": sorted(mb - ma)}
+    report["match"] = not any(
+        s.get("only_in_source") or s.get("only_in_rebuilt") or s.get("changed")
+        for s in report.values() if isinstance(s, dict))
+    return report
+
+
+def print_report(report):
+    for sec in ("objects", "boundaries", "excitations", "analysis_setups"):
+        r = report[sec]
+        print(f"{sec:16s} identical {r['identical']:6d}   changed {len(r['changed']):5d}"
+              f"   missing {len(r['only_in_source']):5d}   extra {len(r['only_in_rebuilt']):5d}")
+        for name, d in list(r["changed"].items())[:10]:
+            print(f"    ≠ {name}: {', '.join(d)}")
+        for name in r["only_in_source"][:10]:
+            print(f"    − {name}")
+    m = report["materials"]
+    if m["only_in_source"] or m["only_in_rebuilt"]:
+        print("materials        missing", m["only_in_source"], " extra", m["only_in_rebuilt"])
+    print("✅  Rebuild matches source." if report["match"]
+          else "❌  Rebuild differs from source.")
+
+
+def main():
+    cli = argparse.ArgumentParser(description="Diff source vs rebuilt HFSS dump")
+    cli.add_argument("source"), cli.add_argument("rebuilt")
+    cli.add_argument("--tol", type=float, default=1e-6, help="bbox tolerance (source model units)")
+    cli.add_argument("--json", help="write the full report here")
+    args = cli.parse_args()
+
+    with open(args.source, "r", encoding="utf-8") as f:
+        src = json.load(f)
+    with open(args.rebuilt, "r", encoding="utf-8") as f:
+        dst = json.load(f)
+    report = diff_dumps(src, dst, args.tol)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+        print("JSON  →", args.json)
+    sys.exit(0 if report["match"] else 1)
+
+
+if __name__ == "__main__":
+    main()
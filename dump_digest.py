@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS DUMP DIGESTS – content-addressed entries for every extractor dump
+  • canonical JSON encoding (sorted keys, no whitespace) → stable bytes
+  • per-entry "digest" over the fields that define it
+      objects      : material, primitive, params, bounding_box, faces, history
+      boundaries   : type, props, faces         (same for excitations)
+      setups       : props, sweeps
+  • dump["digests"][section] = Merkle root over (name, digest) pairs
+Two dumps (or two entries) are unchanged iff their digests are equal, so
+diffing, caching and incremental extraction need one compare, not a walk.
+"""
+import json, hashlib
+
+DIGEST_FIELDS = {
+    "objects"        : ("material", "primitive", "params", "bounding_box",
+                        "faces", "history"),
+    "boundaries"     : ("type", "props", "faces"),
+    "excitations"    : ("type", "props", "faces"),
+    "analysis_setups": ("props", "sweeps"),
+}
+_EMPTY = hashlib.blake2b(b"", digest_size=16).hexdigest()
+
+
+def canonical(value):
+    """Stable UTF-8 encoding of any JSON-able value."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"),
+                      ensure_ascii=False, default=str).encode("utf-8")
+
+
+def digest(value):
+    return hashlib.blake2b(canonical(value), digest_size=16).hexdigest()
+
+
+def entry_digest(entry, fields):
+    return digest([entry.get(f) for f in fields])
+
+
+def merkle_root(digests):
+    """digests: {name: hex} → root hex (order independent, name bound)."""
+    level = [hashlib.blake2b(f"{n}\x00{d}".encode("utf-8"), digest_size=16).digest()
+             for n, d in sorted(digests.items())]
+    if not level:
+        return _EMPTY
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [hashlib.blake2b(level[i] + level[i + 1], digest_size=16).digest()
+                 for i in range(0, len(level), 2)]
+    return level[0].hex()
+
+
+def add_digests(data, fields=DIGEST_FIELDS):
+    """Stamp every entry of the known sections + the per-section roots."""
+    roots = {}
+    for section, keys in fields.items():
+        entries = data.get(section)
+        if not isinstance(entries, dict):
+            continue
+        for e in entries.values():
+            if isinstance(e, dict):
+                e["digest"] = entry_digest(e, keys)
+        roots[section] = merkle_root({n: e["digest"] for n, e in entries.items()
+                                      if isinstance(e, dict)})
+    data["digests"] = roots
+    return roots
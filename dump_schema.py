@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS DUMP SCHEMA – one versioned layout for every extractor's JSON
+  • SCHEMA_VERSION 2 = the united.py layout + meta["schema"]; bounding boxes
+    are always [x0, y0, z0, x1, y1, z1] lists, setups always {props, sweeps}
+  • older layouts are upgraded by a chain of converters:
+        "woohoo" (metadata / objects_3d)  ─┐
+        "verga"  (solids / setups)        ─┴→ 1 (united, unversioned) → 2
+    hfss_extractor_pyaedt dumps are v1 with a top-level "setups" – the 1 → 2
+    step moves it to "analysis_setups"
+  • validate(): the spec is compiled once into per-section checkers, a
+    dump is then checked in a single pass and all problems are listed
+  • load_dump() → Design – __slots__ records (ObjectRecord, SetupRecord,
+    boundary_table.BoundaryRecord) instead of nested dicts; setups come
+    with their frequency grids already expanded
+
+Usage
+-----
+    design = load_dump("HFSS_Extract_….json")       # any layout
+    for rec in design.objects.values():
+        print(rec.name, rec.material, rec.bbox)
+    upgrade(json.load(f))                          # dict → current layout
+"""
+import json
+
+from boundary_table import BoundaryTable
+from freq_grid import expand_props
+
+SCHEMA_VERSION = 2
+_BBOX = ("x_min", "y_min", "z_min", "x_max", "y_max", "z_max")
+
+
+class SchemaError(ValueError):
+    """Raised by validate(strict=True) / load_dump(); .errors lists them all."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        more = f" (+{len(self.errors) - 10} more)" if len(self.errors) > 10 else ""
+        super().__init__("invalid dump:\n  " + "\n  ".join(self.errors[:10]) + more)
+
+
+# ───────── version detection + upgrade chain ───────── #
+def detect_version(dump):
+    meta = dump.get("meta")
+    if isinstance(meta, dict) and "schema" in meta:
+        return meta["schema"]
+    if "objects_3d" in dump or "metadata" in dump:
+        return "woohoo"
+    if "solids" in dump:
+        return "verga"
+    return 1
+
+
+def _bbox_list(bb):
+    if isinstance(bb, dict):
+        return [bb.get(k) for k in _BBOX]
+    return list(bb or [])
+
+
+def _from_woohoo(dump):
+    md = dump.get("metadata") or {}
+    objects = {}
+    for name, o in (dump.get("objects_3d") or {}).items():
+        objects[name] = {"material": o.get("Material") or o.get("material") or "Unknown",
+                         "color": o.get("color"), "primitive": o.get("primitive", "Unknown"),
+                         "params": o.get("params") or {}, "faces": o.get("faces") or [],
+                         "bounding_box": o.get("bounding_box") or [],
+                         "history": o.get("history")}
+    setups = {n: {"props": s.get("properties") or s.get("props") or {},
+                  "sweeps": s.get("sweeps") or {}}
+              for n, s in (dump.get("analysis_setups") or {}).items()}
+    out = {"meta": {"timestamp": md.get("extraction_time"), "project": md.get("project_name"),
+                    "design": md.get("design_name"), "aedt_version": md.get("hfss_version")},
+           "variables": dump.get("variables") or {}, "materials": dump.get("materials") or {},
+           "objects": objects, "analysis_setups": setups,
+           "boundaries": dump.get("boundaries") or {},
+           "excitations": dump.get("excitations") or {}}
+    return out, 1
+
+
+def _from_verga(dump):
+    objects = {}
+    for name, o in (dump.get("solids") or {}).items():
+        h = o.get("history")
+        objects[name] = {"material": o.get("material") or "Unknown",
+                         "material_id": o.get("material_id"),
+                         "primitive": o.get("type") or "Unknown", "params": {},
+                         "faces": [], "bounding_box": [],
+                         "history": "\n".join(h) if isinstance(h, list) else h}
+    out = {"meta": {"timestamp": dump.get("time_stamp"), "project": dump.get("project_name"),
+                    "design": dump.get("design_name")},
+           "variables": dump.get("variables") or {}, "materials": dump.get("materials") or {},
+           "objects": objects, "analysis_setups": dump.get("setups") or {},
+           "boundaries": dump.get("boundaries") or {}}
+    return out, 1
+
+
+def upgrade_object(entry):
+    """v1 → v2 for one objects entry (also used by the streaming loader)"""
+    if isinstance(entry, dict):
+        entry["bounding_box"] = _bbox_list(entry.get("bounding_box"))
+    return entry
+
+
+def _v1_to_v2(dump):
+    out = dict(dump)
+    out["meta"] = dict(dump.get("meta") or {}, schema=2)
+    if "setups" in out:                             # hfss_extractor_pyaedt layout
+        if out.get("analysis_setups"):
+            raise SchemaError(["dump has both 'setups' and 'analysis_setups'"])
+        out["analysis_setups"] = out.pop("setups")
+    for key in ("variables", "materials", "objects", "analysis_setups", "coord_systems",
+                "mesh_ops", "boundaries", "excitations"):
+        out.setdefault(key, {})
+    for o in out["objects"].values():
+        upgrade_object(o)
+    for s in out["analysis_setups"].values():
+        if isinstance(s, dict):
+            s.setdefault("props", {})
+            s.setdefault("sweeps", {})
+    return out, 2
+
+
+UPGRADES = {"woohoo": _from_woohoo, "verga": _from_verga, 1: _v1_to_v2}
+
+
+def upgrade(dump):
+    """any known layout → SCHEMA_VERSION (the input dict may be reused)"""
+    v = detect_version(dump)
+    while v != SCHEMA_VERSION:
+        step = UPGRADES.get(v)
+        if step is None:
+            raise SchemaError([f"no upgrade path from schema {v!r}"])
+        dump, v = step(dump)
+    return dump
+
+
+# ───────── compiled validator ───────── #
+_STR = (str,)
+
+# section → (section type, {field: (types, required)} for each entry | None)
+SPEC = {
+    "meta": (dict, None),
+    "variables": (dict, None),
+    "materials": (dict, None),
+    "objects": (dict, {"material": (_STR + (type(None),), True),
+                       "primitive": (_STR, False), "params": ((dict,), False),
+                       "faces": ((list,), False), "bounding_box": ((list,), True),
+                       "color": ((list, type(None)) + _STR, False),
+                       "history": ((str, list, type(None)), False),
+                       "digest": (_STR, False)}),
+    "boundaries": (dict, {"type": (_STR, False), "props": ((dict,), False),
+                          "faces": ((list,), False)}),
+    "excitations": (dict, {"type": (_STR, False), "props": ((dict,), False),
+                           "faces": ((list,), False)}),
+    "analysis_setups": (dict, {"props": ((dict,), True), "sweeps": ((dict,), True)}),
+    "coord_systems": (dict, None),
+    "mesh_ops": (dict, None),
+    "history": ((str, list, type(None)), None),
+}
+
+
+def compile_schema(spec=SPEC):
+    """spec → validate(dump) -> [error, …]; the per-field tuples are built once"""
+    checks = []
+    for section, (kind, fields) in spec.items():
+        fields = tuple((f, t, req) for f, (t, req) in (fields or {}).items())
+        required = tuple(f for f, _, req in fields if req)
+        checks.append((section, kind, fields, required))
+
+    def validate(dump, max_errors=200):
+        errors = []
+        if not isinstance(dump, dict):
+            return ["dump: expected an object"]
+        for section, kind, fields, required in checks:
+            if section not in dump:
+                continue
+            value = dump[section]
+            if not isinstance(value, kind):
+                errors.append(f"{section}: expected {getattr(kind, '__name__', kind)}, "
+                              f"got {type(value).__name__}")
+                continue
+            if not fields:
+                continue
+            for name, e in value.items():
+                if not isinstance(e, dict):
+                    errors.append(f"{section}.{name}: expected object")
+                    continue
+                for f in required:
+                    if f not in e:
+                        errors.append(f"{section}.{name}: missing {f}")
+                for f, types, _ in fields:
+                    v = e.get(f)
+                    if v is not None and not isinstance(v, types):
+                        errors.append(f"{section}.{name}.{f}: {type(v).__name__}")
+                if len(errors) >= max_errors:
+                    return errors
+        return errors
+
+    return validate
+
+
+validate_dump = compile_schema()
+
+
+def validate(dump, strict=False):
+    errors = validate_dump(dump)
+    if errors and strict:
+        raise SchemaError(errors)
+    return errors
+
+
+# ───────── typed records ───────── #
+class ObjectRecord(object):
+    __slots__ = ("name", "material", "material_id", "color", "primitive", "params",
+                 "faces", "bbox", "history", "digest")
+
+    def __init__(self, name, e):
+        self.name        = name
+        self.material    = e.get("material") or "Unknown"
+        self.material_id = e.get("material_id")
+        color            = e.get("color")
+        self.color       = tuple(color) if isinstance(color, list) else color
+        self.primitive   = e.get("primitive") or "Unknown"
+        self.params      = e.get("params") or {}
+        self.faces       = tuple(e.get("faces") or ())
+        self.bbox        = tuple(e.get("bounding_box") or ())
+        self.history     = e.get("history")
+        self.digest      = e.get("digest")
+
+
+class SetupRecord(object):
+    __slots__ = ("name", "props", "sweeps")
+
+    def __init__(self, name, s):
+        s = expand_props(s)                         # frequency grids → plain lists
+        self.name   = name
+        self.props  = s.get("props") or {}
+        self.sweeps = s.get("sweeps") or {}
+
+
+class Design(object):
+    """A loaded dump: typed records for the hot sections, plain dicts elsewhere."""
+    __slots__ = ("meta", "variables", "materials", "material_library", "objects",
+                 "boundaries", "setups", "coord_systems", "mesh_ops", "history",
+                 "face_geometry", "extra")
+
+    def __init__(self, dump, objects=None):
+        """objects: a prebuilt {name: record}-like mapping (design_model.ObjectTable)"""
+        self.meta             = dump.get("meta") or {}
+        self.variables        = dump.get("variables") or {}
+        self.materials        = dump.get("materials") or {}
+        self.material_library = dump.get("material_library") or {}
+        self.objects          = objects if objects is not None else \
+            {n: ObjectRecord(n, e) for n, e in (dump.get("objects") or {}).items()}
+        self.boundaries       = BoundaryTable.from_dump(dump)
+        self.setups           = {n: SetupRecord(n, s)
+                                 for n, s in (dump.get("analysis_setups") or {}).items()}
+        self.coord_systems    = dump.get("coord_systems") or {}
+        self.mesh_ops         = dump.get("mesh_ops") or {}
+        self.history          = dump.get("history")
+        self.face_geometry    = dump.get("face_geometry")
+        known = set(self.__slots__) | {"analysis_setups", "excitations"}
+        self.extra            = {k: v for k, v in dump.items() if k not in known}
+
+    @property
+    def schema(self):
+        return self.meta.get("schema", SCHEMA_VERSION)
+
+
+def load_dump(path_or_dump, check=True):
+    """path / dict in any known layout → upgraded, validated Design"""
+    if isinstance(path_or_dump, dict):
+        dump = path_or_dump
+    else:
+        with open(path_or_dump, "r", encoding="utf-8") as f:
+            dump = json.load(f)
+    dump = upgrade(dump)
+    if check:
+        validate(dump, strict=True)
+    return Design(dump)
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS EXTRACTION CACHE – serve unchanged designs without touching AEDT
+Key   = project path + file mtime/size + content hash + design name
+        + producer (the extractor / dump layout – alv, sss and
+        hfss_extractor_pyaedt share one root but not their entries)
+Entry = one JSON file per section (variables, objects, boundaries …)
+  • index.json keeps size + last-use per entry → LRU eviction by total size
+  • several extractors may share one root: index updates, directory renames
+    and eviction run under index.lock, and each process merges only the
+    entries it touched into the index re-read from disk – no lost LRU
+    entries, no eviction of files another process has just written
+  • the content hash is only recomputed when mtime/size change
+    (memoised in the index), so a cache hit costs a stat() + a file read
+  • writes are atomic (tmp file + os.replace); a whole dump is written into
+    a temp folder, marked complete last and renamed into place – load() only
+    serves entries that carry the marker
+  • a dump larger than max_bytes is refused before anything is written
+
+Usage
+-----
+    cache = ExtractionCache()                      # ~/.hfss_extract_cache
+    key   = cache.key(PROJECT_PATH, DESIGN_NAME, "alv")
+    data  = cache.load(key)                        # None → extract, then
+    cache.store(key, data)
+"""
+import os, json, time, shutil, hashlib, threading
+from contextlib import contextmanager
+
+DEFAULT_ROOT = os.path.join(os.path.expanduser("~"), ".hfss_extract_cache")
+DEFAULT_MAX_BYTES = 2 << 30             # 2 GB
+_CHUNK = 1 << 20
+COMPLETE = "_complete.json"             # written last by store()
+LOCK_STALE = 60.0                       # s – lock file of a crashed process
+_RANK = {"touch": 0, "merge": 1, "replace": 2}    # unsaved change per entry
+
+
+def _atomic_write(path, text):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+@contextmanager
+def _file_lock(path, timeout=120.0):
+    """O_EXCL lock file – works across processes on Windows and POSIX"""
+    t0 = time.time()
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(path) > LOCK_STALE:
+                    os.remove(path)
+                    continue
+            except OSError:
+                continue
+            if time.time() - t0 > timeout:
+                raise TimeoutError(f"cache index locked: {path}")
+            time.sleep(0.02)
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        yield
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def file_hash(path):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ExtractionCache(object):
+    """On-disk, size-bounded, per-section cache of extractor dumps."""
+
+    def __init__(self, root=DEFAULT_ROOT, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.RLock()
+        os.makedirs(root, exist_ok=True)
+        self._index_path = os.path.join(root, "index.json")
+        self._lock_path = os.path.join(root, "index.lock")
+        self._dirty = {}                # key → "touch" | "merge" | "replace"
+        self._dirty_files = set()
+        self._index = self._read_index()
+
+    # ───────── keys ───────── #
+    def fingerprint(self, project_path):
+        """path + mtime + size + content hash (hash memoised per mtime/size)"""
+        path = os.path.normcase(os.path.abspath(project_path))
+        st = os.stat(path)
+        memo = self._index["files"].get(path)
+        if memo and memo["mtime"] == st.st_mtime_ns and memo["size"] == st.st_size:
+            h = memo["hash"]
+        else:
+            h = file_hash(path)
+            with self._lock:
+                self._index["files"][path] = {"mtime": st.st_mtime_ns,
+                                              "size": st.st_size, "hash": h}
+                self._dirty_files.add(path)
+            self._save_index()
+        return {"path": path, "mtime": st.st_mtime_ns, "size": st.st_size, "hash": h}
+
+    def key(self, project_path, design_name, producer):
+        """*producer*: tag of the extractor / dump layout that fills the entry"""
+        fp = self.fingerprint(project_path)
+        raw = "\x00".join([fp["path"], str(fp["mtime"]), str(fp["size"]),
+                           fp["hash"], design_name or "", producer])
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    # ───────── sections ───────── #
+    def _dir(self, key):
+        return os.path.join(self.root, key)
+
+    def get_section(self, key, section):
+        path = os.path.join(self._dir(key), section + ".json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self._touch(key)
+        return value
+
+    def put_section(self, key, section, value):
+        d = self._dir(key)
+        text = json.dumps(value, ensure_ascii=False, default=str)
+        if len(text.encode("utf-8")) > self.max_bytes:
+            return False
+        with self._locked():
+            os.makedirs(d, exist_ok=True)
+            _atomic_write(os.path.join(d, section + ".json"), text)
+            e = self._index["entries"].setdefault(key, {"sections": {}, "used": 0})
+            e["sections"][section] = len(text.encode("utf-8"))
+            e["used"] = time.time()
+            self._mark(key, "merge")
+            self._commit()
+        return True
+
+    def section(self, key, section, producer):
+        """cached value, or producer() stored under *section*"""
+        value = self.get_section(key, section)
+        if value is None:
+            value = producer()
+            self.put_section(key, section, value)
+        return value
+
+    # ───────── whole dumps ───────── #
+    def load(self, key):
+        """Full dump dict, or None unless a complete store() is on disk."""
+        e = self._index["entries"].get(key)
+        if not e or not e.get("complete"):
+            with self._lock:                     # stored by another process?
+                self._index = self._merged(self._read_index())
+            e = self._index["entries"].get(key)
+        if not e or not e.get("complete"):
+            return None
+        try:
+            with open(os.path.join(self._dir(key), COMPLETE), "r", encoding="utf-8") as f:
+                sections = json.load(f)
+        except (OSError, ValueError):
+            return None
+        data = {}
+        for sec in sections:
+            value = self.get_section(key, sec)
+            if value is None:
+                return None
+            data[sec] = value
+        self._save_index()
+        return data
+
+    def store(self, key, data):
+        """whole dump → entry, all or nothing; False if it exceeds max_bytes"""
+        texts = {sec: json.dumps(value, ensure_ascii=False, default=str)
+                 for sec, value in data.items()}
+        sizes = {sec: len(t.encode("utf-8")) for sec, t in texts.items()}
+        if sum(sizes.values()) > self.max_bytes:
+            return False
+        d = self._dir(key)
+        tmp = f"{d}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        try:
+            for sec, text in texts.items():
+                with open(os.path.join(tmp, sec + ".json"), "w", encoding="utf-8") as f:
+                    f.write(text)
+            with open(os.path.join(tmp, COMPLETE), "w", encoding="utf-8") as f:
+                json.dump(list(texts), f)
+            with self._locked():
+                shutil.rmtree(d, ignore_errors=True)    # partial / older entry
+                os.replace(tmp, d)
+                self._index["entries"][key] = {"sections": sizes, "used": time.time(),
+                                               "complete": True}
+                self._mark(key, "replace")
+                self._commit()
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        return True
+
+    # ───────── bookkeeping ───────── #
+    @contextmanager
+    def _locked(self):
+        with self._lock, _file_lock(self._lock_path):
+            yield
+
+    def _read_index(self):
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        index.setdefault("entries", {})
+        index.setdefault("files", {})
+        return index
+
+    def _mark(self, key, how):
+        if _RANK[how] >= _RANK[self._dirty.get(key, "touch")]:
+            self._dirty[key] = how
+
+    def _touch(self, key):
+        with self._lock:
+            e = self._index["entries"].get(key)
+            if e:
+                e["used"] = time.time()
+                self._mark(key, "touch")
+
+    def _merged(self, disk):
+        """index re-read from disk + this process's unsaved changes"""
+        entries = disk["entries"]
+        for key, how in self._dirty.items():
+            mine, theirs = self._index["entries"].get(key), entries.get(key)
+            if mine is None:
+                continue
+            if how == "replace" or theirs is None:
+                entries[key] = mine
+            elif how == "merge":
+                e = dict(theirs, **mine)
+                e["used"] = max(mine["used"], theirs["used"])
+                e["sections"] = dict(theirs["sections"], **mine["sections"])
+                entries[key] = e
+            else:
+                theirs["used"] = max(mine["used"], theirs["used"])
+        for path in self._dirty_files:
+            if path in self._index["files"]:
+                disk["files"][path] = self._index["files"][path]
+        return disk
+
+    def _evict(self, index):
+        entries = index["entries"]
+        total = sum(sum(e["sections"].values()) for e in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k]["used"]):
+            if total <= self.max_bytes:
+                break
+            total -= sum(entries.pop(key)["sections"].values())
+            shutil.rmtree(self._dir(key), ignore_errors=True)
+
+    def _commit(self):
+        """merge → evict → write index.json; caller holds _locked()"""
+        index = self._merged(self._read_index())
+        self._evict(index)
+        _atomic_write(self._index_path, json.dumps(index))
+        self._index = index
+        self._dirty.clear()
+        self._dirty_files.clear()
+
+    def _save_index(self):
+        with self._locked():
+            self._commit()
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS EXTRACT FILTER – take only what is asked for, before any RPC
+  • sections : which dump sections to collect ("objects", "excitations", …);
+               "!history" excludes, None = all
+  • names    : object name globs – plain ones go to the editor as
+               GetMatchedObjectName(glob) (one call each, no full listing),
+               "!glob" ones are dropped client-side; both kinds follow one
+               rule, fnmatchcase (case-sensitive) – editor hits are re-checked
+  • materials: GetObjectsByMaterial(m) per material – intersected with names
+  • region   : (x0, y0, z0, x1, y1, z1) – an object is kept when its bbox
+               overlaps the box (inside=True: lies fully in it); tested right
+               after the bbox call, so rejected objects cost one round-trip
+  • describe() goes into meta["filter"] – a filtered dump says so
+
+Usage
+-----
+    flt = ExtractFilter(sections=("objects", "excitations"),
+                        names=("L0*", "!*_old"), materials=("copper",))
+    if flt.wants("variables"): …
+    for name, handle in flt.object_items(hfss.modeler): …
+    fetch_object(mdl, name, handle, region=flt.keep_bbox)
+"""
+from fnmatch import fnmatchcase
+
+from extract_pipeline import object_items
+
+# sections a united-style dump can hold (material_library rides on materials)
+_UNSET = object()
+
+SECTIONS = ("variables", "materials", "objects", "analysis_setups", "coord_systems",
+            "mesh_ops", "reports", "history", "boundaries", "excitations")
+
+
+def _split(patterns):
+    """("a*", "!b*") → (["a*"], ["b*"]);  a bare string counts as one pattern"""
+    if isinstance(patterns, str):
+        patterns = (patterns,)
+    inc, exc = [], []
+    for p in patterns or ():
+        (exc if p.startswith("!") else inc).append(p.lstrip("!"))
+    return inc, exc
+
+
+def _match(name, patterns):
+    """the one glob rule for includes and excludes: case-sensitive fnmatch"""
+    return any(fnmatchcase(name, p) for p in patterns)
+
+
+def _editor(mdl):
+    """PyAEDT modeler → oEditor;  a COM oEditor passes through"""
+    return getattr(mdl, "oeditor", None) or mdl
+
+
+class ExtractFilter(object):
+    """Section / name / material / region selection for one extraction."""
+
+    def __init__(self, sections=None, names=None, materials=None, region=None,
+                 inside=False):
+        inc, exc = _split(sections)
+        unknown = set(inc + exc) - set(SECTIONS)
+        if unknown:
+            raise ValueError(f"unknown sections: {sorted(unknown)} – use {SECTIONS}")
+        self.sections = set(inc or SECTIONS) - set(exc)
+        self.names, self.skip_names = _split(names)
+        self.materials = [materials] if isinstance(materials, str) else list(materials or ())
+        if region is not None and len(region) != 6:
+            raise ValueError("region = (x0, y0, z0, x1, y1, z1)")
+        self.region = ([min(region[i], region[i + 3]) for i in range(3)]
+                       + [max(region[i], region[i + 3]) for i in range(3)]
+                       if region is not None else None)
+        self.inside = inside
+
+    @property
+    def selective(self):
+        """True when objects are narrowed at all (names / materials / region)"""
+        return bool(self.names or self.skip_names or self.materials or self.region)
+
+    def wants(self, section):
+        return section in self.sections
+
+    def keep_name(self, name):
+        """client-side "!glob" exclusion only"""
+        return not (self.skip_names and _match(name, self.skip_names))
+
+    # ───────── objects ───────── #
+    def object_names(self, mdl):
+        """
+        Names to fetch, in editor order, resolved with pattern queries:
+        GetMatchedObjectName per glob ∩ GetObjectsByMaterial per material.
+        None → no name / material narrowing (caller enumerates as usual).
+        """
+        if not (self.names or self.materials):
+            return None
+        ed = _editor(mdl)
+        names, seen = [], set()
+        for pattern in self.names or ("*",):
+            for n in ed.GetMatchedObjectName(pattern) or ():
+                if n not in seen and _match(n, (pattern,)):
+                    seen.add(n)
+                    names.append(n)
+        if self.materials:
+            by_mat = set()
+            for m in self.materials:
+                by_mat.update(ed.GetObjectsByMaterial(m) or ())
+            names = [n for n in names if n in by_mat]
+        return [n for n in names if not (self.skip_names and _match(n, self.skip_names))]
+
+    def object_items(self, mdl, names_of=None, names=_UNSET):
+        """
+        (name, handle) pairs – the filtered counterpart of object_items();
+        names: an object_names() result already in hand (saves the queries)
+        """
+        if names is _UNSET:
+            names = self.object_names(mdl)
+        if names is None:
+            for n, handle in object_items(mdl, names_of):
+                if not (self.skip_names and _match(n, self.skip_names)):
+                    yield n, handle
+            return
+        by_name = getattr(mdl, "objects_by_name", None) or {}
+        for n in names:
+            yield n, by_name.get(n)
+
+    def keep_bbox(self, bbox):
+        """region test on a [x0, y0, z0, x1, y1, z1] bbox; no region → True"""
+        if self.region is None:
+            return True
+        try:
+            bb = [float(v) for v in list(bbox)[:6]]
+        except (TypeError, ValueError):
+            return False
+        if len(bb) < 6:
+            return False
+        lo, hi = self.region[:3], self.region[3:]
+        if self.inside:
+            return all(lo[i] <= bb[i] and bb[i + 3] <= hi[i] for i in range(3))
+        return all(bb[i] <= hi[i] and lo[i] <= bb[i + 3] for i in range(3))
+
+    # ───────── boundaries ───────── #
+    def keep_boundary(self, name, type_name):
+        """boundaries / excitations section switch, checked before props"""
+        is_port = "port" in str(type_name or "").lower()
+        return self.wants("excitations" if is_port else "boundaries")
+
+    def describe(self):
+        return {"sections": sorted(self.sections), "names": self.names,
+                "skip_names": self.skip_names, "materials": self.materials,
+                "region": self.region, "inside": self.inside}
+
+
+ALL = ExtractFilter()
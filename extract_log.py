@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS EXTRACT LOG – leveled, buffered console output + rate-limited progress
+  • levels debug < info < warn < error; a disabled level costs one int
+    compare – message formatting is lazy ("%s" args), so per-object debug
+    lines are free unless EXTRACT_LOG_LEVEL=debug
+  • debug lines are buffered and flushed every 0.5 s, at 256 lines and at
+    exit – no per-line console round-trip; info+ lines flush at once so
+    they stay in order with plain print() output
+  • Progress redraws at most every 0.25 s (TTY: one \\r bar; else one line
+    per 10 s), so update() in a 100k-object loop is a counter increment
+  • optional JSON-lines event stream (EXTRACT_LOG_JSONL=<path> or
+    configure(jsonl=…)) – every event with timestamp, level and fields
+
+Usage
+-----
+    log = get_logger("united")
+    log.info("✓ Project: %s", name)
+    bar = log.progress("objects", total=len(names))
+    for n in names:
+        log.debug("  %s: %s", n, mat)
+        bar.update()
+    bar.close()
+"""
+import os, sys, json, time, atexit, threading
+
+DEBUG, INFO, WARN, ERROR = 10, 20, 30, 40
+LEVELS = {"debug": DEBUG, "info": INFO, "warn": WARN, "warning": WARN, "error": ERROR}
+_PREFIX = {WARN: "⚠ ", ERROR: "❌ "}
+
+
+class _Sink(object):
+    """Shared buffered console + optional JSON-lines file."""
+
+    def __init__(self, stream=None, flush_every=0.5, max_lines=256):
+        self.stream = stream or sys.stdout
+        self.flush_every, self.max_lines = flush_every, max_lines
+        self.level = LEVELS.get(os.environ.get("EXTRACT_LOG_LEVEL", "info").lower(), INFO)
+        self._buf, self._last = [], time.monotonic()
+        self._lock = threading.Lock()
+        self._jsonl = None
+        self._bar_open = False
+        path = os.environ.get("EXTRACT_LOG_JSONL")
+        if path:
+            self.open_jsonl(path)
+
+    def open_jsonl(self, path):
+        if self._jsonl:
+            self._jsonl.close()
+        self._jsonl = open(path, "a", encoding="utf-8", buffering=1 << 16)
+
+    def line(self, text, level=INFO):
+        with self._lock:
+            if self._bar_open:                    # keep the bar on its own line
+                self._buf.append("\n")
+                self._bar_open = False
+            self._buf.append(text + "\n")
+            now = time.monotonic()
+            if (level >= INFO or len(self._buf) >= self.max_lines
+                    or now - self._last >= self.flush_every):
+                self._flush(now)
+
+    def bar(self, text):
+        with self._lock:
+            self._buf.append("\r" + text)
+            self._bar_open = True
+            self._flush(time.monotonic())
+
+    def event(self, record):
+        if self._jsonl is not None:
+            with self._lock:
+                self._jsonl.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+    def _flush(self, now=None):
+        if self._buf:
+            self.stream.write("".join(self._buf))
+            self.stream.flush()
+            self._buf = []
+        self._last = now or time.monotonic()
+
+    def flush(self):
+        with self._lock:
+            if self._bar_open:
+                self._buf.append("\n")
+                self._bar_open = False
+            self._flush()
+            if self._jsonl is not None:
+                self._jsonl.flush()
+
+
+_SINK = _Sink()
+atexit.register(_SINK.flush)
+
+
+def configure(level=None, jsonl=None, stream=None):
+    """level: "debug" | "info" | "warn" | "error";  jsonl: event file path"""
+    if level is not None:
+        _SINK.level = LEVELS[level] if isinstance(level, str) else level
+    if jsonl:
+        _SINK.open_jsonl(jsonl)
+    if stream is not None:
+        _SINK.flush()
+        _SINK.stream = stream
+
+
+class Logger(object):
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def enabled(self, level):
+        return level >= _SINK.level or _SINK._jsonl is not None
+
+    def log(self, level, msg, *args, **fields):
+        if level < _SINK.level and _SINK._jsonl is None:
+            return
+        text = msg % args if args else msg
+        if level >= _SINK.level:
+            _SINK.line(_PREFIX.get(level, "") + text, level)
+        if _SINK._jsonl is not None:
+            _SINK.event(dict(fields, t=time.time(), src=self.name,
+                             level=level, msg=text))
+
+    def debug(self, msg, *args, **fields):
+        self.log(DEBUG, msg, *args, **fields)
+
+    def info(self, msg, *args, **fields):
+        self.log(INFO, msg, *args, **fields)
+
+    def warn(self, msg, *args, **fields):
+        self.log(WARN, msg, *args, **fields)
+
+    def error(self, msg, *args, **fields):
+        self.log(ERROR, msg, *args, **fields)
+
+    def progress(self, label, total=None, min_interval=0.25):
+        return Progress(self, label, total, min_interval)
+
+    def flush(self):
+        _SINK.flush()
+
+
+_LOGGERS = {}
+
+
+def get_logger(name):
+    lg = _LOGGERS.get(name)
+    if lg is None:
+        lg = _LOGGERS[name] = Logger(name)
+    return lg
+
+
+# ───────── progress ───────── #
+PROGRESS = {}                                    # label → live Progress
+
+
+class Progress(object):
+    """Counter with a rate-limited bar; also the live source for telemetry."""
+
+    def __init__(self, logger, label, total=None, min_interval=0.25):
+        self.logger, self.label, self.total = logger, label, total
+        self.done, self.start = 0, time.monotonic()
+        self.finished = None
+        self.min_interval = min_interval
+        self._tty = bool(getattr(_SINK.stream, "isatty", lambda: False)())
+        self._next = self.start + (min_interval if self._tty else 10.0)
+        PROGRESS[label] = self
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.monotonic()) - self.start
+
+    @property
+    def rate(self):
+        e = self.elapsed
+        return self.done / e if e > 0 else 0.0
+
+    @property
+    def eta(self):
+        r = self.rate
+        if not self.total or not r:
+            return None
+        return max(0.0, (self.total - self.done) / r)
+
+    def update(self, n=1):
+        self.done += n
+        now = time.monotonic()
+        if now >= self._next:
+            self._next = now + (self.min_interval if self._tty else 10.0)
+            self._draw()
+
+    def _text(self):
+        if self.total:
+            frac = min(1.0, self.done / float(self.total))
+            bar = "█" * int(frac * 24) + "·" * (24 - int(frac * 24))
+            eta = self.eta
+            return "  %s %s %d/%d  %.1f/s%s" % (
+                self.label, bar, self.done, self.total, self.rate,
+                "  ETA %ds" % eta if eta is not None else "")
+        return "  %s %d  %.1f/s" % (self.label, self.done, self.rate)
+
+    def _draw(self):
+        if INFO < _SINK.level:
+            return
+        if self._tty:
+            _SINK.bar(self._text())
+        else:
+            _SINK.line(self._text())
+
+    def close(self):
+        self.finished = time.monotonic()
+        if self.done and self._tty:
+            self._draw()
+        self.logger.info("✓ %s: %d in %.1fs (%.1f/s)", self.label, self.done,
+                         self.elapsed, self.rate, event="progress",
+                         done=self.done, total=self.total)
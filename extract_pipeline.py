@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS EXTRACT PIPELINE – overlap AEDT round-trips, normalisation and writing
+    fetch k+1  (caller thread – owns the AEDT session, only RPC calls)
+    normalise k (thread – dict building, material ids, digests)
+    write k−1  (thread – JSON fragment encoding into a spool file)
+  • bounded queues between the stages → back-pressure; with a write sink
+    the entries live only in the spool, the caller gets {name: digest}
+  • a name fetched twice is written once (first fetch wins) – no duplicate
+    JSON keys in the dump
+  • a worker exception stops the feed and is re-raised in the caller
+  • save_dump() splices spooled sections into the final JSON, byte-for-byte
+    what json.dump(data, indent=2) would have written
+
+Usage (united.py / cl.py)
+-----
+    with SectionSpool(base + ".objects.part") as spool:    # .part removed on exit
+        data["objects"] = run_pipeline(object_items(mdl, names_of),
+                                       lambda it: fetch_object(mdl, *it),
+                                       lambda raw: normalize_object(raw, mat_index),
+                                       spool.write)        # → {name: digest}
+        save_dump(data, base + ".json", {"objects": spool})
+"""
+import os, json, queue, shutil, threading
+
+from dump_digest import DIGEST_FIELDS, entry_digest
+
+_DONE = object()
+
+
+# ───────── object records (shared by the extractors) ───────── #
+def object_items(mdl, names_of):
+    """(name, handle) for every object; names_of = bound name resolver"""
+    for handle in mdl.objects:
+        for n in names_of(mdl, handle):
+            yield n, handle
+
+
+def fetch_object(mdl, name, handle=None, strict=False, region=None):
+    """
+    AEDT round-trips for one object only – no post-processing.
+    strict: skip groups / vanished names and empty unassigned objects
+    region: bbox → bool (ExtractFilter.keep_bbox), checked before the
+            material / faces / history calls
+    """
+    if strict and (not mdl.does_object_exist(name) or mdl.is_group(name)):
+        return None
+    raw = {"name": name, "color": getattr(handle, "color", None)}
+    try:
+        raw["bounding_box"] = mdl.get_bounding_box(name)
+    except Exception:
+        raw["bounding_box"] = []
+    if region is not None and not region(raw["bounding_box"]):
+        return None
+    raw["material"] = (mdl.get_object_material(name, "")
+                       if strict or mdl.does_object_exist(name) else "Unknown")
+    if strict and not raw["bounding_box"] and raw["material"] in ("", "Unknown"):
+        return None
+    try:
+        raw["primitive"] = mdl.get_object_type(name)
+        raw["params"] = mdl.get_object_parameters(name)
+    except Exception:
+        raw["primitive"], raw["params"] = "Unknown", {}
+    raw["faces"] = mdl.get_object_faces(name)
+    raw["history"] = mdl.get_object_history(name)
+    return raw
+
+
+def normalize_object(raw, mat_index=None):
+    """raw fetch → dump entry (+ material_id, + digest)"""
+    mat = raw["material"] or "Unknown"
+    entry = {"material": mat}
+    if mat_index is not None:
+        entry["material_id"] = mat_index.get(str(mat).lower())
+    color = raw["color"]
+    entry["color"] = list(color) if isinstance(color, tuple) else color
+    entry["primitive"] = raw["primitive"] or "Unknown"
+    entry["params"] = raw["params"] or {}
+    entry["faces"] = list(raw["faces"] or [])
+    entry["bounding_box"] = list(raw["bounding_box"] or [])
+    entry["history"] = raw["history"]
+    entry["digest"] = entry_digest(entry, DIGEST_FIELDS["objects"])
+    return raw["name"], entry
+
+
+# ───────── pipeline ───────── #
+def _stage(fn, q_in, q_out, errors):
+    while True:
+        item = q_in.get()
+        if item is _DONE:
+            if q_out is not None:
+                q_out.put(_DONE)
+            return
+        if errors:
+            continue                                   # drain – never block the feed
+        try:
+            out = fn(item)
+        except Exception as e:
+            errors.append(e)
+            continue
+        if q_out is not None and out is not None:
+            q_out.put(out)
+
+
+def run_pipeline(items, fetch, normalize, write=None, maxsize=64, progress=None):
+    """
+    items     : iterable consumed on the calling thread
+    fetch     : item → raw | None      (caller thread – AEDT calls)
+    normalize : raw → (name, entry)    (worker thread)
+    write     : (name, entry) → None   (worker thread, optional)
+    progress  : extract_log.Progress, advanced once per written entry
+    → {name: entry} in fetch order;  with *write*: {name: entry["digest"]}
+      only – the entries themselves are not kept
+    A name normalised twice is kept / written once (the first one).
+    """
+    errors, result = [], {}
+    q_norm = queue.Queue(maxsize)
+    q_write = queue.Queue(maxsize)
+
+    def collect(pair):
+        name, entry = pair
+        if name in result:
+            return                                     # duplicate name → one JSON key
+        if write is None:
+            result[name] = entry
+        else:
+            result[name] = entry.get("digest")
+            write(pair)
+        if progress is not None:
+            progress.update()
+
+    workers = [threading.Thread(target=_stage, args=(normalize, q_norm, q_write, errors),
+                                daemon=True),
+               threading.Thread(target=_stage, args=(collect, q_write, None, errors),
+                                daemon=True)]
+    for t in workers:
+        t.start()
+    try:
+        for item in items:
+            if errors:
+                break
+            raw = fetch(item)
+            if raw is not None:
+                q_norm.put(raw)                         # blocks when full
+    finally:
+        q_norm.put(_DONE)
+        for t in workers:
+            t.join()
+    if errors:
+        raise errors[0]
+    return result
+
+
+# ───────── spooled JSON sections ───────── #
+class SectionSpool(object):
+    """
+    Encodes {name: entry} members of one top-level section to a file.
+    As a context manager the .part file is removed on exit, error or not.
+    """
+
+    def __init__(self, path, indent=2):
+        self.path, self.count, self.bytes = path, 0, 0
+        self._pad = " " * (2 * indent)
+        self._indent = indent
+        self._fh = open(path, "w", encoding="utf-8", buffering=1 << 20)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.remove()
+
+    def write(self, pair):
+        name, entry = pair
+        body = json.dumps(entry, indent=self._indent, ensure_ascii=False, default=str)
+        text = "%s\n%s%s: %s" % ("," if self.count else "", self._pad,
+                                 json.dumps(name, ensure_ascii=False),
+                                 body.replace("\n", "\n" + self._pad))
+        self.bytes += len(text.encode("utf-8"))
+        self._fh.write(text)
+        self.count += 1
+
+    def close(self):
+        if not self._fh.closed:
+            self._fh.close()
+
+    def copy_to(self, out):
+        self.close()
+        with open(self.path, "r", encoding="utf-8") as f:
+            shutil.copyfileobj(f, out, 1 << 20)
+
+    def remove(self):
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def save_dump(data, path, spooled=None, indent=2):
+    """
+    json.dump(data, indent=2) – with *spooled* sections copied from disk;
+    the spool files are removed afterwards, also when writing fails
+    """
+    spooled = spooled or {}
+    pad = " " * indent
+    try:
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.write("{" if data else "{}")
+            for i, (key, value) in enumerate(data.items()):
+                f.write("%s\n%s%s: " % ("," if i else "", pad,
+                                        json.dumps(key, ensure_ascii=False)))
+                spool = spooled.get(key)
+                if spool is not None:
+                    if spool.count:
+                        f.write("{")
+                        spool.copy_to(f)
+                        f.write("\n%s}" % pad)
+                    else:
+                        f.write("{}")
+                    continue
+                body = json.dumps(value, indent=indent, ensure_ascii=False, default=str)
+                f.write(body.replace("\n", "\n" + pad))
+            if data:
+                f.write("\n}")
+    finally:
+        for spool in spooled.values():
+            spool.remove()
+    return path
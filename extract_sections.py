@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS DUMP SECTIONS – every non-object section, collected in one place
+united.py, batch_extract, shard_extract (shard 0) and watch_extract all build
+the same united.py layout from here, so a section is defined exactly once:
+  • variables        : capability-probed bulk read
+  • materials        : {name: {"name", "id"}} + material_library (id-keyed)
+  • analysis_setups  : props / sweeps with compressed frequency grids
+  • coord_systems, mesh_ops, reports, history
+  • boundaries / excitations: one pass, split by ExtractFilter.keep_boundary
+Only the sections the filter asks for cost any AEDT round-trip.
+
+Usage
+-----
+    sections = collect_sections(hfss, flt, timed=tele.section)
+"""
+from contextlib import nullcontext
+
+from extract_filter import ALL
+
+LATER = ("analysis_setups", "coord_systems", "mesh_ops", "reports", "history")
+
+
+def collect_sections(hfss, flt=ALL, timed=None):
+    """
+    every non-object section *flt* asks for, united.py layout
+    timed: section name → context manager (e.g. Telemetry.section)
+    """
+    from capabilities import get_probe, VARIABLE_STRATEGIES
+    from material_library import extract_material_library, material_table
+    from boundary_table import collect_boundaries
+    from coord_mesh import collect_coord_systems, collect_mesh_ops
+    from freq_grid import compress_props
+
+    timed = timed or (lambda key: nullcontext())
+    out = {}
+    if flt.wants("variables"):
+        with timed("variables"):
+            out["variables"] = get_probe(hfss).call("variables", VARIABLE_STRATEGIES, hfss)
+    if flt.wants("materials"):
+        with timed("materials"):       # one bulk library read per project
+            table, index = material_table(extract_material_library(hfss))
+            out["materials"] = {m: {"name": m, "id": index.get(m.lower())}
+                                for m in hfss.materials.material_keys}
+            out["material_library"] = table
+    fns = {"analysis_setups": lambda: {s.name: {"props": compress_props(s.props),
+                                                "sweeps": {sw.name: compress_props(sw.props)
+                                                           for sw in s.sweeps}}
+                                       for s in hfss.setups},
+           "coord_systems": lambda: collect_coord_systems(hfss),
+           "mesh_ops": lambda: collect_mesh_ops(hfss),
+           "reports": lambda: {r.name: r.report_type for r in hfss.post.reports},
+           "history": lambda: hfss.odesign.GetModelHistory()}
+    for key in LATER:
+        if flt.wants(key):
+            with timed(key):
+                out[key] = fns[key]()
+    if flt.wants("boundaries") or flt.wants("excitations"):
+        with timed("boundaries"):
+            bnd, exc = collect_boundaries(hfss, keep=flt.keep_boundary).to_dump()
+        for key, value in (("boundaries", bnd), ("excitations", exc)):
+            if flt.wants(key):
+                out[key] = value
+    return out
+
+
+def material_index(sections):
+    """materials section → {lower name: library id} for normalize_object; None if absent"""
+    if "materials" not in sections:
+        return None
+    return {m.lower(): e.get("id") for m, e in sections["materials"].items()}
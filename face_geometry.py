@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS FACE GEOMETRY – bulk face IDs, centers, normals and areas
+  • bulk path: one RunScript() call – a small IronPython script runs *inside*
+    AEDT, walks every face of the requested objects in-process and writes a
+    CSV, so N faces cost one round-trip instead of ~4·N
+  • fallback: per-face calls through PyAEDT's oeditor
+  • stored as typed columns (array / NumPy views), never nested JSON lists:
+      ids     int64  [n]         owner  int32 [n] → owners[…] names
+      centers float64[n, 3]      normals float64[n, 3]   areas float64[n]
+  • FaceTable.save()/load() use a compact binary sidecar (<base>_faces.bin);
+    the dump keeps only {"file": …, "faces": n}
+  • an owner the design does not have is listed in FaceTable.missing
+    instead of aborting the collection
+Normals are only defined for planar faces: all vertices and the face center
+must lie on one plane (within 1e-6 of the face size), otherwise – curved
+faces, fewer than 3 vertices – (0, 0, 0) is stored. A normal is unsigned
+(first non-zero component > 0), so vertex order does not flip it.
+"""
+import os, io, csv, json, math, inspect, tempfile
+from array import array
+
+try:                                    # optional – fast column views
+    import numpy as _np
+except ImportError:                     # pragma: no cover
+    _np = None
+
+_MAGIC = b"HFSSFACE1\n"
+
+# runs inside AEDT (IronPython 2.7) – keep it py2 compatible
+_AEDT_SCRIPT = r'''
+import ScriptEnv
+ScriptEnv.Initialize("Ansoft.ElectronicsDesktop")
+oProject = oDesktop.SetActiveProject(%(project)r)
+oDesign  = oProject.SetActiveDesign(%(design)r)
+oEditor  = oDesign.SetActiveEditor("3D Modeler")
+names = %(names)r or list(oEditor.GetMatchedObjectName("*"))
+
+def pos(v):
+    return [float(x) for x in oEditor.GetVertexPosition(v)]
+
+%(plane_normal)s
+
+out = open(%(out)r, "w")
+for n in names:
+    try:
+        faces = oEditor.GetFaceIDs(n)
+    except Exception:
+        out.write("%%s,missing\n" %% n)     # owner not in this design
+        continue
+    for f in faces:
+        f = int(f)
+        vs = [pos(int(v)) for v in oEditor.GetVertexIDsFromFace(f)]
+        try:
+            c = [float(x) for x in oEditor.GetFaceCenter(f)]
+        except Exception:
+            c = [sum(p[i] for p in vs) / len(vs) for i in range(3)] if vs else [0.0] * 3
+        nrm = plane_normal(vs, c)
+        try:
+            area = float(oEditor.GetFaceArea(f))
+        except Exception:
+            area = 0.0
+        out.write("%%s,%%d,%%r,%%r,%%r,%%r,%%r,%%r,%%r\n" %% tuple(
+            [n, f] + c + nrm + [area]))
+out.close()
+'''
+
+
+def plane_normal(vs, center=None, tol=1e-6):
+    """unit normal of a planar face from its vertices; (0, 0, 0) if not planar"""
+    # also pasted into the AEDT script - IronPython 2.7, ASCII only, no imports
+    if len(vs) < 3:
+        return [0.0, 0.0, 0.0]
+    a = vs[0]
+    b = max(vs, key=lambda p: sum((p[i] - a[i]) ** 2 for i in range(3)))
+    u = [b[i] - a[i] for i in range(3)]
+    size = sum(x * x for x in u) ** 0.5
+    best, nrm = 0.0, None
+    for p in vs:                               # widest triangle - stable cross product
+        w = [p[i] - a[i] for i in range(3)]
+        n = [u[1] * w[2] - u[2] * w[1], u[2] * w[0] - u[0] * w[2], u[0] * w[1] - u[1] * w[0]]
+        ln = sum(x * x for x in n) ** 0.5
+        if ln > best:
+            best, nrm = ln, n
+    if nrm is None or best <= tol * size * size:
+        return [0.0, 0.0, 0.0]             # collinear / degenerate
+    nrm = [x / best + 0.0 for x in nrm]        # + 0.0: no -0.0
+    for p in list(vs) + ([center] if center is not None else []):
+        if abs(sum(nrm[i] * (p[i] - a[i]) for i in range(3))) > tol * size:
+            return [0.0, 0.0, 0.0]         # curved: off the plane
+    for x in nrm:
+        if abs(x) > tol:
+            return nrm if x > 0 else [0.0 - y for y in nrm]
+    return nrm
+
+
+def _unit(v):
+    n = math.sqrt(v[0] * v[0] + v[1] * v[1] + v[2] * v[2])
+    return [x / n for x in v] if n > 0 else [0.0, 0.0, 0.0]
+
+
+class FaceTable(object):
+    """Column store of face geometry for many objects."""
+
+    def __init__(self):
+        self.owners  = []               # object names
+        self._owner_ix = {}
+        self.ids     = array("q")
+        self.owner   = array("i")
+        self.centers = array("d")       # x0 y0 z0 x1 …
+        self.normals = array("d")
+        self.areas   = array("d")
+        self.missing = []               # requested owners the design lacks
+
+    def __len__(self):
+        return len(self.ids)
+
+    def add(self, obj, face_id, center, normal, area):
+        ix = self._owner_ix.get(obj)
+        if ix is None:
+            ix = self._owner_ix[obj] = len(self.owners)
+            self.owners.append(obj)
+        self.ids.append(int(face_id))
+        self.owner.append(ix)
+        self.centers.extend(float(c) for c in center)
+        self.normals.extend(_unit([float(c) for c in normal]))
+        self.areas.append(float(area))
+
+    def faces_of(self, obj):
+        ix = self._owner_ix.get(obj)
+        return [f for f, o in zip(self.ids, self.owner) if o == ix]
+
+    # ───────── NumPy views (zero copy) ───────── #
+    def as_numpy(self):
+        if _np is None:
+            raise ImportError("numpy is required for FaceTable.as_numpy()")
+        return {"ids": _np.frombuffer(self.ids, dtype=_np.int64),
+                "owner": _np.frombuffer(self.owner, dtype=_np.int32),
+                "centers": _np.frombuffer(self.centers, dtype=_np.float64).reshape(-1, 3),
+                "normals": _np.frombuffer(self.normals, dtype=_np.float64).reshape(-1, 3),
+                "areas": _np.frombuffer(self.areas, dtype=_np.float64)}
+
+    # ───────── binary sidecar ───────── #
+    def save(self, path):
+        header = {"owners": self.owners, "count": len(self)}
+        with open(path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n")
+            for col in (self.ids, self.owner, self.centers, self.normals, self.areas):
+                col.tofile(f)
+        return {"file": os.path.basename(path), "faces": len(self)}
+
+    @classmethod
+    def load(cls, path):
+        t = cls()
+        with open(path, "rb") as f:
+            if f.readline() != _MAGIC:
+                raise ValueError(path + " is not a face-geometry file")
+            header = json.loads(f.readline().decode("utf-8"))
+            n = header["count"]
+            t.owners = header["owners"]
+            t._owner_ix = {o: i for i, o in enumerate(t.owners)}
+            for col, k in ((t.ids, n), (t.owner, n), (t.centers, 3 * n),
+                           (t.normals, 3 * n), (t.areas, n)):
+                col.fromfile(f, k)
+        return t
+
+
+# ───────── collectors ───────── #
+def _collect_bulk(app, names):
+    fd, out = tempfile.mkstemp(suffix=".csv")
+    os.close(fd)
+    script = out[:-4] + "_faces.py"
+    with io.open(script, "w", encoding="utf-8") as f:
+        f.write(_AEDT_SCRIPT % {"project": app.project_name, "design": app.design_name,
+                                "names": list(names or []), "out": out,
+                                "plane_normal": inspect.getsource(plane_normal)})
+    try:
+        app.odesktop.RunScript(script)
+        table = FaceTable()
+        with open(out, "r", encoding="utf-8", newline="") as f:
+            for row in csv.reader(f):
+                if len(row) == 2:
+                    table.missing.append(row[0])
+                    continue
+                v = [float(x) for x in row[2:]]
+                table.add(row[0], row[1], v[0:3], v[3:6], v[6])
+        return table
+    finally:
+        for p in (script, out):
+            try:
+                os.remove(p)
+            except OSError:
+                pass
+
+
+def _collect_per_face(app, names):
+    ed, table = app.modeler.oeditor, FaceTable()
+    for n in names or ed.GetMatchedObjectName("*"):
+        try:
+            faces = ed.GetFaceIDs(n)
+        except Exception:
+            table.missing.append(n)
+            continue
+        for f in faces:
+            f = int(f)
+            vs = [[float(x) for x in ed.GetVertexPosition(int(v))]
+                  for v in ed.GetVertexIDsFromFace(f)]
+            try:
+                c = [float(x) for x in ed.GetFaceCenter(f)]
+            except Exception:
+                c = [sum(p[i] for p in vs) / len(vs) for i in range(3)] if vs else [0.0] * 3
+            nrm = plane_normal(vs, c)
+            try:
+                area = float(ed.GetFaceArea(f))
+            except Exception:
+                area = 0.0
+            table.add(n, f, c, nrm, area)
+    return table
+
+
+def collect_face_table(app, names=None):
+    """Face geometry for *names* (default: every object) of a PyAEDT app."""
+    try:
+        return _collect_bulk(app, names)
+    except Exception as e:
+        print("⚠ bulk face collection failed, falling back to per-face calls:", e)
+        return _collect_per_face(app, names)
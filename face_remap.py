@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS FACE REMAP – carry boundary / port face IDs over to a rebuilt design
+After ExecuteScript() the rebuilt faces get new IDs.  Source faces are
+matched to rebuilt faces by geometry signature:
+    owning object  +  center (within tol)  +  normal  +  area
+Candidates come from a uniform hash grid over the rebuilt face centers
+(27 neighbouring cells per query), so matching is ~O(n) for tens of
+thousands of faces.  Assignment is greedy one-to-one by score.
+
+Typical use (histr.py / together.py):
+    remap_dump_faces(hfss, dump, os.path.dirname(dump_path))
+"""
+import os, math
+from collections import defaultdict
+
+from face_geometry import FaceTable, collect_face_table
+
+
+def _extent(t):
+    c = t.centers
+    if not len(c):
+        return 1.0
+    spans = [max(c[i::3]) - min(c[i::3]) for i in range(3)]
+    return max(spans) or 1.0
+
+
+def match_faces(src, dst, tol=None, normal_tol=1e-3, area_tol=1e-3):
+    """
+    src, dst : FaceTable (source dump, rebuilt design)
+    tol      : center distance tolerance (default 1e-5 × model extent)
+    → {source face id: rebuilt face id}
+    """
+    n = len(dst)
+    if not len(src) or not n:
+        return {}
+    ext = max(_extent(src), _extent(dst))
+    tol = tol if tol is not None else 1e-5 * ext
+    cell = max(tol * 2.0, ext / max(1.0, n ** (1.0 / 3.0)))
+    inv = 1.0 / cell
+
+    grid = defaultdict(list)
+    dc = dst.centers
+    for j in range(n):
+        grid[(int(math.floor(dc[3 * j] * inv)), int(math.floor(dc[3 * j + 1] * inv)),
+              int(math.floor(dc[3 * j + 2] * inv)))].append(j)
+
+    dst_owner = [dst.owners[o] for o in dst.owner]
+    sc, sn, dn = src.centers, src.normals, dst.normals
+    cands = []
+    for i in range(len(src)):
+        x, y, z = sc[3 * i], sc[3 * i + 1], sc[3 * i + 2]
+        owner = src.owners[src.owner[i]]
+        gx, gy, gz = int(math.floor(x * inv)), int(math.floor(y * inv)), int(math.floor(z * inv))
+        best = None
+        for ix in (gx - 1, gx, gx + 1):
+            for iy in (gy - 1, gy, gy + 1):
+                for iz in (gz - 1, gz, gz + 1):
+                    for j in grid.get((ix, iy, iz), ()):
+                        if dst_owner[j] != owner:
+                            continue
+                        d = math.sqrt((dc[3 * j] - x) ** 2 + (dc[3 * j + 1] - y) ** 2 +
+                                      (dc[3 * j + 2] - z) ** 2)
+                        if d > tol:
+                            continue
+                        dot = (sn[3 * i] * dn[3 * j] + sn[3 * i + 1] * dn[3 * j + 1] +
+                               sn[3 * i + 2] * dn[3 * j + 2])
+                        planar = any(sn[3 * i:3 * i + 3]) and any(dn[3 * j:3 * j + 3])
+                        if planar and 1.0 - dot > normal_tol:
+                            continue
+                        a, b = src.areas[i], dst.areas[j]
+                        da = abs(a - b) / max(abs(a), abs(b), 1e-300)
+                        if da > area_tol:
+                            continue
+                        score = d / tol + (1.0 - dot if planar else 0.0) + da
+                        if best is None or score < best[0]:
+                            best = (score, j)
+        if best is not None:
+            cands.append((best[0], i, best[1]))
+
+    mapping, used = {}, set()
+    for score, i, j in sorted(cands):
+        if j in used:
+            continue
+        used.add(j)
+        mapping[src.ids[i]] = dst.ids[j]
+    return mapping
+
+
+def remap_ids(ids, mapping):
+    """→ (remapped ids, ids without a match)"""
+    out, missing = [], []
+    for f in ids or []:
+        try:
+            key = int(f)
+        except (TypeError, ValueError):
+            out.append(f)
+            continue
+        if key in mapping:
+            out.append(mapping[key])
+        else:
+            out.append(key)
+            missing.append(key)
+    return out, missing
+
+
+def remap_section(entries, mapping):
+    """Rewrite "faces" and props["Faces"] of every entry; → unmatched names"""
+    bad = []
+    for name, e in entries.items():
+        e["faces"], miss = remap_ids(e.get("faces"), mapping)
+        props = e.get("props")
+        if isinstance(props, dict) and isinstance(props.get("Faces"), list):
+            props["Faces"], miss2 = remap_ids(props["Faces"], mapping)
+            miss += miss2
+        if miss:
+            bad.append(name)
+    return bad
+
+
+def remap_records(records, mapping):
+    """Same for boundary_table.BoundaryRecord rows; → unmatched names"""
+    bad = []
+    for r in records:
+        faces, miss = remap_ids(r.faces, mapping)
+        r.faces = tuple(faces)
+        if isinstance(r.props.get("Faces"), list):
+            r.props["Faces"], miss2 = remap_ids(r.props["Faces"], mapping)
+            miss += miss2
+        if miss:
+            bad.append(r.name)
+    return bad
+
+
+def remap_dump_faces(hfss, dump, dump_dir="."):
+    """
+    Match dump faces to the rebuilt *hfss* design and patch the dump in place;
+    dump = plain dict or dump_schema.Design
+    """
+    is_dict = isinstance(dump, dict)
+    ref = dump.get("face_geometry") if is_dict else dump.face_geometry
+    if not ref:
+        print("⚠ dump has no face_geometry – port/boundary faces used as-is")
+        return {}
+    src = FaceTable.load(os.path.join(dump_dir, ref["file"]))
+    dst = collect_face_table(hfss, src.owners)
+    mapping = match_faces(src, dst)
+    if is_dict:
+        bad = (remap_section(dump.get("boundaries") or {}, mapping) +
+               remap_section(dump.get("excitations") or {}, mapping))
+    else:
+        bad = remap_records(dump.boundaries, mapping)
+    print(f"✓ face remap: {len(mapping)}/{len(src)} faces matched")
+    if dst.missing:
+        print("⚠ objects missing in the rebuilt design (faces unmatched):",
+              ", ".join(sorted(dst.missing)))
+    if bad:
+        print("⚠ unmatched faces on:", ", ".join(sorted(bad)))
+    return mapping
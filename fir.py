@@ -8,6 +8,8 @@ Step-by-step:
 Outputs:
   • HFSS_Extract_<project>_<design>_<timestamp>.json
   • …_variables.csv  (can be disabled below)
+  • WATCH = True: HFSS_Live_<project>_<design>.json, refreshed after every
+    edit / save (watch_extract.py)
 """
 
 import os, json, csv
@@ -15,6 +17,7 @@ from datetime import datetime
 from pyaedt import Desktop, Hfss
 
 EXPORT_CSV = True                   # ← set False if CSV not needed
+WATCH      = False                  # ← True: keep HFSS_Live_….json fresh until Ctrl+C
 ts = datetime.now().strftime("%Y%m%d_%H%M%S")
 
 desktop = Desktop(new_desktop=False)        # attach to running AEDT
@@ -133,5 +136,9 @@ if EXPORT_CSV:
         csv.writer(f).writerows([["Variable", "Value"], *variables.items()])
     print("CSV  →", base + "_variables.csv")
 
+if WATCH:                                   # re-extract changed entities after edits
+    from watch_extract import watch
+    watch(hfss)
+
 hfss.release_desktop(close_projects=False, close_desktop=False)
 print("✅  Extraction complete.")
\ No newline at end of file
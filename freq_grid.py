@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS FREQUENCY GRIDS – lossless parametric storage of long frequency lists
+  • compress_props() walks setup / sweep props and replaces every long list
+    of frequencies ("1GHz", "1.001GHz", … or plain numbers) by a piecewise
+    grid: linear runs, log runs and explicit points
+  • discrete sweeps stored as thousands of SinglePoints subranges collapse
+    the same way (one subrange template + one grid)
+  • lossless: a run is only accepted if every expanded point formats back to
+    exactly the original entry (string for string, int stays int); explicit
+    points keep the original entry as written.  A grid is only stored when
+    expand_props(compress_props(x)) == x and it is at least twice smaller –
+    otherwise the raw list stays
+  • FreqGrid expands lazily (len / index / iterate, no list built);
+    expand_props() restores the original props for the rebuilders
+
+    {"__freq_grid__": 1, "unit": "GHz", "count": 20001,
+     "segments": [["lin", 1.0, 21.0, 20001]]}
+"""
+import re
+from collections.abc import Mapping
+
+GRID_KEY   = "__freq_grid__"
+MIN_POINTS = 8
+_NUM = re.compile(r"^\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*([A-Za-z]*)\s*$")
+
+
+# ───────── values ───────── #
+def _split(v):
+    """"1.5GHz" → (1.5, "GHz");  2.4e9 → (2.4e9, None);  else None"""
+    if isinstance(v, bool):
+        return None
+    if isinstance(v, (int, float)):
+        return float(v), None
+    if isinstance(v, str):
+        m = _NUM.match(v)
+        if m and (not m.group(2) or m.group(2).lower().endswith("hz")):
+            return float(m.group(1)), m.group(2)
+    return None
+
+
+def _exact(x):
+    return float("%.12g" % x)
+
+
+def _lin(start, stop, n, k):
+    return start + (stop - start) * k / (n - 1)
+
+
+def _log(start, stop, n, k):
+    return start * (stop / start) ** (k / (n - 1))
+
+
+_KINDS = {"lin": _lin, "log": _log}
+
+
+def _run(v, i, kind, same):
+    """longest run starting at i that *kind* reproduces exactly → length"""
+    n = len(v)
+    if i + 2 >= n:
+        return 1
+    a, b = v[i], v[i + 1]
+    if kind == "lin":
+        d = b - a
+        if d == 0:
+            return 1
+        pred = lambda k: a + d * (k - i)
+    else:
+        if a <= 0 or b <= 0 or a == b:
+            return 1
+        r = b / a
+        pred = lambda k: a * r ** (k - i)
+    j = i + 1
+    while j + 1 < n and abs(v[j + 1] - pred(j + 1)) <= 1e-9 * max(abs(v[j + 1]), 1e-300):
+        j += 1
+    f = _KINDS[kind]
+    while j - i >= 2:                                   # verify, shrink on a miss
+        cnt = j - i + 1
+        bad = next((k for k in range(cnt) if not same(i + k, f(v[i], v[j], cnt, k))), None)
+        if bad is None:
+            return cnt
+        j = i + bad - 1
+    return 1
+
+
+def _segments(v, raw, same):
+    """v: parsed floats, raw: original entries → segments ("pts" keep raw)"""
+    segs, pts, i = [], [], 0
+    while i < len(v):
+        best, kind = 1, None
+        for k in ("lin", "log"):
+            n = _run(v, i, k, same)
+            if n > best:
+                best, kind = n, k
+        if kind is None or best < 3:
+            pts.append(raw[i])
+            i += 1
+            continue
+        if pts:
+            segs.append(["pts", pts])
+            pts = []
+        segs.append([kind, v[i], v[i + best - 1], best])
+        i += best
+    if pts:
+        segs.append(["pts", pts])
+    return segs
+
+
+def _identical(a, b):
+    """string for string, int for int – 1 and 1.0 differ here"""
+    return len(a) == len(b) and all(type(x) is type(y) and x == y for x, y in zip(a, b))
+
+
+# ───────── grid ───────── #
+class FreqGrid(object):
+    """Lazily expanded piecewise grid (values in its own unit)."""
+    __slots__ = ("unit", "ints", "segments", "_ends")
+
+    def __init__(self, unit, segments, ints=False):
+        self.unit, self.ints, self.segments, self._ends = unit, ints, segments, []
+        total = 0
+        for s in segments:
+            total += len(s[1]) if s[0] == "pts" else s[3]
+            self._ends.append(total)
+
+    @classmethod
+    def from_values(cls, values, min_points=MIN_POINTS):
+        """→ FreqGrid, or None if the list is not a compressible frequency list"""
+        if len(values) < min_points:
+            return None
+        parsed = [_split(x) for x in values]
+        if any(p is None for p in parsed) or len({p[1] for p in parsed}) != 1:
+            return None
+        values = list(values)
+        unit, ints = parsed[0][1], all(type(x) is int for x in values)
+        fmt = cls(unit, [], ints)._fmt
+        same = lambda k, x: _identical((fmt(_exact(x)),), (values[k],))
+        grid = cls(unit, _segments([p[0] for p in parsed], values, same), ints)
+        stored = sum(len(s[1]) if s[0] == "pts" else 3 for s in grid.segments)
+        if 2 * stored > len(values) or not _identical(grid.tolist(), values):
+            return None
+        return grid
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d.get("unit"), d["segments"], d.get("ints", False))
+
+    def to_dict(self):
+        d = {GRID_KEY: 1, "unit": self.unit, "count": len(self),
+             "segments": self.segments}
+        if self.ints:
+            d["ints"] = True
+        return d
+
+    def __len__(self):
+        return self._ends[-1] if self._ends else 0
+
+    def _point(self, i):
+        if i < 0:
+            i += len(self)
+        lo = 0
+        for s, end in zip(self.segments, self._ends):
+            if i < end:
+                k = i - lo
+                return s[1][k] if s[0] == "pts" else \
+                    self._fmt(_exact(_KINDS[s[0]](s[1], s[2], s[3], k)))
+            lo = end
+        raise IndexError(i)
+
+    def value(self, i):
+        """i-th point as a float (in self.unit)"""
+        return _split(self._point(i))[0]
+
+    def _fmt(self, x):
+        if self.unit is None:
+            return int(x) if self.ints else x
+        return "%.12g%s" % (x, self.unit)
+
+    def __getitem__(self, i):
+        return self._point(i)
+
+    def __iter__(self):
+        for s in self.segments:
+            if s[0] == "pts":
+                yield from s[1]
+            else:
+                f, a, b, n = _KINDS[s[0]], s[1], s[2], s[3]
+                for k in range(n):
+                    yield self._fmt(_exact(f(a, b, n, k)))
+
+    def tolist(self):
+        return list(self)
+
+
+def is_grid(obj):
+    return isinstance(obj, Mapping) and GRID_KEY in obj
+
+
+# ───────── props walkers ───────── #
+def _single_points(lst):
+    """[{RangeType: SinglePoints, RangeStart: f, RangeEnd: f, …}, …] → template"""
+    if len(lst) < MIN_POINTS or not all(isinstance(x, Mapping) for x in lst):
+        return None
+    first = {k: v for k, v in lst[0].items() if k not in ("RangeStart", "RangeEnd")}
+    if first.get("RangeType") != "SinglePoints":
+        return None
+    for x in lst:
+        if x.get("RangeStart") != x.get("RangeEnd"):
+            return None
+        if {k: v for k, v in x.items() if k not in ("RangeStart", "RangeEnd")} != first:
+            return None
+    return first
+
+
+def compress_props(props, min_points=MIN_POINTS):
+    """Copy of *props* with every long frequency list stored as a grid."""
+    if isinstance(props, Mapping):
+        return {k: compress_props(v, min_points) for k, v in props.items()}
+    if isinstance(props, (list, tuple)):
+        tmpl = _single_points(props)
+        if tmpl is not None:
+            grid = FreqGrid.from_values([x["RangeStart"] for x in props], min_points)
+            if grid is not None:
+                out = dict(grid.to_dict(), subrange=tmpl)
+                if expand_props(out) == list(props):
+                    return out
+        grid = FreqGrid.from_values(props, min_points)
+        if grid is not None:
+            return grid.to_dict()
+        return [compress_props(v, min_points) for v in props]
+    return props
+
+
+def expand_props(props):
+    """Inverse of compress_props() – plain lists / subranges again."""
+    if is_grid(props):
+        values = FreqGrid.from_dict(props).tolist()
+        tmpl = props.get("subrange")
+        if tmpl is None:
+            return values
+        return [dict(tmpl, RangeStart=f, RangeEnd=f) for f in values]
+    if isinstance(props, Mapping):
+        return {k: expand_props(v) for k, v in props.items()}
+    if isinstance(props, list):
+        return [expand_props(v) for v in props]
+    return props
+
+
+def compress_setups(setups):
+    """{name: {"props": …, "sweeps": {…}}} section → compressed copy"""
+    return {n: compress_props(s) for n, s in setups.items()}
@@ -18,6 +18,8 @@ from typing import Dict, Any, Tuple, List
 
 from pyaedt import Desktop, Hfss
 
+from extract_cache import ExtractionCache
+
 
 # --------------------------------------------------------------------------- #
 # ---------------------------  HELPER FUNCTIONS  ---------------------------- #
@@ -97,10 +99,26 @@ def main() -> None:
     DESIGN_NAME  = None        # "ReducedHeight_1"           or None = active
     AEDT_VERSION = "2024.2"    # or None -> whatever is running
     EXPORT_CSV   = True
+    USE_CACHE    = True        # needs PROJECT_PATH + DESIGN_NAME
     # ----------------------------------------------------------------------- #
 
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+    # 0) Extraction cache – unchanged project file → skip AEDT entirely
+    cache = cache_key = None
+    if USE_CACHE and PROJECT_PATH and DESIGN_NAME and os.path.isfile(PROJECT_PATH):
+        cache = ExtractionCache()
+        cache_key = cache.key(PROJECT_PATH, DESIGN_NAME, "hfss_extractor_pyaedt")
+        cached = cache.load(cache_key)
+        if cached is not None:
+            cached["meta"]["served_from_cache"] = ts
+            base = f"HFSS_Extract_{cached['meta']['project']}_{DESIGN_NAME}_{ts}"
+            save_json(cached, base + ".json")
+            if EXPORT_CSV:
+                save_csv(cached, base)
+            print("✅ Served from cache (project file unchanged).")
+            return
+
     # 1) Attach to running Electronics Desktop
     d = Desktop(AEDT_VERSION, new_desktop=False, non_graphical=False)
     print("✓ Connected to AEDT", d.release)
@@ -136,6 +154,9 @@ def main() -> None:
     data["boundaries"], data["excitations"] = extract_boundaries_and_excitations(hfss)
 
     # 5) Save
+    if cache is not None:
+        if not cache.store(cache_key, json.loads(json.dumps(data, default=str))):
+            print("⚠ dump larger than the cache limit – not cached")
     base = f"HFSS_Extract_{prj.name}_{hfss.design_name}_{ts}"
     save_json(data, base + ".json")
     if EXPORT_CSV:
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS MATERIAL LIBRARY – one bulk read per project, shared by every design
+  • primary path: parse the project's own  $begin 'Materials' … $end block
+    straight from the saved *.aedt file – zero AEDT round-trips
+  • fallback (unsaved project / no file): the public PyAEDT Material
+    property API (mat.permittivity.value, …) on the already-loaded
+    materials, still no per-property COM calls
+  • cached per project file (path + mtime), so extracting N designs of one
+    project reads the library once
+  • material_table() gives content-addressed IDs; dumps store the table once
+    and objects reference it through "material_id"
+"""
+import os, re
+
+from dump_digest import digest
+
+_LIBRARY_CACHE = {}                      # (path, mtime) → {name: props}
+_BEGIN = re.compile(r"^\s*\$begin '(.*)'\s*$")
+_END   = re.compile(r"^\s*\$end '(.*)'\s*$")
+_KV    = re.compile(r"^\s*([^=(\[]+?)\s*=\s*(.*?)\s*$")
+_CALL  = re.compile(r"^\s*([\w ]+?)\s*([(\[])(.*)[)\]]\s*$")
+
+# Material attributes of PyAEDT = the keys of an .aedt Materials block
+MATERIAL_PROPS = ("permittivity", "permeability", "conductivity",
+                  "dielectric_loss_tangent", "magnetic_loss_tangent", "mass_density",
+                  "specific_heat", "thermal_conductivity",
+                  "thermal_expansion_coefficient", "youngs_modulus", "poissons_ratio")
+
+
+def _scalar(raw):
+    if len(raw) >= 2 and raw[0] == raw[-1] == "'":
+        return raw[1:-1]
+    if raw in ("true", "false"):
+        return raw == "true"
+    try:
+        return int(raw)
+    except ValueError:
+        try:
+            return float(raw)
+        except ValueError:
+            return raw
+
+
+def _parse_block(lines):
+    """consume lines up to the matching $end – returns a nested dict"""
+    out = {}
+    for line in lines:
+        if _END.match(line):
+            return out
+        m = _BEGIN.match(line)
+        if m:
+            out[m.group(1)] = _parse_block(lines)
+            continue
+        m = _KV.match(line)
+        if m:
+            out[m.group(1)] = _scalar(m.group(2))
+            continue
+        m = _CALL.match(line)
+        if m:
+            out[m.group(1)] = [_scalar(a.strip()) for a in m.group(3).split(",") if a.strip()]
+    return out
+
+
+def read_aedt_materials(project_file):
+    """{material name: props} from the project-local Materials block."""
+    with open(project_file, "r", encoding="utf-8", errors="replace") as f:
+        lines = iter(f)
+        for line in lines:
+            m = _BEGIN.match(line)
+            if m and m.group(1) == "Materials":
+                return _parse_block(lines)
+    return {}
+
+
+def _from_pyaedt(app):
+    out = {}
+    for name, mat in app.materials.material_keys.items():
+        props = {}
+        for p in MATERIAL_PROPS:
+            prop = getattr(mat, p, None)
+            value = getattr(prop, "value", None)
+            if value is not None:
+                props[p] = value
+        out[name] = props
+    return out
+
+
+def extract_material_library(app=None, project_file=None):
+    """
+    Whole project material library in one pass, cached per project file.
+    app          : PyAEDT Hfss (fallback when the file is missing / modified)
+    project_file : *.aedt path (default: app.project_file)
+    """
+    if project_file is None and app is not None:
+        project_file = getattr(app, "project_file", None)
+    modified = False
+    if app is not None:
+        try:
+            modified = bool(app.oproject.IsModified())
+        except Exception:
+            pass
+    if project_file and os.path.isfile(project_file) and not modified:
+        key = (os.path.normcase(os.path.abspath(project_file)),
+               os.stat(project_file).st_mtime_ns)
+        lib = _LIBRARY_CACHE.get(key)
+        if lib is None:
+            lib = _LIBRARY_CACHE[key] = read_aedt_materials(project_file)
+        if lib or app is None:
+            return lib
+    if app is None:
+        return {}
+    return _from_pyaedt(app)
+
+
+def material_table(library):
+    """→ ({material_id: props + name}, {lower-case name: material_id})"""
+    table, index = {}, {}
+    for name, props in library.items():
+        mid = digest([name, props])[:12]
+        table[mid] = dict(props, name=name)
+        index[name.lower()] = mid
+    return table, index
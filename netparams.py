@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS NETWORK PARAMETERS – vectorised post-processing of exported S/Y/Z data
+Arrays follow the solution store layout, frequency first:
+    s : complex [..., nfreq, ports, ports]      (leading axes = designs)
+so a whole batch of variants goes through np.linalg in one call.
+  • conversions  s2z z2s s2y y2s z2y y2z   (scalar or per-port real z0)
+  • metrics      return_loss, insertion_loss, group_delay, passivity
+  • resample     linear in re/im or in magnitude / unwrapped phase
+  • load_batch   many SolutionReader stores → one [designs, nfreq, p, p];
+                 Touchstone v1 Y / Z (normalised to the file's R) are
+                 denormalised, S on another reference is renormalised to z0
+
+Usage
+-----
+    freq, s = load_batch(glob.glob("solutions/*__S"))
+    il = insertion_loss(s, 1, 0)                 # [designs, nfreq] dB
+    ok = passivity(s)["passive"]                 # [designs]
+"""
+import numpy as np
+
+from solution_store import SolutionReader
+
+
+# ───────── helpers ───────── #
+def db(x):
+    return 20.0 * np.log10(np.maximum(np.abs(x), 1e-300))
+
+
+def _eye(s):
+    return np.broadcast_to(np.eye(s.shape[-1], dtype=s.dtype), s.shape)
+
+
+def _sqrt_z0(z0, p):
+    g = np.sqrt(np.broadcast_to(np.asarray(z0, dtype=float), (p,)))
+    return g[:, None], g[None, :]          # column / row scaling = diag(g)
+
+
+# ───────── conversions ───────── #
+def s2z(s, z0=50.0):
+    """Z = G (I − S)⁻¹ (I + S) G,  G = diag(√z0)"""
+    i = _eye(s)
+    gc, gr = _sqrt_z0(z0, s.shape[-1])
+    return gc * np.linalg.solve(i - s, i + s) * gr
+
+
+def z2s(z, z0=50.0):
+    """S = (Zn − I)(Zn + I)⁻¹,  Zn = G⁻¹ Z G⁻¹"""
+    i = _eye(z)
+    gc, gr = _sqrt_z0(z0, z.shape[-1])
+    zn = z / gc / gr
+    # (Zn − I)(Zn + I)⁻¹ = ((Zn + I)ᵀ⁻¹ (Zn − I)ᵀ)ᵀ
+    return np.swapaxes(np.linalg.solve(np.swapaxes(zn + i, -1, -2),
+                                       np.swapaxes(zn - i, -1, -2)), -1, -2)
+
+
+def s2y(s, z0=50.0):
+    """Y = G⁻¹ (I + S)⁻¹ (I − S) G⁻¹"""
+    i = _eye(s)
+    gc, gr = _sqrt_z0(z0, s.shape[-1])
+    return np.linalg.solve(i + s, i - s) / gc / gr
+
+
+def y2s(y, z0=50.0):
+    """S = (I − Yn)(I + Yn)⁻¹,  Yn = G Y G"""
+    i = _eye(y)
+    gc, gr = _sqrt_z0(z0, y.shape[-1])
+    yn = gc * y * gr
+    return np.swapaxes(np.linalg.solve(np.swapaxes(i + yn, -1, -2),
+                                       np.swapaxes(i - yn, -1, -2)), -1, -2)
+
+
+def z2y(z):
+    return np.linalg.inv(z)
+
+
+def y2z(y):
+    return np.linalg.inv(y)
+
+
+CONVERT = {("S", "Z"): s2z, ("Z", "S"): z2s, ("S", "Y"): s2y, ("Y", "S"): y2s,
+           ("Z", "Y"): lambda m, z0=50.0: z2y(m), ("Y", "Z"): lambda m, z0=50.0: y2z(m)}
+
+
+def convert(m, src, dst, z0=50.0):
+    """any of S / Y / Z → any other"""
+    if src == dst:
+        return m
+    return CONVERT[(src, dst)](m, z0)
+
+
+# ───────── metrics ───────── #
+def return_loss(s):
+    """−20·log10|S_ii|  → [..., nfreq, ports]"""
+    return -db(np.diagonal(s, axis1=-2, axis2=-1))
+
+
+def insertion_loss(s, i, j):
+    """−20·log10|S_ij|  → [..., nfreq]"""
+    return -db(s[..., i, j])
+
+
+def group_delay(s, freq, i, j):
+    """−dφ/dω of S_ij along frequency (unwrapped phase) → [..., nfreq] s"""
+    phase = np.unwrap(np.angle(s[..., i, j]), axis=-1)
+    return -np.gradient(phase, 2.0 * np.pi * np.asarray(freq), axis=-1)
+
+
+def passivity(s, tol=1e-6):
+    """largest singular value of S per frequency – passive if ≤ 1 + tol"""
+    sigma = np.linalg.svd(s, compute_uv=False)[..., 0]          # [..., nfreq]
+    worst = sigma.max(axis=-1)
+    return {"sigma_max": sigma, "worst": worst, "passive": worst <= 1.0 + tol,
+            "violations": (sigma > 1.0 + tol).sum(axis=-1)}
+
+
+def reciprocity(s):
+    """max |S − Sᵀ| per design"""
+    return np.abs(s - np.swapaxes(s, -1, -2)).max(axis=(-3, -2, -1))
+
+
+# ───────── resampling ───────── #
+def resample(freq, m, new_freq, polar=False):
+    """
+    Interpolate m [..., nfreq, p, p] from *freq* onto *new_freq* (vectorised
+    over every trace).  polar=True interpolates |m| and unwrapped phase,
+    which behaves better for long electrical lengths.
+    """
+    freq, new_freq = np.asarray(freq, float), np.asarray(new_freq, float)
+    k = np.clip(np.searchsorted(freq, new_freq) - 1, 0, len(freq) - 2)
+    w = ((new_freq - freq[k]) / (freq[k + 1] - freq[k]))[:, None, None]
+    if polar:
+        mag = np.abs(m)
+        ph = np.unwrap(np.angle(m), axis=-3)
+        a = mag[..., k, :, :] * (1 - w) + mag[..., k + 1, :, :] * w
+        b = ph[..., k, :, :] * (1 - w) + ph[..., k + 1, :, :] * w
+        return a * np.exp(1j * b)
+    return m[..., k, :, :] * (1 - w) + m[..., k + 1, :, :] * w
+
+
+# ───────── batches ───────── #
+def load_batch(paths, freq=None, param="S", z0=50.0):
+    """
+    Many solution stores → (freq, cube [designs, nfreq, p, p]).
+    Stores on another grid are resampled onto *freq* (default: the first
+    store's grid); stores of another parameter type are converted.
+    S comes out referenced to *z0*, Y / Z in siemens / ohms.
+    """
+    readers = [SolutionReader(p) for p in paths]
+    if not readers:
+        return np.zeros(0), np.zeros((0, 0, 0, 0), complex)
+    freq = np.asarray(readers[0].freq if freq is None else freq, float)
+    p = readers[0].ports
+    out = np.empty((len(readers), len(freq), p, p), complex)
+    for n, r in enumerate(readers):
+        if r.ports != p:
+            raise ValueError("%s has %d ports, expected %d" % (paths[n], r.ports, p))
+        m = r.data if np.array_equal(r.freq, freq) else resample(r.freq, r.data, freq)
+        m, src = np.asarray(m), r.param
+        if src == "Z":                                # v1: Y / Z normalised to R
+            m = m * r.z0
+        elif src == "Y":
+            m = m / r.z0
+        elif r.z0 != z0:                              # S on another reference
+            m, src = s2z(m, r.z0), "Z"
+        out[n] = convert(m, src, param, z0)
+    return freq, out
+
+
+def summary(freq, s, pairs=None):
+    """per-design scalars: worst RL, max IL per pair (default: every i > j), passivity"""
+    rl = return_loss(s)
+    if pairs is None:
+        pairs = [(i, j) for i in range(s.shape[-1]) for j in range(i)]
+    out = {"worst_return_loss_db": rl.min(axis=(-2, -1)),
+           "passive": passivity(s)["passive"]}
+    for i, j in pairs:
+        il = insertion_loss(s, i, j)
+        out["max_insertion_loss_db_%d%d" % (i + 1, j + 1)] = il.max(axis=-1)
+        out["mean_group_delay_s_%d%d" % (i + 1, j + 1)] = group_delay(s, freq, i, j).mean(axis=-1)
+    return out
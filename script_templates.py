@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS SCRIPT TEMPLATES – precompiled command layer for recreation scripts
+  • one template per command kind: CreateBox, CreateCylinder, Subtract,
+    AssignMaterial, wave / lumped port, generic boundary Assign*, design
+    variable, comment
+  • templates are compiled once into %-format strings + field getters, so a
+    whole parameter table renders with a single C-level join
+  • ScriptWriter streams rendered chunks through a large write buffer, so a
+    100k-object script never sits in memory as one string
+
+Usage
+-----
+    tpl = ScriptTemplates(editor="oEditor", module="oModule")
+    with ScriptWriter("rebuild.py", tpl) as w:
+        w.write_block(preamble)
+        w.write_rows("box", box_rows_from_bboxes(names, bboxes, mats, "mm"))
+"""
+
+import io
+import re
+from operator import itemgetter
+
+try:                                    # optional – vectorised size maths
+    import numpy as _np
+except ImportError:                     # pragma: no cover
+    _np = None
+
+# ───────── raw templates ───────── #
+# {field} = per-row value,  {{editor}} / {{module}} / {{indent}} = constants
+# that are baked in when the template set is compiled.
+RAW_TEMPLATES = {
+    "comment": '{{indent}}# {text}\n',
+    "variable": '{{indent}}{{design}}.ChangeProperty("DesignVariables", '
+                '"{name}", "{value}")\n',
+    "box": (
+        '{{indent}}{{editor}}.CreateBox(\n'
+        '{{indent}}    ["NAME:BoxParameters",\n'
+        '{{indent}}     "XPosition:=", "{x}", "YPosition:=", "{y}", "ZPosition:=", "{z}",\n'
+        '{{indent}}     "XSize:=", "{dx}", "YSize:=", "{dy}", "ZSize:=", "{dz}"],\n'
+        '{{indent}}    ["NAME:Attributes", "Name:=", "{name}",\n'
+        '{{indent}}     "MaterialValue:=", "\\"{material}\\"", "SolveInside:=", {solve_inside}])\n'
+    ),
+    "cylinder": (
+        '{{indent}}{{editor}}.CreateCylinder(\n'
+        '{{indent}}    ["NAME:CylinderParameters",\n'
+        '{{indent}}     "XCenter:=", "{x}", "YCenter:=", "{y}", "ZCenter:=", "{z}",\n'
+        '{{indent}}     "Radius:=", "{radius}", "Height:=", "{height}", "WhichAxis:=", "{axis}"],\n'
+        '{{indent}}    ["NAME:Attributes", "Name:=", "{name}",\n'
+        '{{indent}}     "MaterialValue:=", "\\"{material}\\"", "SolveInside:=", {solve_inside}])\n'
+    ),
+    "subtract": (
+        '{{indent}}{{editor}}.Subtract(\n'
+        '{{indent}}    ["NAME:Selections", "Blank Parts:=", "{blank}", "Tool Parts:=", "{tool}"],\n'
+        '{{indent}}    ["NAME:SubtractParameters", "KeepOriginals:=", {keep}])\n'
+    ),
+    "material": (
+        '{{indent}}{{editor}}.AssignMaterial(\n'
+        '{{indent}}    ["NAME:Selections", "Selections:=", "{names}"],\n'
+        '{{indent}}    ["NAME:Attributes", "MaterialValue:=", "\\"{material}\\"",\n'
+        '{{indent}}     "SolveInside:=", {solve_inside}])\n'
+    ),
+    "wave_port": (
+        '{{indent}}{{module}}.AssignWavePort(\n'
+        '{{indent}}    ["NAME:{name}", "Faces:=", [{faces}], "NumModes:=", {modes},\n'
+        '{{indent}}     "DoDeembed:=", False, "RenormalizeAllTerminals:=", True])\n'
+    ),
+    "lumped_port": (
+        '{{indent}}{{module}}.AssignLumpedPort(\n'
+        '{{indent}}    ["NAME:{name}", "Faces:=", [{faces}],\n'
+        '{{indent}}     "Impedance:=", "{impedance}", "DoDeembed:=", False])\n'
+    ),
+    "assign": (
+        '{{indent}}try:\n'
+        '{{indent}}    {{module}}.{method}({args})\n'
+        '{{indent}}except Exception as e:\n'
+        '{{indent}}    _failed.append({name} + ": " + str(e))\n'
+    ),
+}
+
+_FIELD = re.compile(r"(?<!\{)\{(\w+)\}(?!\})")
+
+
+# ───────── compiled templates ───────── #
+class CompiledTemplate(object):
+    """%-format string + field order; renders one row or a whole table."""
+    __slots__ = ("kind", "fields", "fmt", "_get")
+
+    def __init__(self, kind, raw, consts):
+        self.kind = kind
+        self.fields = tuple(_FIELD.findall(raw))
+        text = _FIELD.sub("\x00", raw.replace("%", "%%"))
+        text = text.replace("{{", "{").replace("}}", "}").format(**consts)
+        self.fmt = text.replace("\x00", "%s")
+        # itemgetter of one key returns a scalar – wrap it into a tuple
+        if len(self.fields) == 1:
+            key = self.fields[0]
+            self._get = lambda row: (row[key],)
+        else:
+            self._get = itemgetter(*self.fields)
+
+    def render(self, row):
+        """row: dict with every field of the template"""
+        return self.fmt % self._get(row)
+
+    def render_rows(self, rows):
+        """rows: iterable of dicts – one join, no per-row Python formatting"""
+        return "".join(map(self.fmt.__mod__, map(self._get, rows)))
+
+
+class ScriptTemplates(object):
+    """All command kinds compiled once for one editor / module naming."""
+
+    def __init__(self, editor="oEditor", module="oModule", design="oDesign",
+                 indent=""):
+        consts = {"editor": editor, "module": module, "design": design,
+                  "indent": indent}
+        self.kinds = {k: CompiledTemplate(k, raw, consts)
+                      for k, raw in RAW_TEMPLATES.items()}
+
+    def __getitem__(self, kind):
+        return self.kinds[kind]
+
+    def render(self, kind, row):
+        return self.kinds[kind].render(row)
+
+    def render_rows(self, kind, rows):
+        return self.kinds[kind].render_rows(rows)
+
+
+# ───────── vectorised parameter columns ───────── #
+def length_column(values, units=""):
+    """numbers → '<%.12g><units>', strings (expressions) passed through"""
+    fmt = ("%.12g" + units.replace("%", "%%")).__mod__
+    return [v if isinstance(v, str) else fmt(v) for v in values]
+
+
+def _bbox_columns(bboxes):
+    """[(xmin, ymin, zmin, xmax, ymax, zmax), …] → six float columns"""
+    if _np is not None:
+        a = _np.asarray(bboxes, dtype=float).reshape(-1, 6)
+        lo, size = a[:, :3], a[:, 3:] - a[:, :3]
+        return [c.tolist() for c in (lo[:, 0], lo[:, 1], lo[:, 2],
+                                     size[:, 0], size[:, 1], size[:, 2])]
+    cols = list(zip(*[[float(v) for v in b] for b in bboxes])) or [()] * 6
+    x0, y0, z0, x1, y1, z1 = cols
+    return [list(x0), list(y0), list(z0),
+            [b - a for a, b in zip(x0, x1)],
+            [b - a for a, b in zip(y0, y1)],
+            [b - a for a, b in zip(z0, z1)]]
+
+
+def box_rows_from_bboxes(names, bboxes, materials, units="mm",
+                         solve_inside=True):
+    """Build the 'box' table for many objects at once from their bboxes."""
+    x, y, z, dx, dy, dz = (length_column(c, units) for c in _bbox_columns(bboxes))
+    si = repr(bool(solve_inside))
+    keys = ("name", "material", "x", "y", "z", "dx", "dy", "dz")
+    return [dict(zip(keys, r), solve_inside=si)
+            for r in zip(names, materials, x, y, z, dx, dy, dz)]
+
+
+# ───────── buffered streaming writer ───────── #
+class ScriptWriter(object):
+    """Writes rendered script text through one large buffer, in chunks.
+    *path* may also be an open text stream (e.g. io.StringIO) – left open."""
+
+    def __init__(self, path, templates=None, chunk_rows=4096,
+                 buffer_size=1 << 20):
+        self.path = path
+        self.templates = templates or ScriptTemplates()
+        self.chunk_rows = chunk_rows
+        self._own = not hasattr(path, "write")
+        self._fh = (io.open(path, "w", encoding="utf-8", buffering=buffer_size)
+                    if self._own else path)
+        self.bytes_written = 0
+
+    def write_block(self, text):
+        if text and not text.endswith("\n"):
+            text += "\n"
+        self.bytes_written += self._fh.write(text)
+
+    def write_lines(self, lines):
+        self.write_block("\n".join(lines))
+
+    def write_rows(self, kind, rows):
+        tpl = self.templates[kind]
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.chunk_rows:
+                self.bytes_written += self._fh.write(tpl.render_rows(chunk))
+                chunk = []
+        if chunk:
+            self.bytes_written += self._fh.write(tpl.render_rows(chunk))
+
+    def close(self):
+        if self._own:
+            self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS SHARDED EXTRACTOR – one huge design, objects split over AEDT sessions
+  • every shard job opens its own copy of the project (temp folder → no
+    project lock, the original is never written) in a pool session
+    (aedt_pool.SessionPool) and lists the objects with one
+    GetMatchedObjectName("*") – same project, same order in every session
+  • partition (--mode):
+      hash   : blake2b(name) mod N        – even counts, no geometry needed
+      region : slabs along the longest model axis, an object belongs to the
+               slab holding its bbox centre – neighbours stay together; every
+               session reads all bboxes, the heavy calls only for its slab
+  • shard 0 also collects the non-object sections (variables, materials,
+    boundaries, setups, …) – every other shard only fetches objects
+  • merge is deterministic: objects are ordered by their listing index, so
+    the dump (and its digests) do not depend on which session finished first;
+    a missing shard, a listing that differs between sessions or a name
+    extracted twice fails the merge (listings are compared by count and by a
+    digest of the sorted names, so a rename between sessions is caught too)
+
+Outputs
+  • <out_dir>/HFSS_Extract_<project>_<design>_<ts>.json  (united.py layout)
+  • <out_dir>/<…>.shard<k>.json – per-shard results, removed after the merge
+
+Examples
+--------
+  python shard_extract.py big.aedt -d HFSSDesign1 -n 6
+  python shard_extract.py big.aedt -d HFSSDesign1 -n 4 --mode region -v 2024.2
+"""
+import os, json, shutil, hashlib, tempfile, argparse
+from datetime import datetime
+
+from aedt_pool import Job, SessionPool
+from extract_pipeline import fetch_object, normalize_object, SectionSpool, save_dump
+from dump_digest import add_digests, DIGEST_FIELDS, merkle_root
+from dump_schema import SCHEMA_VERSION
+from extract_sections import collect_sections
+
+MODES = ("hash", "region")
+
+
+# ───────── partitioning ───────── #
+def shard_of(name, shards):
+    """stable across processes and runs (unlike hash())"""
+    h = hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(h, "big") % shards
+
+
+def region_slabs(model_bbox, shards):
+    """model bbox → (axis, [edge_0 … edge_N]) – N equal slabs on the longest axis"""
+    lo, hi = [float(v) for v in model_bbox[:3]], [float(v) for v in model_bbox[3:6]]
+    axis = max(range(3), key=lambda i: hi[i] - lo[i])
+    step = (hi[axis] - lo[axis]) / shards
+    return axis, [lo[axis] + k * step for k in range(shards)] + [hi[axis]]
+
+
+def slab_of(bbox, axis, edges):
+    """bbox centre → slab index; outside / missing bbox → slab 0"""
+    try:
+        c = 0.5 * (float(bbox[axis]) + float(bbox[axis + 3]))
+    except (TypeError, ValueError, IndexError):
+        return 0
+    for k in range(len(edges) - 2, -1, -1):
+        if c >= edges[k]:
+            return k
+    return 0
+
+
+def listing_digest(names):
+    """order-free fingerprint of a GetMatchedObjectName("*") listing"""
+    h = hashlib.blake2b(digest_size=16)
+    for n in sorted(names):
+        h.update(n.encode("utf-8") + b"\x00")
+    return h.hexdigest()
+
+
+# ───────── job executed inside a pool session ───────── #
+def extract_shard(desktop, project, design, shard, shards, output, mode="hash",
+                  version=None):
+    """Objects of one shard → <output> (JSON); returns the path."""
+    from pyaedt import Hfss
+    from material_library import extract_material_library, material_table
+
+    tmp = tempfile.mkdtemp(prefix=f"shard{shard}_")
+    copy = os.path.join(tmp, os.path.basename(project))
+    shutil.copy2(project, copy)                    # private copy → no lock clash
+    hfss = Hfss(projectname=copy, designname=design, specified_version=version,
+                new_desktop=False, close_on_exit=False)
+    try:
+        mdl = hfss.modeler
+        names = list(mdl.oeditor.GetMatchedObjectName("*"))
+        _, mat_index = material_table(extract_material_library(hfss))
+        region = None
+        if mode == "region":                       # bbox call decides, before the rest
+            axis, edges = region_slabs(mdl.get_model_bounding_box(), shards)
+            region = lambda bb: slab_of(bb, axis, edges) == shard
+        by_name = getattr(mdl, "objects_by_name", None) or {}
+
+        objects = []
+        for i, name in enumerate(names):
+            if mode == "hash" and shard_of(name, shards) != shard:
+                continue                           # never fetched here
+            raw = fetch_object(mdl, name, by_name.get(name), strict=True, region=region)
+            if raw is None:
+                continue
+            objects.append([i] + list(normalize_object(raw, mat_index)))
+
+        result = {"shard": shard, "shards": shards, "mode": mode,
+                  "listed": len(names), "listing": listing_digest(names),
+                  "objects": objects}
+        if shard == 0:
+            result["sections"] = collect_sections(hfss)
+            result["release"] = getattr(desktop, "aedt_version_id", None)
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, default=str)
+        return output
+    finally:
+        try:
+            desktop.odesktop.CloseProject(hfss.project_name)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+# ───────── merge ───────── #
+def merge_shards(paths, project, design, out_path, ts=None):
+    """shard files → one dump; ordering and digests independent of timing"""
+    parts = []
+    for p in paths:
+        with open(p, "r", encoding="utf-8") as f:
+            parts.append(json.load(f))
+    parts.sort(key=lambda r: r["shard"])
+    shards = parts[0]["shards"] if parts else 0
+    if [r["shard"] for r in parts] != list(range(shards)):
+        raise RuntimeError(f"incomplete shard set: {[r['shard'] for r in parts]} of {shards}")
+    if len({(r["listed"], r.get("listing")) for r in parts}) > 1:
+        raise RuntimeError("sessions listed different object sets – project changed?")
+
+    rows = sorted((row for r in parts for row in r["objects"]),
+                  key=lambda row: (row[0], row[1]))
+    seen = set()
+    for _, name, _ in rows:
+        if name in seen:
+            raise RuntimeError(f"object {name!r} extracted by two shards")
+        seen.add(name)
+
+    base = parts[0]
+    data = {"meta": {"timestamp": ts or datetime.now().strftime("%Y%m%d_%H%M%S"),
+                     "project": os.path.splitext(os.path.basename(project))[0],
+                     "design": design, "aedt_version": base.get("release"),
+                     "schema": SCHEMA_VERSION,
+                     "shards": {"count": shards, "mode": base["mode"],
+                                "objects": [len(r["objects"]) for r in parts]}}}
+    sections = base.get("sections") or {}
+    for key in ("variables", "materials", "material_library"):
+        if key in sections:
+            data[key] = sections[key]
+    data["objects"] = {name: entry["digest"] for _, name, entry in rows}
+    for key in ("analysis_setups", "coord_systems", "mesh_ops", "reports",
+                "history", "boundaries", "excitations"):
+        if key in sections:
+            data[key] = sections[key]
+
+    roots = add_digests(data, {k: v for k, v in DIGEST_FIELDS.items() if k != "objects"})
+    roots["objects"] = merkle_root(data["objects"])
+    with SectionSpool(out_path + ".objects.part") as spool:
+        for _, name, entry in rows:
+            spool.write((name, entry))
+        save_dump(data, out_path, {"objects": spool})
+    return out_path, len(rows)
+
+
+def main():
+    cli = argparse.ArgumentParser(description="Extract one large design over several AEDT sessions")
+    cli.add_argument("project", help=".aedt file (opened as a private copy per shard)")
+    cli.add_argument("-d", "--design", required=True, help="design name")
+    cli.add_argument("-n", "--sessions", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                     help="shards = parallel AEDT sessions (≈ licences available)")
+    cli.add_argument("-m", "--mode", choices=MODES, default="hash",
+                     help="partition by name hash or by spatial slab")
+    cli.add_argument("-o", "--out-dir", default=".", help="output folder")
+    cli.add_argument("-v", "--version", help="AEDT version, e.g. 2024.2")
+    cli.add_argument("--retries", type=int, default=1, help="retries per shard")
+    cli.add_argument("--timeout", type=float, help="seconds per shard")
+    cli.add_argument("--keep-shards", action="store_true", help="keep the shard files")
+    args = cli.parse_args()
+
+    project = os.path.abspath(args.project)
+    if not os.path.isfile(project):
+        raise FileNotFoundError(project)
+    out_dir = os.path.abspath(args.out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    stem = os.path.splitext(os.path.basename(project))[0]
+    out_path = os.path.join(out_dir, f"HFSS_Extract_{stem}_{args.design}_{ts}.json")
+
+    n = max(1, args.sessions)
+    jobs = [Job(f"shard{k}", "shard_extract:extract_shard",
+                {"project": project, "design": args.design, "shard": k, "shards": n,
+                 "mode": args.mode, "version": args.version,
+                 "output": f"{out_path[:-5]}.shard{k}.json"},
+                cost=2.0 if k == 0 else 1.0, timeout=args.timeout)
+            for k in range(n)]
+
+    def log(rec):
+        mark = "✓" if rec["status"] == "ok" else "❌"
+        print(f'{mark} {rec["job"]}  session {rec["session"]}  '
+              f'try {rec["attempt"]}  {rec["seconds"]:.1f}s')
+
+    print(f"→ {stem}/{args.design}: {n} shards ({args.mode}) over {n} AEDT sessions")
+    pool = SessionPool(n, version=args.version, retries=args.retries, on_result=log)
+    results = pool.run(jobs)
+    failed = [j for j, r in results.items() if r["status"] != "ok"]
+    if failed:
+        raise RuntimeError("shards failed: " + ", ".join(failed))
+
+    paths = [results[j.job_id]["value"] for j in jobs]
+    path, count = merge_shards(paths, project, args.design, out_path, ts)
+    if not args.keep_shards:
+        for p in paths:
+            os.remove(p)
+    print(f"✅  {count} objects from {n} shards → {path}")
+
+
+if __name__ == "__main__":
+    main()
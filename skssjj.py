@@ -4,8 +4,9 @@ import os, json, csv
 from datetime import datetime
 from pyaedt import Desktop, Hfss
 
-# nothing to configure except optional CSV flag
+# nothing to configure except optional CSV / watch flags
 EXPORT_CSV = True
+WATCH      = False                            # True → live dump until Ctrl+C
 
 ts = datetime.now().strftime("%Y%m%d_%H%M%S")
 d  = Desktop(new_desktop=False)               # attach to running AEDT
@@ -92,5 +93,9 @@ if EXPORT_CSV:
         csv.writer(f).writerows([["Variable", "Value"], *vars_dict.items()])
     print("CSV  →", base + "_variables.csv")
 
+if WATCH:                                     # re-extract changed entities after edits
+    from watch_extract import watch
+    watch(hfss)
+
 hfss.release_desktop(close_projects=False, close_desktop=False)
 print("✅  Extraction complete.")
\ No newline at end of file
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS SOLUTION STORE – S / Y / Z matrices of every setup + sweep on disk
+  • AEDT writes each solution once with ExportNetworkData() (full precision,
+    RI format); PyAEDT export_touchstone() is the S-only fallback
+  • the Touchstone text is parsed as a token stream and written in frequency
+    chunks – the whole matrix set is never held in memory
+  • columnar raw store, one directory per <setup>__<sweep>__<param>:
+        meta.json   ports, z0, count, dtype, shape
+        freq.f64    float64 [n]                (Hz)
+        data.c128   complex128 [n, ports, ports]
+  • SolutionReader memory-maps both columns (numpy.memmap) and hands out
+    frequency slices; write_touchstone() streams a store back to *.sNp
+
+Usage
+-----
+    index = export_solutions(hfss, "solutions")      # {key: meta}
+    r = SolutionReader("solutions/Setup1__Sweep__S")
+    s21 = r.data[:, 1, 0]                            # no full load
+"""
+import os, io, re, json, math, cmath, tempfile
+from array import array
+
+try:                                    # optional – memory-mapped reader
+    import numpy as _np
+except ImportError:                     # pragma: no cover
+    _np = None
+
+CHUNK_FREQS = 1024
+_UNITS = {"HZ": 1.0, "KHZ": 1e3, "MHZ": 1e6, "GHZ": 1e9, "THZ": 1e12}
+_SAFE = re.compile(r"[^\w.-]+")
+
+
+# ───────── Touchstone parsing ───────── #
+def _to_complex(a, b, fmt):
+    if fmt == "RI":
+        return complex(a, b)
+    mag = a if fmt == "MA" else 10.0 ** (a / 20.0)
+    return cmath.rect(mag, math.radians(b))
+
+
+def _ports_from_name(path):
+    m = re.search(r"\.s(\d+)p$", path, re.I)
+    return int(m.group(1)) if m else None
+
+
+def iter_touchstone(path, ports=None, chunk=CHUNK_FREQS):
+    """
+    Stream a Touchstone v1 file.
+    yields (header, freqs[Hz] list, matrices list) per *chunk* frequencies;
+    each matrix is a flat row-major list of ports² complex values.
+    """
+    ports = ports or _ports_from_name(path)
+    header = {"param": "S", "format": "MA", "unit": 1e9, "z0": 50.0,
+              "ports": ports, "port_names": []}
+    width = None
+    freqs, mats, tokens = [], [], []
+    with io.open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("!"):
+                m = re.match(r"!\s*Port\[(\d+)\]\s*=\s*(.+)", line)
+                if m:
+                    header["port_names"].append(m.group(2).strip())
+                continue
+            if line.startswith("#"):
+                opts = line[1:].upper().split()
+                for i, o in enumerate(opts):
+                    if o in _UNITS:
+                        header["unit"] = _UNITS[o]
+                    elif o in ("S", "Y", "Z", "G", "H"):
+                        header["param"] = o
+                    elif o in ("MA", "DB", "RI"):
+                        header["format"] = o
+                    elif o == "R" and i + 1 < len(opts):
+                        header["z0"] = float(opts[i + 1])
+                continue
+            if width is None:
+                if header["ports"] is None:
+                    header["ports"] = len(header["port_names"]) or 1
+                n = header["ports"]
+                width = 1 + 2 * n * n
+            tokens.extend(float(t) for t in line.split("!")[0].split())
+            while len(tokens) >= width:
+                rec, tokens = tokens[:width], tokens[width:]
+                n, fmt = header["ports"], header["format"]
+                vals = [_to_complex(rec[1 + 2 * k], rec[2 + 2 * k], fmt)
+                        for k in range(n * n)]
+                if n == 2:                          # v1 2-port is column-major
+                    vals = [vals[0], vals[2], vals[1], vals[3]]
+                freqs.append(rec[0] * header["unit"])
+                mats.append(vals)
+                if len(freqs) >= chunk:
+                    yield header, freqs, mats
+                    freqs, mats = [], []
+    if freqs or width is None:
+        yield header, freqs, mats
+
+
+# ───────── columnar store ───────── #
+class SolutionWriter(object):
+    """Appends frequency chunks to the freq / data columns of one store."""
+
+    def __init__(self, path, ports, param="S", z0=50.0, port_names=None):
+        os.makedirs(path, exist_ok=True)
+        self.path, self.count = path, 0
+        self.meta = {"param": param, "ports": ports, "z0": z0,
+                     "port_names": list(port_names or []),
+                     "dtype": {"freq": "<f8", "data": "<c16"},
+                     "shape": [0, ports, ports]}
+        self._freq = open(os.path.join(path, "freq.f64"), "wb")
+        self._data = open(os.path.join(path, "data.c128"), "wb")
+
+    def append(self, freqs, mats):
+        array("d", freqs).tofile(self._freq)
+        flat = array("d")
+        for m in mats:
+            for c in m:
+                flat.append(c.real)
+                flat.append(c.imag)
+        flat.tofile(self._data)
+        self.count += len(freqs)
+
+    def close(self):
+        self._freq.close()
+        self._data.close()
+        self.meta["count"] = self.count
+        self.meta["shape"][0] = self.count
+        with open(os.path.join(self.path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(self.meta, f, indent=2)
+        return self.meta
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def touchstone_to_store(ts_path, store_path, ports=None, chunk=CHUNK_FREQS):
+    """*.sNp → columnar store, chunk by chunk; → meta"""
+    w = None
+    for header, freqs, mats in iter_touchstone(ts_path, ports, chunk):
+        if w is None:
+            w = SolutionWriter(store_path, header["ports"], header["param"],
+                               header["z0"], header["port_names"])
+        if freqs:
+            w.append(freqs, mats)
+    return w.close() if w is not None else None
+
+
+class SolutionReader(object):
+    """Memory-mapped view of one store: .freq [n], .data [n, p, p]."""
+
+    def __init__(self, path):
+        if _np is None:
+            raise ImportError("numpy is required for SolutionReader")
+        with open(os.path.join(path, "meta.json"), "r", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        n, p = self.meta["count"], self.meta["ports"]
+        self.ports, self.param, self.z0 = p, self.meta["param"], self.meta["z0"]
+        if n:
+            self.freq = _np.memmap(os.path.join(path, "freq.f64"), "<f8", "r", shape=(n,))
+            self.data = _np.memmap(os.path.join(path, "data.c128"), "<c16", "r",
+                                   shape=(n, p, p))
+        else:
+            self.freq = _np.zeros(0)
+            self.data = _np.zeros((0, p, p), complex)
+
+    def __len__(self):
+        return len(self.freq)
+
+    def chunks(self, size=CHUNK_FREQS):
+        """yields (freq slice, data slice) views – still memory-mapped"""
+        for i in range(0, len(self), size):
+            yield self.freq[i:i + size], self.data[i:i + size]
+
+
+def write_touchstone(store_path, out_path, fmt="RI", chunk=CHUNK_FREQS):
+    """Stream a store back to Touchstone v1 (Hz, RI/MA/DB)."""
+    r = SolutionReader(store_path)
+    p = r.ports
+    with io.open(out_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        for i, name in enumerate(r.meta.get("port_names") or [], 1):
+            f.write("! Port[%d] = %s\n" % (i, name))
+        f.write("# HZ %s %s R %.12g\n" % (r.param, fmt, r.z0))
+        for fr, d in r.chunks(chunk):
+            if p == 2:
+                d = d.transpose(0, 2, 1)
+            d = d.reshape(len(fr), -1)
+            if fmt == "RI":
+                a, b = d.real, d.imag
+            else:
+                mag = _np.abs(d)
+                a = mag if fmt == "MA" else 20.0 * _np.log10(_np.maximum(mag, 1e-300))
+                b = _np.degrees(_np.angle(d))
+            pairs = _np.empty((len(fr), 2 * p * p))
+            pairs[:, 0::2], pairs[:, 1::2] = a, b
+            # v1 layout: 2-port on one line, else each matrix row on its own
+            # line(s) with at most four pairs per line
+            row_len = 2 * p * p if p <= 2 else 2 * p
+            for k in range(len(fr)):
+                rec, lines = pairs[k], []
+                for r0 in range(0, len(rec), row_len):
+                    row = rec[r0:r0 + row_len]
+                    lines += [" ".join("%.15g" % v for v in row[j:j + 8])
+                              for j in range(0, len(row), 8)]
+                f.write("%.15g %s\n" % (fr[k], "\n  ".join(lines)))
+    return out_path
+
+
+# ───────── AEDT export ───────── #
+def _export_network_data(hfss, solution, param, path):
+    hfss.odesign.ExportNetworkData("", [solution], 3, path, ["All"], False, 50,
+                                   param, -1, 1, 15, False, False, False)
+
+
+def export_solutions(hfss, root, params=("S", "Y", "Z"), chunk=CHUNK_FREQS):
+    """
+    Every setup / sweep of *hfss* → <root>/<setup>__<sweep>__<param>/
+    → {"<setup> : <sweep>/<param>": meta}  (stored in the dump as "solutions")
+    """
+    os.makedirs(root, exist_ok=True)
+    tmp = tempfile.mkdtemp(prefix="hfss_sol_")
+    index = {}
+    for s in hfss.setups:
+        for sw in getattr(s, "sweeps", []) or []:
+            solution = "%s : %s" % (s.name, sw.name)
+            for param in params:
+                ts = os.path.join(tmp, "%s_%s_%s.sNp" % (_SAFE.sub("_", s.name),
+                                                        _SAFE.sub("_", sw.name), param))
+                try:
+                    _export_network_data(hfss, solution, param, ts)
+                except Exception as e:
+                    if param != "S":
+                        print(f"⚠ {solution}: {param} export failed – {e}")
+                        continue
+                    try:
+                        ts = hfss.export_touchstone(s.name, sw.name, ts) or ts
+                    except Exception as e2:
+                        print(f"⚠ {solution}: no solution data – {e2}")
+                        break
+                ts = _find_export(ts)
+                if ts is None:
+                    continue
+                store = os.path.join(root, _SAFE.sub("_", "%s__%s__%s" % (s.name, sw.name, param)))
+                meta = touchstone_to_store(ts, store, chunk=chunk)
+                os.remove(ts)
+                if meta:
+                    meta["path"] = os.path.relpath(store, root)
+                    index[solution + "/" + param] = meta
+                    print(f"✓ {solution} {param}: {meta['count']} freqs × {meta['ports']} ports")
+    try:
+        os.rmdir(tmp)
+    except OSError:
+        pass
+    return index
+
+
+def _find_export(path):
+    """AEDT replaces the .sNp extension by the real port count"""
+    if os.path.isfile(path):
+        return path
+    base, d = os.path.splitext(os.path.basename(path))[0], os.path.dirname(path)
+    for f in os.listdir(d):
+        if os.path.splitext(f)[0] == base and _ports_from_name(f):
+            return os.path.join(d, f)
+    return None
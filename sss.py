@@ -6,18 +6,48 @@ Creates
   • HFSS_Extract_<project>_<design>_<timestamp>_variables.csv
 """
 
-import os, json, csv
+import os, sys, json, csv
 from datetime import datetime
 from pyaedt import Desktop, Hfss
 
+from extract_cache import ExtractionCache
+
 # ───────────── USER OPTIONS ───────────── #
 PROJECT_PATH = None        # r"C:\path\file.aedt"  or None → attach to open
 DESIGN_NAME  = None        # "MyDesign"            or None → active design
 AEDT_VERSION = None        # "2024.2"              or None
 EXPORT_CSV   = True
+USE_CACHE    = True        # needs PROJECT_PATH + DESIGN_NAME
 # ───────────────────────────────────────── #
 
 ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+# ───────── output writer (shared by cache hit + fresh extraction) ───────── #
+def save(data):
+    meta = data["meta"]
+    base = f"HFSS_Extract_{meta['project']}_{meta['design']}_{ts}"
+    with open(base + ".json", "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    print("JSON  →", base + ".json")
+
+    if EXPORT_CSV:
+        with open(base + "_variables.csv", "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f); w.writerow(["Variable", "Value"])
+            for k, v in data["variables"].items(): w.writerow([k, v])
+        print("CSV   →", base + "_variables.csv")
+
+# 0 ▪ extraction cache – unchanged project file + design → no AEDT at all
+cache = cache_key = None
+if USE_CACHE and PROJECT_PATH and DESIGN_NAME and os.path.isfile(PROJECT_PATH):
+    cache = ExtractionCache()
+    cache_key = cache.key(PROJECT_PATH, DESIGN_NAME, "sss")
+    cached = cache.load(cache_key)
+    if cached is not None:
+        cached["meta"]["served_from_cache"] = ts
+        save(cached)
+        print("✅  Served from cache (project file unchanged).")
+        sys.exit(0)
+
 desktop = Desktop(specified_version=AEDT_VERSION, new_desktop=False)
 
 # 1 ▪ project -------------------------------------------------------------
@@ -120,16 +150,10 @@ data = {
 data["boundaries"], data["excitations"] = grab_bounds_ports()
 
 # ───────── save ───────── #
-base = f"HFSS_Extract_{hfss.project_name}_{hfss.design_name}_{ts}"
-with open(base + ".json", "w", encoding="utf-8") as f:
-    json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-print("JSON  →", base + ".json")
-
-if EXPORT_CSV:
-    with open(base + "_variables.csv", "w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f); w.writerow(["Variable", "Value"])
-        for k, v in data["variables"].items(): w.writerow([k, v])
-    print("CSV   →", base + "_variables.csv")
+if cache is not None:
+    if not cache.store(cache_key, json.loads(json.dumps(data, default=str))):
+        print("⚠ dump larger than the cache limit – not cached")
+save(data)
 
 hfss.release_desktop(close_projects=False, close_desktop=False)
 print("✅  Extraction complete.")
\ No newline at end of file
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS TELEMETRY – live counters of a running extraction
+  • progress (done / total / rate / ETA) of every extract_log.Progress,
+    free counters (incr), gauges (callables, e.g. bytes written) and
+    per-section wall times (with tele.section("objects"): …)
+  • served as JSON on http://127.0.0.1:<port>/status (stdlib http.server,
+    daemon thread, localhost only)
+  • and rewritten atomically every *interval* seconds to a status file –
+    the batch scheduler polls either one
+  • "idle_s" = seconds since any counter last moved → stall detection
+
+Usage
+-----
+    with Telemetry(status_path=base + ".status.json", port=8765) as tele:
+        with tele.section("objects"):
+            …
+        tele.incr("rpc_calls", 7)
+"""
+import os, json, time, threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from extract_log import PROGRESS
+
+
+class Telemetry(object):
+    """Snapshot source + optional HTTP endpoint + optional status file."""
+
+    def __init__(self, status_path=None, port=None, interval=2.0, meta=None):
+        self.status_path, self.port, self.interval = status_path, port, interval
+        self.meta = dict(meta or {})
+        self.started, self._mono0 = time.time(), time.monotonic()
+        self.state = "running"
+        self.counters, self.gauges, self.sections = {}, {}, {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._last_sig, self._last_move = None, time.monotonic()
+        self._server = self._thread = None
+
+    # ───────── recording ───────── #
+    def incr(self, name, n=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def gauge(self, name, fn):
+        """fn() → number, evaluated at every snapshot"""
+        self.gauges[name] = fn
+
+    @contextmanager
+    def section(self, name):
+        t0 = time.time()
+        self.sections[name] = {"start": t0, "seconds": None}
+        try:
+            yield
+        finally:
+            self.sections[name]["seconds"] = round(time.time() - t0, 3)
+
+    # ───────── snapshot ───────── #
+    def snapshot(self):
+        now = time.time()
+        progress = {}
+        for label, p in list(PROGRESS.items()):
+            if p.start < self._mono0:
+                continue                      # bars from before this run
+            eta = p.eta
+            progress[label] = {"done": p.done, "total": p.total,
+                               "rate_per_s": round(p.rate, 2),
+                               "eta_s": round(eta, 1) if eta is not None else None,
+                               "finished": p.finished is not None}
+        with self._lock:
+            counters = dict(self.counters)
+        gauges = {}
+        for k, fn in self.gauges.items():
+            try:
+                gauges[k] = fn()
+            except Exception:
+                gauges[k] = None
+        sig = (tuple(sorted((k, v["done"]) for k, v in progress.items())),
+               tuple(sorted(counters.items())),
+               tuple(sorted((k, v) for k, v in gauges.items() if isinstance(v, (int, float)))))
+        if sig != self._last_sig:
+            self._last_sig, self._last_move = sig, time.monotonic()
+        elapsed = now - self.started
+        return {"state": self.state, "pid": os.getpid(), "meta": self.meta,
+                "started": self.started, "updated": now,
+                "elapsed_s": round(elapsed, 1),
+                "idle_s": round(time.monotonic() - self._last_move, 1),
+                "progress": progress, "counters": counters,
+                "rates_per_s": {k: round(v / elapsed, 2) if elapsed > 0 else 0.0
+                                for k, v in counters.items()},
+                "gauges": gauges, "sections": dict(self.sections)}
+
+    # ───────── outputs ───────── #
+    def write_status(self):
+        if not self.status_path:
+            return
+        tmp = f"{self.status_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2, default=str)
+        os.replace(tmp, self.status_path)
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.write_status()
+            except OSError:
+                pass
+
+    def _serve(self):
+        tele = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/") not in ("", "/status"):
+                    self.send_error(404)
+                    return
+                body = json.dumps(tele.snapshot(), default=str).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):      # keep the console quiet
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def start(self):
+        if self.port is not None:
+            self._serve()
+            print(f"✓ telemetry: http://127.0.0.1:{self.port}/status")
+        if self.status_path:
+            self.write_status()
+            self._thread = threading.Thread(target=self._loop, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, state="finished"):
+        self.state = state
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        try:
+            self.write_status()
+        except OSError:
+            pass
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, *exc):
+        self.stop("failed" if exc_type else "finished")
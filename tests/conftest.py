@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+import os, sys
+
+# the extractor modules live flat in the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""SessionPool with real worker processes; Desktop comes from a throwaway
+pyaedt module written to tmp_path (the workers only need Desktop())."""
+import sys
+import time
+
+import pytest
+
+from aedt_pool import Job, SessionPool
+
+FAKE_PYAEDT = '''
+class Desktop(object):
+    def __init__(self, **kw):
+        pass
+
+    def release_desktop(self, **kw):
+        pass
+'''
+
+JOBS = '''
+import time
+
+def sleep_then(desktop, seconds, value):
+    time.sleep(seconds)
+    return value
+'''
+
+
+@pytest.fixture
+def fake_env(tmp_path, monkeypatch):
+    (tmp_path / "pyaedt.py").write_text(FAKE_PYAEDT)
+    (tmp_path / "pool_jobs.py").write_text(JOBS)
+    monkeypatch.syspath_prepend(str(tmp_path))       # spawn children inherit sys.path
+    yield
+    for m in ("pyaedt", "pool_jobs"):
+        sys.modules.pop(m, None)
+
+
+def test_jobs_complete(fake_env):
+    jobs = [Job(f"j{i}", "pool_jobs:sleep_then", {"seconds": 0, "value": i})
+            for i in range(4)]
+    res = SessionPool(2, retries=0).run(jobs)
+    assert {k: r["value"] for k, r in res.items()} == {f"j{i}": i for i in range(4)}
+    assert all(r["status"] == "ok" for r in res.values())
+
+
+def test_late_reply_after_timeout_is_dropped(fake_env):
+    # "slow" times out on its first try; its session is killed while it is
+    # still working, so whatever that session would send back is ignored and
+    # the retry result is the one reported
+    seen = []
+    jobs = [Job("slow", "pool_jobs:sleep_then", {"seconds": 4, "value": "late"},
+                timeout=1.5),
+            Job("fast", "pool_jobs:sleep_then", {"seconds": 0, "value": "ok"})]
+    t0 = time.time()
+    res = SessionPool(1, retries=1, on_result=seen.append).run(jobs)
+    assert res["fast"]["value"] == "ok"
+    assert res["slow"]["status"] == "timeout"
+    assert [r["status"] for r in seen if r["job"] == "slow"] == ["timeout", "timeout"]
+    assert time.time() - t0 < 60
+
+
+def test_stale_messages_are_ignored(fake_env):
+    pool = SessionPool(1, retries=0)
+    # a "done" from an earlier generation of slot 0 and one for a job the
+    # slot is not running – neither may be credited or crash the loop
+    pool._outbox.put(("done", 0, -1, {"job": "a", "attempt": 1, "status": "ok",
+                                      "value": "stale", "error": None, "seconds": 0}))
+    pool._outbox.put(("done", 0, 0, {"job": "other", "attempt": 3, "status": "ok",
+                                     "value": "stale", "error": None, "seconds": 0}))
+    res = pool.run([Job("a", "pool_jobs:sleep_then", {"seconds": 0.5, "value": "fresh"})])
+    assert res["a"]["value"] == "fresh"
+
+
+def test_duplicate_job_ids_raise_instead_of_hanging():
+    jobs = [Job("x", "pool_jobs:sleep_then", {"seconds": 0, "value": i}) for i in range(2)]
+    with pytest.raises(ValueError, match="duplicate job ids: x"):
+        SessionPool(1).run(jobs)
+
+
+def test_rebuild_jobs_unique_per_stem(tmp_path):
+    from batch_rebuild import make_jobs
+    dumps = []
+    for d in ("a", "b"):
+        (tmp_path / d).mkdir()
+        dumps.append(str(tmp_path / d / "x.json"))
+        (tmp_path / d / "x.json").write_text("{}")
+    jobs = make_jobs(dumps, str(tmp_path / "out"))
+    assert [j.job_id for j in jobs] == ["x", "x#2"]
+    outs = [j.kwargs["output"] for j in jobs]
+    assert len(set(outs)) == 2 and outs[1].endswith("x_2_rebuilt.aedt")
+
+
+def _manifest(tmp_path, doc):
+    import json
+    (tmp_path / "m.json").write_text(json.dumps(doc))
+    return str(tmp_path / "m.json")
+
+
+def test_manifest_merges_entries_for_the_same_project(tmp_path):
+    from batch_extract import read_manifest, make_jobs
+    (tmp_path / "sub").mkdir()
+    entries = read_manifest(_manifest(tmp_path, {"jobs": [
+        {"project": "a.aedt", "design": "D1", "priority": 1},
+        {"project": "sub/../a.aedt", "designs": ["D2", "D1"], "priority": 5},
+        {"project": "b.aedt", "design": "D1"},
+        {"project": "./b.aedt"}]}))
+    assert [e["designs"] for e in entries] == [["D1", "D2"], None]
+    assert entries[0]["priority"] == 5
+    jobs = make_jobs(entries, str(tmp_path / "out"))
+    assert [j.job_id for j in jobs] == ["a", "b"]
+
+
+def test_manifest_rejects_same_project_with_different_filters(tmp_path):
+    from batch_extract import read_manifest
+    with pytest.raises(ValueError, match="listed twice"):
+        read_manifest(_manifest(tmp_path, [{"project": "a.aedt", "sections": ["objects"]},
+                                           {"project": "a.aedt"}]))
+
+
+def test_same_stem_projects_get_their_own_folder(tmp_path):
+    from batch_extract import read_manifest, make_jobs
+    entries = read_manifest(_manifest(tmp_path, ["x/a.aedt", "y/a.aedt"]))
+    jobs = make_jobs(entries, str(tmp_path / "out"))
+    assert [j.job_id for j in jobs] == ["a", "a#2"]
+    assert "folder" not in jobs[0].kwargs and jobs[1].kwargs["folder"] == "a_2"
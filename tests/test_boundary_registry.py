@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+from boundary_registry import props_to_args, lookup
+
+
+def test_scalars_and_nested_dicts():
+    assert props_to_args({"Faces": [1, 2], "Modes": {"Mode1": {"ModeNum": 1}}}) == \
+        ["Faces:=", [1, 2], ["NAME:Modes", ["NAME:Mode1", "ModeNum:=", 1]]]
+
+
+def test_list_items_get_their_own_names():
+    args = props_to_args({"Terminals": [{"Name": "T1", "Ref": "A"}, {"Ref": "B"}]})
+    assert args == [["NAME:Terminals", ["NAME:T1", "Ref:=", "A"],
+                     ["NAME:Terminals2", "Ref:=", "B"]]]
+
+
+def test_lookup_ignores_case_and_spaces():
+    assert lookup("wave port")[0] == "AssignWavePort"
+    assert lookup("PEC")[0] == "AssignPerfectE"
+    assert lookup("no such type") is None
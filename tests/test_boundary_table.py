@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+from boundary_table import split_name_type_pairs
+
+
+def test_flat_pairs_split_by_position():
+    flat = ["Rad1", "Radiation", "P1", "Wave Port"]
+    assert split_name_type_pairs(flat) == {"Rad1": "Radiation", "P1": "Wave Port"}
+
+
+def test_unknown_type_does_not_turn_pairs_into_names():
+    flat = ["M1", "Primary", "S1", "Secondary", "Rad1", "Radiation"]
+    assert split_name_type_pairs(flat) == {"M1": "Primary", "S1": "Secondary",
+                                           "Rad1": "Radiation"}
+
+
+def test_plain_name_lists():
+    assert split_name_type_pairs(["a", "b", "c"]) == {"a": None, "b": None, "c": None}
+    assert split_name_type_pairs(["a", "b"]) == {"a": None, "b": None}
+    assert split_name_type_pairs(None) == {}
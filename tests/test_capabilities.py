@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from capabilities import (CapabilityProbe, CapabilityError, COM_OBJECT_LIST_STRATEGIES,
+                          COM_HISTORY_STRATEGIES)
+
+
+def _table(calls):
+    def old(x):
+        calls.append("old")
+        raise AttributeError("gone in this release")
+
+    def new(x):
+        calls.append("new")
+        return x * 2
+    return (("old", old), ("new", new))
+
+
+def test_persisted_path_is_verified_before_bind(tmp_path):
+    path = str(tmp_path / "caps.json")
+    calls = []
+    first = CapabilityProbe("2024.2", path)
+    first.resolved["double"] = "old"                 # stale entry from another install
+    first._persist()
+
+    probe = CapabilityProbe("2024.2", path)
+    fn = probe.bind("double", _table(calls), 3)
+    assert fn(4) == 8 and calls == ["old", "old", "new", "new"]
+    assert CapabilityProbe("2024.2", path).resolved["double"] == "new"
+
+
+def test_verified_path_is_not_retried(tmp_path):
+    calls = []
+    probe = CapabilityProbe("2024.2", str(tmp_path / "caps.json"))
+    probe.bind("double", _table(calls), 1)
+    del calls[:]
+    probe.bind("double", _table(calls), 1)
+    assert calls == []
+
+
+def test_call_reprobes_and_raises_when_nothing_works(tmp_path):
+    probe = CapabilityProbe("x", str(tmp_path / "caps.json"))
+    assert probe.call("double", _table([]), 5) == 10
+    with pytest.raises(CapabilityError):
+        probe.call("broken", (("a", lambda: 1 / 0),))
+
+
+class _Editor(object):
+    def GetMatchedObjectName(self, pattern):
+        return ["Box1", "Group1", "Sheet1"]
+
+    def GetObjectsInGroup(self, group):
+        return {"Solids": ["Box1"], "UnClassified": []}[group]
+
+
+def test_com_object_list_stays_on_model_groups(tmp_path):
+    probe = CapabilityProbe("x", str(tmp_path / "caps.json"))
+    assert probe.call("object_list", COM_OBJECT_LIST_STRATEGIES, _Editor()) == ["Box1"]
+
+
+def test_history_falls_back_to_command_tab(tmp_path):
+    class OldEditor(object):                         # no GetChildObject
+        def GetProperties(self, tab, item):
+            if item != "Cyl1:CreateCylinder:1":
+                raise RuntimeError("no such item")
+            return ["Command", "Radius"]
+
+    probe = CapabilityProbe("2019.1", str(tmp_path / "caps.json"))
+    history = probe.bind("object_history", COM_HISTORY_STRATEGIES, OldEditor(), "Cyl1")
+    assert history(OldEditor(), "Cyl1") == ["CreateCylinder:1"]
+    assert probe.resolved["object_history"] == "Geometry3DCmdTab"
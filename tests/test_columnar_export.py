@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from columnar_export import (ObjectColumns, object_columns, boundary_columns,
+                             variable_columns, export_tables)
+
+DUMP = {
+    "variables": {"w": "1.5mm", "n": "3", "expr": "w*2"},
+    "objects": {
+        "Box1": {"material": "copper", "material_id": 0, "primitive": "Box",
+                 "faces": [1, 2, 3, 4, 5, 6], "bounding_box": [0, 0, 0, 1, 1, 1]},
+        "Sheet1": {"material": "vacuum", "primitive": "Rectangle", "faces": [9],
+                   "bounding_box": {"x_min": 0, "y_min": 0, "z_min": 1,
+                                    "x_max": 2, "y_max": 2, "z_max": 1}},
+        "digest_only": "0" * 32,
+    },
+    "boundaries": {"PEC1": {"type": "Perfect E", "props": {"Faces": [1, 2]}}},
+    "excitations": {"P1": {"type": "Wave Port", "props": {"PortNum": "1", "Faces": [9]}}},
+}
+
+
+def test_object_columns_accept_list_and_dict_bbox():
+    cols = object_columns(DUMP["objects"])
+    assert cols["name"] == ["Box1", "Sheet1"]
+    assert cols["z_min"] == [0.0, 1.0] and cols["x_max"] == [1.0, 2.0]
+    assert cols["face_count"] == [6, 1] and cols["material_id"] == [0, None]
+
+
+def test_object_columns_as_pipeline_sink():
+    oc = ObjectColumns()
+    for pair in DUMP["objects"].items():
+        oc.write(pair)
+    assert oc.cols == object_columns(DUMP["objects"])
+
+
+def test_boundary_and_variable_columns():
+    b = boundary_columns(DUMP["boundaries"], DUMP["excitations"])
+    assert b["is_port"] == [False, True] and b["port_number"] == [None, 1]
+    assert b["face_count"] == [2, 1]
+    v = variable_columns(DUMP["variables"])
+    assert v["number"] == [1.5, 3.0, None] and v["unit"] == ["mm", None, None]
+
+
+def test_export_tables_round_trip(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    out = export_tables(DUMP, str(tmp_path / "dump"))
+    objects = pq.read_table(out["objects"]).to_pydict()
+    assert objects["name"] == ["Box1", "Sheet1"]
+    assert objects["face_count"] == [6, 1] and objects["material_id"] == [0, None]
+    ports = pq.read_table(out["boundaries"]).to_pydict()
+    assert ports["port_number"] == [None, 1]
+    assert pq.read_table(out["variables"]).num_rows == 3
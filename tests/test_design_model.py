@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import json
+import math
+
+import pytest
+
+import design_model
+from design_model import ObjectTable, load_design
+
+
+def _entry(**kw):
+    e = {"material": "copper", "primitive": "Box", "faces": [7, 8],
+         "bounding_box": [0, 0, 0, 1, 2, 3], "color": [255, 128, 0],
+         "digest": "ab" * 16}
+    e.update(kw)
+    return e
+
+
+def test_views_read_like_entries():
+    t = ObjectTable.from_dict({"A": _entry(material_id=4, params={"XSize": "1mm"}),
+                               "B": _entry(bounding_box={"x_min": 1, "x_max": 2},
+                                           color=None, digest=None, faces=[])})
+    a, b = t["A"], t["B"]
+    assert (a.material, a.material_id, a.primitive) == ("copper", 4, "Box")
+    assert a.bbox == (0, 0, 0, 1, 2, 3) and a.faces == (7, 8)
+    assert a.color == (255, 128, 0) and a.digest == "ab" * 16
+    assert a.params == {"XSize": "1mm"} and b.params == {}
+    assert b.bbox[0] == 1 and math.isnan(b.bbox[1]) and b.bbox[3] == 2
+    assert b.color is None and b.digest is None and b.faces == ()
+    assert list(t) == ["A", "B"] and "B" in t and t.get("C") is None
+
+
+def test_non_numeric_faces_are_kept():
+    t = ObjectTable.from_dict({"A": _entry(faces=[1, "Face12", 3]), "B": _entry()})
+    assert t["A"].faces == (1, "Face12", 3)
+    assert t["B"].faces == (7, 8)
+    assert list(t.face_ids) == [7, 8]
+
+
+def test_more_than_65535_materials():
+    t = ObjectTable()
+    for i in range(70000):
+        t.append("o%d" % i, {"material": "m%d" % i})
+    assert t["o69999"].material == "m69999"
+
+
+def test_load_design_without_streaming(tmp_path):
+    path = tmp_path / "dump.json"
+    path.write_text(json.dumps({"meta": {"project": "p", "design": "d"},
+                                "objects": {"A": _entry()}}), encoding="utf-8")
+    design = load_design(str(path))
+    assert len(design.objects) == 1 and design.objects["A"].faces == (7, 8)
+
+
+def _v1_dump(tmp_path):
+    path = tmp_path / "v1.json"
+    bb = {"x_min": 0, "y_min": 0, "z_min": 0, "x_max": 1, "y_max": 2, "z_max": 3}
+    path.write_text(json.dumps({"meta": {"project": "p"},
+                                "objects": {"A": _entry(bounding_box=bb)}}),
+                    encoding="utf-8")
+    return str(path)
+
+
+def test_v1_dict_bbox_plain_loader(tmp_path, monkeypatch):
+    monkeypatch.setattr(design_model, "_ijson", None)
+    assert load_design(_v1_dump(tmp_path)).objects["A"].bbox == (0, 0, 0, 1, 2, 3)
+
+
+def test_v1_dict_bbox_streaming_loader(tmp_path, monkeypatch):
+    monkeypatch.setattr(design_model, "_ijson", pytest.importorskip("ijson"))
+    assert load_design(_v1_dump(tmp_path)).objects["A"].bbox == (0, 0, 0, 1, 2, 3)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import copy
+
+import pytest
+
+from dump_diff import bbox6, diff_dumps
+from dump_digest import add_digests
+from freq_grid import compress_setups, is_grid
+
+SRC = {
+    "materials": ["copper", "vacuum"],
+    "objects": {
+        "Box1": {"material": "copper", "primitive": "Box", "params": {"XSize": "1mm"},
+                 "faces": [1, 2, 3, 4, 5, 6], "bounding_box": [0, 0, 0, 1, 1, 1]},
+        "Air": {"material": "vacuum", "primitive": "Region", "params": {},
+                "faces": [7], "bounding_box": ["-1mm", "-1mm", "-1mm", "2mm", "2mm", "2mm"]},
+    },
+    "boundaries": {"PEC": {"type": "Perfect E", "props": {"Faces": [1]}, "faces": [1]}},
+    "excitations": {},
+    "analysis_setups": {"Setup1": {"props": {"Frequency": "10GHz"}, "sweeps": {}}},
+}
+
+
+def test_bbox6_parses_units_and_dicts():
+    assert bbox6(["-1mm", 0, 0, "2.5mm", 1, 1]) == [-1.0, 0, 0, 2.5, 1, 1]
+    assert bbox6({"x_min": 0, "y_min": 0, "z_min": 0,
+                  "x_max": 1, "y_max": 1, "z_max": 1}) == [0, 0, 0, 1, 1, 1]
+    assert bbox6([]) is None and bbox6(["a"] * 6) is None
+
+
+def test_identical_rebuild_matches_despite_new_ids():
+    dst = copy.deepcopy(SRC)
+    dst["objects"]["Box1"]["faces"] = [101, 102, 103, 104, 105, 106]
+    dst["boundaries"]["PEC"]["props"]["Faces"] = [101]
+    dst["objects"]["Box1"]["bounding_box"][3] = 1 + 1e-9
+    assert diff_dumps(SRC, dst, tol=1e-6)["match"]
+
+
+def test_changes_are_reported_per_field():
+    dst = copy.deepcopy(SRC)
+    dst["objects"]["Box1"]["material"] = "gold"
+    dst["objects"]["Box1"]["bounding_box"][3] = 1.5
+    del dst["objects"]["Air"]
+    dst["analysis_setups"]["Setup1"]["props"]["Frequency"] = "20GHz"
+    r = diff_dumps(SRC, dst)
+    assert not r["match"]
+    assert set(r["objects"]["changed"]["Box1"]) == {"material", "bounding_box"}
+    assert r["objects"]["only_in_source"] == ["Air"]
+    assert r["analysis_setups"]["changed"]["Setup1"]["props"] == {
+        "Frequency": ["10GHz", "20GHz"]}
+
+
+def test_equal_merkle_roots_skip_the_section():
+    src, dst = copy.deepcopy(SRC), copy.deepcopy(SRC)
+    add_digests(src)
+    add_digests(dst)
+    r = diff_dumps(src, dst)
+    assert r["match"] and r["objects"]["identical"] == 2
+
+
+def test_bbox6_converts_units():
+    assert bbox6(["0in", 0, 0, "1in", "1mil", "1cm"]) == pytest.approx(
+        [0, 0, 0, 25.4, 0.0254, 10])
+    assert bbox6([0, 0, 0, 1, 1, 1], "mm", "in") == pytest.approx([0, 0, 0, 25.4, 25.4, 25.4])
+    dst = copy.deepcopy(SRC)
+    dst["objects"]["Air"]["bounding_box"] = ["-0.1cm", "-1000um", "-1mm", "0.2cm", "2mm", "2mm"]
+    assert diff_dumps(SRC, dst)["match"]
+
+
+def test_grid_compressed_sweeps_match_raw_lists():
+    freqs = [f"{f}GHz" for f in range(1, 21)]
+    src = copy.deepcopy(SRC)
+    src["analysis_setups"]["Setup1"]["sweeps"] = {"Sw": {"Frequencies": freqs}}
+    dst = copy.deepcopy(src)
+    dst["analysis_setups"] = compress_setups(dst["analysis_setups"])
+    assert is_grid(dst["analysis_setups"]["Setup1"]["sweeps"]["Sw"]["Frequencies"])
+    add_digests(src)
+    add_digests(dst)
+    assert diff_dumps(src, dst)["match"]
+
+
+def test_non_dict_entries_are_compared_by_value():
+    src, dst = copy.deepcopy(SRC), copy.deepcopy(SRC)
+    src["boundaries"]["Old"] = ["legacy", "list"]
+    dst["boundaries"]["Old"] = ["legacy", "list"]
+    assert diff_dumps(src, dst)["match"]
+    dst["boundaries"]["Old"] = "other"
+    r = diff_dumps(src, dst)
+    assert r["boundaries"]["changed"]["Old"] == {"value": [["legacy", "list"], "other"]}
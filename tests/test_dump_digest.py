@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+from dump_digest import add_digests, canonical, digest, entry_digest, merkle_root
+
+
+def test_canonical_ignores_key_order_and_whitespace():
+    assert canonical({"b": 1, "a": [1, 2]}) == b'{"a":[1,2],"b":1}'
+    assert digest({"b": 1, "a": 2}) == digest({"a": 2, "b": 1})
+
+
+def test_entry_digest_uses_listed_fields_only():
+    a = {"material": "copper", "faces": [1], "color": [1, 2, 3]}
+    b = dict(a, color=None)
+    assert entry_digest(a, ("material", "faces")) == entry_digest(b, ("material", "faces"))
+    assert entry_digest(a, ("material",)) != entry_digest(dict(a, material="gold"),
+                                                          ("material",))
+
+
+def test_merkle_root_is_order_free_and_name_bound():
+    d = {"a": "1" * 32, "b": "2" * 32, "c": "3" * 32}
+    assert merkle_root(d) == merkle_root(dict(reversed(list(d.items()))))
+    assert merkle_root(d) != merkle_root({"a": "2" * 32, "b": "1" * 32, "c": "3" * 32})
+    assert merkle_root({}) == merkle_root({})
+    assert merkle_root({"a": "1" * 32}) != merkle_root({})
+
+
+def test_add_digests_stamps_entries_and_roots():
+    data = {"objects": {"Box1": {"material": "copper", "primitive": "Box"}},
+            "boundaries": {"PEC": {"type": "Perfect E", "props": {}, "faces": [3]}},
+            "variables": {"w": "1mm"}}
+    roots = add_digests(data)
+    assert set(roots) == {"objects", "boundaries"} and data["digests"] is roots
+    assert len(data["objects"]["Box1"]["digest"]) == 32
+    before = roots["objects"]
+    data["objects"]["Box1"]["material"] = "gold"
+    assert add_digests(data)["objects"] != before
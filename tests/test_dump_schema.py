@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from dump_schema import (SCHEMA_VERSION, SchemaError, detect_version, upgrade,
+                         validate, load_dump)
+from freq_grid import compress_props
+
+OBJ = {"material": "copper", "primitive": "Box", "faces": [7, 8],
+       "bounding_box": [0, 0, 0, 1, 1, 1]}
+
+
+def test_united_v1_upgrades_to_current():
+    d = upgrade({"meta": {"project": "p"}, "objects": {"Box1": dict(OBJ)}})
+    assert detect_version(d) == SCHEMA_VERSION
+    assert d["analysis_setups"] == {} and validate(d) == []
+
+
+def test_pyaedt_extractor_setups_are_kept():
+    setups = {"Setup1": {"props": {"Frequency": "10GHz"}, "sweeps": {}}}
+    design = load_dump({"meta": {}, "objects": {}, "setups": setups})
+    assert list(design.setups) == ["Setup1"]
+    assert design.setups["Setup1"].props == {"Frequency": "10GHz"}
+    assert "setups" not in design.extra
+
+
+def test_both_setup_keys_is_an_error():
+    with pytest.raises(SchemaError):
+        upgrade({"setups": {"A": {}}, "analysis_setups": {"B": {"props": {}, "sweeps": {}}}})
+
+
+def test_woohoo_layout():
+    d = upgrade({"metadata": {"project_name": "p", "design_name": "d"},
+                 "objects_3d": {"Box1": {"Material": "vacuum",
+                                         "bounding_box": {"x_min": 0, "y_min": 0, "z_min": 0,
+                                                          "x_max": 1, "y_max": 2, "z_max": 3}}},
+                 "analysis_setups": {"S": {"properties": {"a": 1}}}})
+    assert d["meta"]["design"] == "d"
+    assert d["objects"]["Box1"]["bounding_box"] == [0, 0, 0, 1, 2, 3]
+    assert d["analysis_setups"]["S"] == {"props": {"a": 1}, "sweeps": {}}
+
+
+def test_verga_layout():
+    d = upgrade({"solids": {"S1": {"material": "fr4", "type": "Cylinder",
+                                   "history": ["a", "b"]}},
+                 "setups": {"X": {"props": {}, "sweeps": {}}}})
+    assert d["objects"]["S1"]["primitive"] == "Cylinder"
+    assert d["objects"]["S1"]["history"] == "a\nb"
+    assert "X" in d["analysis_setups"]
+
+
+def test_unknown_version():
+    with pytest.raises(SchemaError):
+        upgrade({"meta": {"schema": 99}})
+
+
+def test_validator_lists_all_problems():
+    errors = validate({"meta": {}, "objects": {"A": {"material": 3},
+                                               "B": {"bounding_box": "x", "material": "m"}}})
+    assert "objects.A: missing bounding_box" in errors
+    assert "objects.A.material: int" in errors
+    assert "objects.B.bounding_box: str" in errors
+
+
+def test_load_dump_expands_frequency_grids(tmp_path):
+    freqs = ["%.12gGHz" % (1 + 0.01 * k) for k in range(200)]
+    dump = {"meta": {"schema": 2}, "objects": {"Box1": OBJ},
+            "analysis_setups": {"S": {"props": compress_props({"Freqs": freqs}),
+                                      "sweeps": {}}}}
+    p = tmp_path / "d.json"
+    p.write_text(json.dumps(dump))
+    design = load_dump(str(p))
+    assert design.setups["S"].props["Freqs"] == freqs
+    assert design.objects["Box1"].bbox == (0, 0, 0, 1, 1, 1)
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+
+import pytest
+
+import extract_cache
+from extract_cache import ExtractionCache, COMPLETE
+
+
+@pytest.fixture
+def project(tmp_path):
+    p = tmp_path / "a.aedt"
+    p.write_text("$begin 'AnsoftProject'\n$end 'AnsoftProject'\n")
+    return str(p)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ExtractionCache(str(tmp_path / "cache"))
+
+
+DUMP = {"meta": {"project": "a"}, "variables": {"w": "1mm"}, "objects": {"Box1": {}}}
+
+
+def test_roundtrip(cache, project):
+    key = cache.key(project, "HFSSDesign1", "alv")
+    assert cache.load(key) is None
+    assert cache.store(key, DUMP)
+    assert cache.load(key) == DUMP
+    assert ExtractionCache(cache.root).load(key) == DUMP       # index persisted
+
+
+def test_key_depends_on_producer_design_and_content(cache, project):
+    k = cache.key(project, "HFSSDesign1", "alv")
+    assert k == cache.key(project, "HFSSDesign1", "alv")
+    assert k != cache.key(project, "HFSSDesign1", "hfss_extractor_pyaedt")
+    assert k != cache.key(project, "HFSSDesign2", "alv")
+    with open(project, "a") as f:
+        f.write("changed\n")
+    assert k != cache.key(project, "HFSSDesign1", "alv")
+
+
+def test_partial_store_is_never_served(cache, project, monkeypatch):
+    key = cache.key(project, "HFSSDesign1", "alv")
+    calls = []
+
+    def boom(*a, **kw):
+        calls.append(a)
+        raise OSError("disk full")
+
+    monkeypatch.setattr(extract_cache.os, "replace", boom)
+    with pytest.raises(OSError):
+        cache.store(key, DUMP)
+    monkeypatch.undo()
+    assert calls
+    assert cache.load(key) is None
+
+
+def test_sections_without_marker_are_not_a_dump(cache, project):
+    key = cache.key(project, "HFSSDesign1", "alv")
+    cache.put_section(key, "meta", {"project": "a"})
+    cache.put_section(key, "variables", {})
+    assert cache.load(key) is None
+    assert cache.get_section(key, "variables") == {}
+
+
+def test_marker_removed_on_disk(cache, project):
+    key = cache.key(project, "HFSSDesign1", "alv")
+    cache.store(key, DUMP)
+    os.remove(os.path.join(cache.root, key, COMPLETE))
+    assert cache.load(key) is None
+
+
+def test_oversized_dump_is_refused_before_writing(tmp_path, project):
+    cache = ExtractionCache(str(tmp_path / "small"), max_bytes=64)
+    key = cache.key(project, "HFSSDesign1", "alv")
+    big = {"meta": {}, "objects": {f"Box{i}": {"material": "copper"} for i in range(50)}}
+    assert cache.store(key, big) is False
+    assert not os.path.exists(os.path.join(cache.root, key))
+    assert cache.load(key) is None
+
+
+def test_lru_eviction(tmp_path, project):
+    one = len(json.dumps(DUMP["meta"])) + len(json.dumps(DUMP["variables"])) \
+        + len(json.dumps(DUMP["objects"]))
+    cache = ExtractionCache(str(tmp_path / "lru"), max_bytes=2 * one)
+    keys = [cache.key(project, f"D{i}", "alv") for i in range(3)]
+    for k in keys:
+        assert cache.store(k, DUMP)
+    assert cache.load(keys[0]) is None
+    assert cache.load(keys[1]) == DUMP and cache.load(keys[2]) == DUMP
+
+
+def test_failed_store_leaves_no_temp_folder(cache, project, monkeypatch):
+    key = cache.key(project, "HFSSDesign1", "alv")
+    monkeypatch.setattr(extract_cache.os, "replace",
+                        lambda *a: (_ for _ in ()).throw(OSError("locked")))
+    with pytest.raises(OSError):
+        cache.store(key, DUMP)
+    monkeypatch.undo()
+    assert [n for n in os.listdir(cache.root) if n.endswith(".tmp")] == []
+
+
+def test_two_processes_sharing_a_root_keep_each_others_entries(tmp_path, project):
+    a, b = ExtractionCache(str(tmp_path / "shared")), ExtractionCache(str(tmp_path / "shared"))
+    ka, kb = a.key(project, "D1", "alv"), b.key(project, "D2", "alv")
+    assert a.store(ka, DUMP) and b.store(kb, DUMP)      # b never saw a's entry
+    fresh = ExtractionCache(a.root)
+    assert fresh.load(ka) == DUMP and fresh.load(kb) == DUMP
+    assert a.load(kb) == DUMP                            # picked up from disk
+    assert not os.path.exists(os.path.join(a.root, "index.lock"))
+
+
+def test_eviction_sees_entries_of_other_processes(tmp_path, project):
+    one = len(json.dumps(DUMP["meta"])) + len(json.dumps(DUMP["variables"])) \
+        + len(json.dumps(DUMP["objects"]))
+    root = str(tmp_path / "shared")
+    a = ExtractionCache(root, max_bytes=2 * one)
+    b = ExtractionCache(root, max_bytes=2 * one)
+    k0, k1, k2 = (a.key(project, f"D{i}", "alv") for i in range(3))
+    assert a.store(k0, DUMP) and b.store(k1, DUMP)
+    assert a.store(k2, DUMP)                 # over budget – oldest (k0) goes
+    fresh = ExtractionCache(root)
+    assert fresh.load(k0) is None
+    assert fresh.load(k1) == DUMP and fresh.load(k2) == DUMP
+
+
+def test_stale_lock_file_is_broken(cache, project):
+    lock = os.path.join(cache.root, "index.lock")
+    open(lock, "w").close()
+    os.utime(lock, (0, 0))
+    key = cache.key(project, "HFSSDesign1", "alv")
+    assert cache.store(key, DUMP) and not os.path.exists(lock)
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from extract_filter import ExtractFilter
+
+
+class _Editor(object):
+    NAMES = ["Trace1", "trace2", "TRACE3_old", "Trace4_old", "Via1"]
+
+    def GetMatchedObjectName(self, pattern):
+        # AEDT's own matcher may be looser (here: case-insensitive)
+        from fnmatch import fnmatch
+        return [n for n in self.NAMES if fnmatch(n.lower(), pattern.lower())]
+
+
+def test_includes_and_excludes_share_the_case_rule():
+    flt = ExtractFilter(names=("Trace*", "!*_old"))
+    assert flt.object_names(_Editor()) == ["Trace1"]
+    flt = ExtractFilter(names=("*", "!trace*"))
+    assert flt.object_names(_Editor()) == ["Trace1", "TRACE3_old", "Trace4_old", "Via1"]
+
+
+def test_keep_name_is_case_sensitive():
+    flt = ExtractFilter(names=("!Via*",))
+    assert not flt.keep_name("Via1") and flt.keep_name("via1")
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+import pytest
+
+from extract_pipeline import normalize_object, run_pipeline, SectionSpool, save_dump
+
+
+def _raw(name, material="copper"):
+    return {"name": name, "color": (1, 2, 3), "material": material,
+            "primitive": "Box", "params": {"XSize": "1mm"}, "faces": [7, 8],
+            "bounding_box": [0, 0, 0, 1, 1, 1], "history": None}
+
+
+def test_without_sink_entries_are_returned():
+    out = run_pipeline(["a", "b"], _raw, normalize_object)
+    assert list(out) == ["a", "b"]
+    assert out["a"]["material"] == "copper" and out["a"]["color"] == [1, 2, 3]
+
+
+def test_sink_gets_entries_caller_only_digests():
+    written = []
+    out = run_pipeline(["a", "b"], _raw, normalize_object, written.append)
+    assert [n for n, _ in written] == ["a", "b"]
+    assert out == {n: e["digest"] for n, e in written}
+
+
+def test_duplicate_names_written_once(tmp_path):
+    spool = SectionSpool(str(tmp_path / "o.part"))
+    out = run_pipeline(["a", "b", "a"], _raw, normalize_object, spool.write)
+    assert list(out) == ["a", "b"] and spool.count == 2
+    path = save_dump({"objects": out}, str(tmp_path / "d.json"), {"objects": spool})
+    text = open(path, encoding="utf-8").read()
+    assert text.count('"a":') == 1
+
+
+def test_save_dump_matches_json_dump(tmp_path):
+    objects = run_pipeline(["a", "ü"], _raw, normalize_object)
+    data = {"meta": {"project": "p"}, "objects": objects, "history": []}
+    spool = SectionSpool(str(tmp_path / "o.part"))
+    for pair in objects.items():
+        spool.write(pair)
+    path = save_dump(dict(data, objects={}), str(tmp_path / "d.json"), {"objects": spool})
+    expected = json.dumps(data, indent=2, ensure_ascii=False, default=str)
+    assert open(path, encoding="utf-8").read() == expected
+    assert not os.path.exists(spool.path)
+
+
+def test_part_file_removed_on_error(tmp_path):
+    part = str(tmp_path / "o.part")
+    with pytest.raises(RuntimeError):
+        with SectionSpool(part) as spool:
+            spool.write(("a", {}))
+            raise RuntimeError("boom")
+    assert not os.path.exists(part)
+
+
+def test_worker_error_is_reraised():
+    def bad(raw):
+        raise ValueError("normalise failed")
+    with pytest.raises(ValueError):
+        run_pipeline(range(200), lambda i: {"name": str(i)}, bad)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+import inspect
+
+from face_geometry import plane_normal, _AEDT_SCRIPT
+
+SQUARE = [[0, 0, 2], [1, 0, 2], [1, 1, 2], [0, 1, 2]]
+
+
+def test_planar_face_gets_unit_normal():
+    assert plane_normal(SQUARE, [0.5, 0.5, 2]) == [0.0, 0.0, 1.0]
+
+
+def test_normal_does_not_depend_on_vertex_order():
+    assert plane_normal(SQUARE[::-1]) == plane_normal([SQUARE[0], SQUARE[2],
+                                                       SQUARE[1], SQUARE[3]])
+
+
+def test_curved_face_stores_zero_normal():
+    # half-cylinder side: the four corners are coplanar, the center is not
+    corners = [[-1, 0, 0], [1, 0, 0], [1, 0, 5], [-1, 0, 5]]
+    assert plane_normal(corners, [0, 1, 2.5]) == [0.0, 0.0, 0.0]
+    assert plane_normal(corners + [[0, 1, 0]]) == [0.0, 0.0, 0.0]
+
+
+def test_degenerate_faces_store_zero_normal():
+    assert plane_normal([[0, 0, 0], [1, 0, 0]]) == [0.0, 0.0, 0.0]
+    assert plane_normal([[0, 0, 0], [1, 0, 0], [2, 0, 0]]) == [0.0, 0.0, 0.0]
+
+
+def test_aedt_script_is_ascii_and_compiles():
+    src = _AEDT_SCRIPT % {"project": "p", "design": "d", "names": [], "out": "o.csv",
+                          "plane_normal": inspect.getsource(plane_normal)}
+    assert all(ord(c) < 128 for c in src)
+    compile(src, "faces.py", "exec")
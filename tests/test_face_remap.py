@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+from face_geometry import FaceTable
+from face_remap import match_faces, remap_ids, remap_section, remap_dump_faces
+
+# unit cube faces: (center, normal)
+CUBE = [((0.5, 0.5, 0.0), (0, 0, -1)), ((0.5, 0.5, 1.0), (0, 0, 1)),
+        ((0.5, 0.0, 0.5), (0, -1, 0)), ((0.5, 1.0, 0.5), (0, 1, 0)),
+        ((0.0, 0.5, 0.5), (-1, 0, 0)), ((1.0, 0.5, 0.5), (1, 0, 0))]
+
+
+def table(owners, first_id, shift=0.0):
+    t, fid = FaceTable(), first_id
+    for k, name in enumerate(owners):
+        for c, n in CUBE:
+            t.add(name, fid, [c[0] + 2 * k + shift, c[1], c[2]], n, 1.0)
+            fid += 1
+    return t
+
+
+def test_match_faces_by_geometry_and_owner():
+    src, dst = table(["A", "B"], 1), table(["A", "B"], 100)
+    m = match_faces(src, dst)
+    assert m == {1 + i: 100 + i for i in range(12)}
+
+
+def test_owner_must_agree():
+    src = table(["A"], 1)
+    dst = table(["Other"], 100)
+    assert match_faces(src, dst) == {}
+
+
+def test_remap_ids_and_section():
+    ids, missing = remap_ids([1, "2", "face_x", 9], {1: 11, 2: 12})
+    assert ids == [11, 12, "face_x", 9] and missing == [9]
+    entries = {"P1": {"faces": [1], "props": {"Faces": [2]}},
+               "B1": {"faces": [9], "props": {}}}
+    assert remap_section(entries, {1: 11, 2: 12}) == ["B1"]
+    assert entries["P1"] == {"faces": [11], "props": {"Faces": [12]}}
+
+
+class _Editor(object):
+    """per-face API of a design that holds the objects of *t*"""
+
+    def __init__(self, t):
+        self.t = t
+        self.by_id = {f: i for i, f in enumerate(t.ids)}
+
+    def GetMatchedObjectName(self, pattern):
+        return list(self.t.owners)
+
+    def GetFaceIDs(self, name):
+        if name not in self.t.owners:
+            raise RuntimeError("object not found: " + name)
+        return [str(f) for f in self.t.faces_of(name)]
+
+    def GetVertexIDsFromFace(self, f):
+        return []
+
+    def GetFaceCenter(self, f):
+        i = self.by_id[f]
+        return [str(v) for v in self.t.centers[3 * i:3 * i + 3]]
+
+    def GetFaceArea(self, f):
+        return self.t.areas[self.by_id[f]]
+
+
+class _App(object):
+    project_name, design_name = "prj", "HFSSDesign1"
+
+    def __init__(self, t):
+        self.modeler = type("M", (), {"oeditor": _Editor(t)})()
+        self.odesktop = self
+
+    def RunScript(self, path):
+        raise RuntimeError("no AEDT here")           # → per-face fallback
+
+
+def test_missing_owner_does_not_abort_remap(tmp_path):
+    src = table(["A", "B"], 1)
+    info = src.save(str(tmp_path / "d_faces.bin"))
+    dump = {"face_geometry": info,
+            "boundaries": {"PecA": {"faces": [1], "props": {"Faces": [1]}},
+                           "PecB": {"faces": [7], "props": {"Faces": [7]}}}}
+    rebuilt = table(["A"], 500)                      # B was not rebuilt
+    mapping = remap_dump_faces(_App(rebuilt), dump, str(tmp_path))
+    assert mapping[1] == 500
+    assert dump["boundaries"]["PecA"]["faces"] == [500]
+    assert dump["boundaries"]["PecB"]["faces"] == [7]   # left as-is, reported
+
+
+def test_face_table_roundtrip(tmp_path):
+    t = table(["A", "B"], 1)
+    t.save(str(tmp_path / "f.bin"))
+    u = FaceTable.load(str(tmp_path / "f.bin"))
+    assert list(u.ids) == list(t.ids) and u.owners == t.owners
+    assert list(u.centers) == list(t.centers) and list(u.normals) == list(t.normals)
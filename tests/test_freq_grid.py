@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+from freq_grid import FreqGrid, compress_props, expand_props, is_grid
+
+
+def roundtrip(x):
+    c = compress_props(x)
+    e = expand_props(c)
+    assert e == x
+    assert [type(v) for v in e] == [type(v) for v in x]
+    return c
+
+
+def test_linear_sweep_collapses_to_one_segment():
+    x = ["%.12gGHz" % (1 + 0.001 * k) for k in range(20001)]
+    c = roundtrip(x)
+    assert is_grid(c)
+    assert c["segments"] == [["lin", 1.0, 21.0, 20001]]
+
+
+def test_log_sweep():
+    x = ["%.12gHz" % (10 ** (k / 10)) for k in range(61)]
+    c = roundtrip(x)
+    assert is_grid(c) and c["segments"][0][0] == "log"
+
+
+def test_explicit_points_keep_original_strings():
+    x = ["1844421851.52505Hz"] + ["%dHz" % k for k in range(10)]
+    c = roundtrip(x)
+    assert is_grid(c)
+    assert c["segments"][0] == ["pts", ["1844421851.52505Hz"]]
+
+
+def test_non_canonical_strings_stay_raw():
+    x = ["%.3fGHz" % (1 + k) for k in range(20)]          # "1.000GHz" ≠ "1GHz"
+    assert compress_props(x) == x
+
+
+def test_integers_stay_integers():
+    x = list(range(0, 1000, 10))
+    c = roundtrip(x)
+    assert is_grid(c) and c.get("ints") is True
+
+
+def test_only_explicit_points_is_not_compressed():
+    x = [1.5, 2.7, 3.1, 9.0, 11.0, 13.3, 17.2, 19.9, 23.0]
+    assert compress_props(x) == x
+
+
+def test_short_lists_untouched():
+    x = ["1GHz", "2GHz", "3GHz"]
+    assert compress_props(x) == x
+
+
+def test_single_points_subranges():
+    sp = [{"RangeType": "SinglePoints", "RangeStart": "%.12gGHz" % (1 + k * .5),
+           "RangeEnd": "%.12gGHz" % (1 + k * .5)} for k in range(50)]
+    c = compress_props({"Sweep": {"RangeList": sp}})
+    assert is_grid(c["Sweep"]["RangeList"])
+    assert expand_props(c) == {"Sweep": {"RangeList": sp}}
+
+
+def test_lazy_indexing():
+    g = FreqGrid.from_dict(compress_props(["%.12gGHz" % (1 + 0.001 * k) for k in range(20001)]))
+    assert len(g) == 20001
+    assert g[5] == "1.005GHz" and g.value(5) == 1.005
+    assert g[-1] == "21GHz"
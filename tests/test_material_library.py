@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+from material_library import (read_aedt_materials, extract_material_library,
+                              material_table)
+
+AEDT = """$begin 'AnsoftProject'
+\t$begin 'Definitions'
+\t\t$begin 'Materials'
+\t\t\t$begin 'copper'
+\t\t\t\tCoordinateSystemType='Cartesian'
+\t\t\t\tconductivity='58000000'
+\t\t\t\tpermittivity=1
+\t\t\t$end 'copper'
+\t\t\t$begin 'FR4_epoxy'
+\t\t\t\tpermittivity='4.4'
+\t\t\t\tdielectric_loss_tangent='0.02'
+\t\t\t\tColor(90, 120, 30)
+\t\t\t$end 'FR4_epoxy'
+\t\t$end 'Materials'
+\t$end 'Definitions'
+$end 'AnsoftProject'
+"""
+
+
+class _Prop(object):
+    def __init__(self, value):
+        self.value = value
+
+
+class _Material(object):
+    def __init__(self, **props):
+        for k, v in props.items():
+            setattr(self, k, _Prop(v))
+
+
+class _App(object):
+    def __init__(self, project_file, modified):
+        self.project_file = project_file
+        self.modified = modified
+        self.oproject = self
+        self.materials = type("Mats", (), {"material_keys": {
+            "copper": _Material(conductivity="1"), "gold": _Material(conductivity="4.1e7")}})()
+
+    def IsModified(self):
+        return self.modified
+
+
+def test_parse_materials_block(tmp_path):
+    p = tmp_path / "a.aedt"
+    p.write_text(AEDT)
+    lib = read_aedt_materials(str(p))
+    assert lib["copper"]["conductivity"] == "58000000"
+    assert lib["copper"]["permittivity"] == 1
+    assert lib["FR4_epoxy"]["Color"] == [90, 120, 30]
+
+
+def test_saved_project_reads_the_file(tmp_path):
+    p = tmp_path / "b.aedt"
+    p.write_text(AEDT)
+    lib = extract_material_library(_App(str(p), modified=False))
+    assert set(lib) == {"copper", "FR4_epoxy"}
+
+
+def test_modified_project_uses_loaded_materials(tmp_path):
+    p = tmp_path / "c.aedt"
+    p.write_text(AEDT)
+    lib = extract_material_library(_App(str(p), modified=True))
+    assert lib == {"copper": {"conductivity": "1"}, "gold": {"conductivity": "4.1e7"}}
+
+
+def test_material_ids_are_content_addressed():
+    t1, i1 = material_table({"copper": {"conductivity": "5.8e7"}})
+    t2, i2 = material_table({"Copper": {"conductivity": "5.8e7"}})
+    t3, _ = material_table({"copper": {"conductivity": "1"}})
+    assert i1["copper"] in t1 and t1[i1["copper"]]["name"] == "copper"
+    assert i1["copper"] != i2["copper"] and set(t1) != set(t3)
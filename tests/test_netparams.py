@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from netparams import (s2z, z2s, s2y, y2s, convert, load_batch, summary,
+                       insertion_loss, passivity, resample)
+from solution_store import SolutionWriter
+
+
+def random_s(nfreq=5, p=2, seed=0):
+    rng = np.random.default_rng(seed)
+    return 0.3 * (rng.standard_normal((nfreq, p, p)) + 1j * rng.standard_normal((nfreq, p, p)))
+
+
+def test_conversions_roundtrip():
+    s = random_s()
+    assert np.allclose(z2s(s2z(s)), s)
+    assert np.allclose(y2s(s2y(s)), s)
+    assert np.allclose(convert(convert(s, "S", "Y", 25.0), "Y", "S", 25.0), s)
+    assert np.allclose(s2z(s) @ s2y(s), np.eye(2))
+
+
+def test_matched_load_is_zero_reflection():
+    z = np.array([[[50.0 + 0j]]])
+    assert np.allclose(z2s(z, 50.0), 0)
+
+
+def _store(path, param, z0, mats, freq=(1e9, 2e9, 3e9)):
+    with SolutionWriter(str(path), mats.shape[-1], param, z0) as w:
+        w.append(list(freq), [list(m.ravel()) for m in mats])
+    return str(path)
+
+
+def test_load_batch_renormalises_s_and_denormalises_yz(tmp_path):
+    s50 = random_s(3)
+    z_ohm = s2z(s50, 50.0)
+    s75 = z2s(z_ohm, 75.0)
+    paths = [_store(tmp_path / "a", "S", 50.0, s50),
+             _store(tmp_path / "b", "S", 75.0, s75),
+             _store(tmp_path / "c", "Z", 50.0, z_ohm / 50.0),      # v1: normalised
+             _store(tmp_path / "d", "Y", 50.0, np.linalg.inv(z_ohm) * 50.0)]
+    freq, cube = load_batch(paths, z0=50.0)
+    assert cube.shape == (4, 3, 2, 2)
+    for k in range(4):
+        assert np.allclose(cube[k], s50), k
+    _, z = load_batch(paths, param="Z", z0=50.0)
+    assert np.allclose(z, z_ohm)
+
+
+def test_load_batch_port_mismatch(tmp_path):
+    paths = [_store(tmp_path / "a", "S", 50.0, random_s(3, 2)),
+             _store(tmp_path / "b", "S", 50.0, random_s(3, 3))]
+    with pytest.raises(ValueError):
+        load_batch(paths)
+
+
+def test_summary_default_pairs_follow_port_count():
+    freq = np.array([1e9, 2e9, 3e9])
+    one = summary(freq, random_s(3, 1)[None])
+    assert set(one) == {"worst_return_loss_db", "passive"}
+    three = summary(freq, random_s(3, 3)[None])
+    assert {k for k in three if k.startswith("max_insertion")} == {
+        "max_insertion_loss_db_21", "max_insertion_loss_db_31", "max_insertion_loss_db_32"}
+
+
+def test_metrics_and_resample():
+    s = np.zeros((2, 2, 2), complex)
+    s[:, 1, 0] = s[:, 0, 1] = 0.5
+    assert np.allclose(insertion_loss(s, 1, 0), 20 * np.log10(2))
+    assert passivity(s)["passive"]
+    r = resample([1.0, 3.0], s, [2.0])
+    assert np.allclose(r, s[:1])
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+import io
+
+from script_templates import ScriptTemplates, ScriptWriter, box_rows_from_bboxes
+
+
+def test_writer_into_stream_renders_boxes():
+    tpl = ScriptTemplates(editor="editor", indent="")
+    buf = io.StringIO()
+    with ScriptWriter(buf, tpl, chunk_rows=2) as w:
+        w.write_lines(["# header"])
+        w.write_rows("box", box_rows_from_bboxes(
+            ["A", "B", "C"], [[0, 0, 0, 1, 2, 3]] * 3, ["copper"] * 3, units="mm"))
+    text = buf.getvalue()                            # stream left open
+    assert text.startswith("# header\n")
+    assert text.count("editor.CreateBox(") == 3
+    assert '"XSize:=", "1mm"' in text and '"ZSize:=", "3mm"' in text
+    compile(text, "script", "exec")
+
+
+def test_writer_to_file(tmp_path):
+    p = tmp_path / "s.py"
+    with ScriptWriter(str(p)) as w:
+        w.write_rows("comment", [{"text": "a"}, {"text": "b"}])
+    assert p.read_text() == "# a\n# b\n"
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from dump_digest import merkle_root
+from extract_filter import ExtractFilter
+from extract_sections import collect_sections
+from shard_extract import listing_digest, merge_shards
+
+
+def _shard(tmp_path, k, names, objects, listing=None):
+    rows = [[i, n, {"material": "copper", "digest": "%032x" % i}]
+            for i, n in enumerate(names) if n in objects]
+    doc = {"shard": k, "shards": 2, "mode": "hash", "listed": len(names),
+           "listing": listing_digest(listing or names), "objects": rows}
+    path = tmp_path / f"s{k}.json"
+    path.write_text(json.dumps(doc), encoding="utf-8")
+    return str(path)
+
+
+def test_listing_digest_ignores_order():
+    assert listing_digest(["a", "b"]) == listing_digest(["b", "a"])
+    assert listing_digest(["a", "b"]) != listing_digest(["a", "c"])
+
+
+def test_merge_orders_by_listing(tmp_path):
+    names = ["Box1", "Box2", "Box3"]
+    paths = [_shard(tmp_path, 1, names, {"Box2"}), _shard(tmp_path, 0, names, {"Box1", "Box3"})]
+    out, count = merge_shards(paths, "p.aedt", "D1", str(tmp_path / "d.json"), ts="t")
+    data = json.load(open(out, encoding="utf-8"))
+    assert count == 3 and list(data["objects"]) == names
+    assert data["digests"]["objects"] == merkle_root(
+        {n: e["digest"] for n, e in data["objects"].items()})
+    assert not (tmp_path / "d.json.objects.part").exists()
+
+
+def test_merge_rejects_renamed_listing(tmp_path):
+    names = ["Box1", "Box2"]
+    paths = [_shard(tmp_path, 0, names, {"Box1"}),
+             _shard(tmp_path, 1, names, {"Box2"}, listing=["Box1", "Box2_renamed"])]
+    with pytest.raises(RuntimeError, match="different object sets"):
+        merge_shards(paths, "p.aedt", "D1", str(tmp_path / "d.json"))
+
+
+class _Hfss(object):
+    class odesign(object):
+        @staticmethod
+        def GetModelHistory():
+            return ["h"]
+
+    class post(object):
+        reports = []
+
+    setups = []
+
+
+def test_collect_sections_only_asked_and_timed():
+    timed = []
+
+    class _T(object):
+        def __init__(self, key):
+            timed.append(key)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    out = collect_sections(_Hfss(), ExtractFilter(("history", "reports", "analysis_setups")),
+                           timed=_T)
+    assert out == {"analysis_setups": {}, "reports": {}, "history": ["h"]}
+    assert timed == ["analysis_setups", "reports", "history"]
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+import watch_extract
+from watch_extract import LiveDump
+
+
+class _Modeler(object):
+    def __init__(self, objects):
+        self.objects = objects                       # name → material
+        self.calls = 0
+        self.oeditor = self
+
+    def GetMatchedObjectName(self, pattern):
+        return list(self.objects)
+
+    def _call(self):
+        self.calls += 1
+
+    def does_object_exist(self, n):
+        self._call()
+        return n in self.objects
+
+    def is_group(self, n):
+        self._call()
+        return False
+
+    def get_bounding_box(self, n):
+        self._call()
+        return [0, 0, 0, 1, 1, 1]
+
+    def get_object_material(self, n, default):
+        self._call()
+        return self.objects[n]
+
+    def get_object_type(self, n):
+        return "Box"
+
+    def get_object_parameters(self, n):
+        return {}
+
+    def get_object_faces(self, n):
+        return [1, 2]
+
+    def get_object_history(self, n):
+        return None
+
+
+class _Hfss(object):
+    project_name, design_name, project_file = "prj", "HFSSDesign1", None
+
+    def __init__(self, objects):
+        self.modeler = _Modeler(objects)
+
+
+@pytest.fixture
+def env(monkeypatch):
+    hfss = _Hfss({f"Box{i}": "copper" for i in range(100)})
+    collected = []
+
+    def sections(h, flt):
+        collected.append(sorted(flt.sections))
+        return {k: ({} if k != "history" else "hist") for k in flt.sections}
+
+    monkeypatch.setattr(watch_extract, "collect_sections", sections)
+    monkeypatch.setattr(watch_extract, "object_signatures",
+                        lambda h: {n: m for n, m in h.modeler.objects.items()})
+    monkeypatch.setattr(watch_extract, "section_signatures",
+                        lambda h, p, o: dict({k: 1 for k in watch_extract.SECTIONS},
+                                             history=o))
+    return hfss, collected
+
+
+def test_incremental_refresh_fetches_only_changes(env, tmp_path):
+    hfss, collected = env
+    live = LiveDump(hfss, str(tmp_path / "live.json"), full_every=100)
+    live.refresh()
+    assert len(live.data["objects"]) == 100 and len(collected) == 1
+
+    hfss.modeler.calls = 0
+    assert live.refresh() == {}                          # nothing moved
+    assert hfss.modeler.calls == 0 and len(collected) == 1
+
+    hfss.modeler.objects["Box3"] = "gold"                # changed
+    hfss.modeler.objects["New"] = "copper"               # added
+    del hfss.modeler.objects["Box7"]                     # removed
+    changes = live.refresh()
+    assert changes["objects"] == (1, 1, 1)
+    assert live.data["objects"]["Box3"]["material"] == "gold"
+    assert collected[-1] == ["history"]                  # only the moved signature
+    assert 0 < hfss.modeler.calls <= 2 * 5
+
+    with open(live.path, encoding="utf-8") as f:
+        assert "Box7" not in json.load(f)["objects"]
+
+
+def test_full_every_refetches_everything(env, tmp_path):
+    hfss, collected = env
+    live = LiveDump(hfss, str(tmp_path / "live.json"), full_every=2)
+    live.refresh()
+    live.refresh()
+    hfss.modeler.calls = 0
+    live.refresh()                                       # run index 2 → full
+    assert hfss.modeler.calls >= 100
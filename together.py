@@ -8,9 +8,13 @@ Supports:
   • analysis setups & sweeps
 """
 
-import os, json, argparse
+import os, argparse
 from pyaedt import Desktop, Hfss
 
+from face_remap import remap_dump_faces
+from boundary_registry import create_boundaries
+from design_model import load_design
+
 # ───────── CLI ───────── #
 cli = argparse.ArgumentParser()
 cli.add_argument("-d", "--dump", required=True, help="extractor JSON path")
@@ -43,71 +47,59 @@ else:
 
 print("→ Rebuilding into", hfss.project_name, "/", hfss.design_name)
 
-with open(dump_path, "r", encoding="utf-8") as f:
-    dump = json.load(f)
+dump = load_design(dump_path)               # compact, schema-checked records
 
 # 1 ▪ execute history (full design or per object) -------------------------
-if dump.get("history"):
-    hfss.odesign.ExecuteScript(dump["history"])
+if dump.history:
+    hfss.odesign.ExecuteScript(dump.history)
 else:
-    for o in dump["objects"].values():
-        if o["history"]:
-            hfss.odesign.ExecuteScript(o["history"])
+    for o in dump.objects.values():
+        if o.history:
+            hfss.odesign.ExecuteScript(o.history)
 
 mdl = hfss.modeler
 
+# source face IDs → rebuilt face IDs before any port / boundary is assigned
+remap_dump_faces(hfss, dump, os.path.dirname(dump_path))
+
 # 2 ▪ variables & materials ----------------------------------------------
-for k, v in dump["variables"].items():
+for k, v in dump.variables.items():
     hfss[k] = v
-for m in dump["materials"]:
+for m in dump.materials:
     if m not in hfss.materials.material_keys:
         hfss.materials.add_material(m)
 
 # re-apply material & colour (ExecuteScript already created solids) -------
-for n, o in dump["objects"].items():
+for n, o in dump.objects.items():
     if not mdl.does_object_exist(n):
         continue
     s = mdl.get_object_from_name(n)
-    s.material_name = o["material"]
-    if o.get("color"):
-        s.color = tuple(o["color"])
+    s.material_name = o.material
+    if o.color:
+        s.color = o.color
 
 # 3 ▪ coordinate systems --------------------------------------------------
 csm = mdl.CoordinateSystemManager
-for n, props in dump["coord_systems"].items():
+for n, props in dump.coord_systems.items():
     if n not in csm.ListCoordinateSystems():
         csm.CreateCoordinateSystem(props)
 
 # 4 ▪ mesh operations -----------------------------------------------------
 mm = hfss.mesh
-for mop_name, mop_props in dump["mesh_ops"].items():
+for mop_name, mop_props in dump.mesh_ops.items():
     if mop_name not in mm.meshoperations:
         mm.meshoperations.create_meshoperation_from_settings(mop_name, mop_props)
 
 # 5 ▪ boundaries & ports --------------------------------------------------
-bmod = hfss.boundaries
-for b in dump["boundaries"].values():
-    if b["name"] in bmod:
-        continue
-    bmod.add_boundary(b["type"], b["faces"], b["props"])
+create_boundaries(hfss, dump.boundaries,
+                  skip={b.name for b in hfss.boundaries})
 
-for p in dump["excitations"].values():
-    if p["name"] in bmod:
-        continue
-    t = p["type"].lower()
-    faces = p["faces"]
-    if "wave" in t:
-        bmod.create_wave_port(faces, port_number=int(p["props"].get("PortNum", 1)),
-                              name=p["name"])
-    elif "lumped" in t:
-        bmod.create_lumped_port(faces, name=p["name"])
-
-# 6 ▪ analysis setups -----------------------------------------------------
+# 6 ▪ analysis setups (frequency grids already expanded) ------------------
 present = {s.name: s for s in hfss.setups}
-for s_name, s in dump["analysis_setups"].items():
-    stp = present.get(s_name) or hfss.create_setup(s_name, s["props"])
+for s_name, s in dump.setups.items():
+    stp = present.get(s_name) or hfss.create_setup(s_name, s.props)
     if hasattr(stp, "add_sweep"):
-        for sw_name, sw in s["sweeps"].items():
+        for sw_name, sw in s.sweeps.items():
             stp.add_sweep(sw_name, sw)
 
 hfss.save_project()
@@ -9,20 +9,48 @@ with:
   • per-object history  + full project history
   • ports, boundaries
   • coordinate systems, mesh operations, analysis setups, sweeps, reports
+  • optional: S/Y/Z solution data per sweep (columnar _solutions/ store)
 """
 
-import os, json, csv
+import os, csv
 from datetime import datetime
 from pyaedt import Desktop, Hfss
 
+from face_geometry import collect_face_table
+from solution_store import export_solutions
+from capabilities import get_probe, OBJECT_NAME_STRATEGIES
+from extract_sections import collect_sections, material_index
+from extract_pipeline import (object_items, fetch_object, normalize_object,
+                              run_pipeline, SectionSpool, save_dump)
+from dump_digest import add_digests, DIGEST_FIELDS, merkle_root
+from columnar_export import export_tables, ObjectColumns
+from extract_log import get_logger, configure as configure_log
+from telemetry import Telemetry
+from extract_filter import ExtractFilter, ALL
+from dump_schema import SCHEMA_VERSION
+
 # ────────── USER SETTINGS ────────── #
 PROJECT_PATH = None     # r"C:\path\file.aedt" or None to attach
 DESIGN_NAME  = None     # None = active design
 AEDT_VERSION = None     # "2024.2" or None = auto
 EXPORT_CSV   = True
+EXPORT_FACE_GEOMETRY = False   # face centers / normals / areas → _faces.bin
+EXPORT_SOLUTIONS = False       # S/Y/Z of every sweep → _solutions/ store
+EXPORT_TABLES    = True        # objects / boundaries / variables → *.parquet
+LOG_LEVEL        = "info"      # "debug" for per-object lines
+LOG_JSONL        = None        # path → JSON-lines event log
+TELEMETRY_FILE   = True        # live counters → <base>.status.json
+TELEMETRY_PORT   = None        # e.g. 8765 → http://127.0.0.1:8765/status
+SECTIONS  = None      # e.g. ("objects", "excitations") or ("!history",); None = all
+OBJECTS   = None      # name globs, e.g. ("L0*", "!*_old"); None = all
+MATERIALS = None      # e.g. ("copper",) – objects of these materials only
+REGION    = None      # (x0, y0, z0, x1, y1, z1) model units – bbox overlap
 # ─────────────────────────────────── #
 
 ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+FILTER = ExtractFilter(SECTIONS, OBJECTS, MATERIALS, REGION)
+configure_log(level=LOG_LEVEL, jsonl=LOG_JSONL)
+log = get_logger("united")
 d  = Desktop(specified_version=AEDT_VERSION, new_desktop=False)
 
 # attach / open project ---------------------------------------------------
@@ -42,103 +70,93 @@ else:
     hfss = Hfss(project=prj, specified_version=AEDT_VERSION,
                 new_desktop=False, close_on_exit=False)
 
-print("✓ Project:", hfss.project_name)
-print("✓ Design :", hfss.design_name)
+log.info("✓ Project: %s", hfss.project_name)
+log.info("✓ Design : %s", hfss.design_name)
 
 # ───────── helpers ───────── #
-def get_variables():
-    vm = hfss.variable_manager
-    for attr in ("variables", "properties"):
-        if hasattr(vm, attr):
-            return getattr(vm, attr)
-    return {n: hfss.odesign.GetVariableValue(n)
-            for n in hfss.odesign.GetVariables()}
-
-def get_materials():
-    return {m: {"name": m} for m in hfss.materials.material_keys}
-
-def get_objects():
-    mdl, out = hfss.modeler, {}
-    for handle in mdl.objects:
-        names = [handle.name] if hasattr(handle, "name") else mdl.get_object_name(handle)
-        if isinstance(names, str):
-            names = [names]
-        for n in names:
-            hist  = mdl.get_object_history(n)
-            faces = mdl.get_object_faces(n)
-            try:
-                prim  = mdl.get_object_type(n)
-                parms = mdl.get_object_parameters(n)
-            except Exception:
-                prim, parms = "Unknown", {}
-            try:
-                bbox = mdl.get_bounding_box(n)
-            except Exception:
-                bbox = []
-            out[n] = {
-                "material"     : mdl.get_object_material(n, "") if mdl.does_object_exist(n) else "Unknown",
-                "color"        : getattr(handle, "color", None),
-                "primitive"    : prim,
-                "params"       : parms,
-                "faces"        : faces,
-                "bounding_box" : bbox,
-                "history"      : hist
-            }
-    return out
-
-def get_bounds_ports():
-    bmod, bnd, exc = hfss.boundaries, {}, {}
-    for b in bmod:
-        entry = {"type": b.type, "props": b.props}
-        try:
-            entry["faces"] = bmod.get_boundary_faces(b.name)
-        except Exception:
-            entry["faces"] = []
-        (exc if "port" in b.type.lower() else bnd)[b.name] = entry
-    return bnd, exc
-
-def get_setups():
-    return {s.name: {"props": s.props,
-                     "sweeps": {sw.name: sw.props for sw in s.sweeps}}
-            for s in hfss.setups}
-
-def get_coord_systems():
-    csm = hfss.modeler.CoordinateSystemManager
-    return {n: csm.GetCoordinateSystem(n) for n in csm.ListCoordinateSystems()}
-
-def get_mesh_ops():
-    mm = hfss.mesh
-    return {m: mm.meshoperations[m].props for m in mm.meshoperations}
-
-def get_reports():
-    return {r.name: r.report_type for r in hfss.post.reports}
+def get_objects(mat_index, sink=None):
+    # fetch (this thread) ∥ normalise ∥ write-to-spool (worker threads);
+    # with a sink only {name: digest} comes back – the entries live in the spool
+    mdl = hfss.modeler
+    names = FILTER.object_names(mdl)             # GetMatchedObjectName / by material
+    if names is None:
+        handles = list(mdl.objects)
+        if not handles:
+            return {}
+        names_of = get_probe(hfss).bind("object_names", OBJECT_NAME_STRATEGIES,
+                                        mdl, handles[0])
+        total = len(handles)
+    else:
+        names_of, total = None, len(names)
+    items = FILTER.object_items(mdl, names_of, names) if FILTER.selective \
+        else object_items(mdl, names_of)
+    region = FILTER.keep_bbox if FILTER.region else None
+    bar = log.progress("objects", total=total)
+    def fetch(item):
+        tele.incr("object_fetches")
+        return fetch_object(mdl, *item, region=region)
+
+    objs = run_pipeline(items, fetch,
+                        lambda raw: normalize_object(raw, mat_index),
+                        sink, progress=bar)
+    bar.close()
+    return objs
 
 # ───────── collect all data ───────── #
-data = {
-    "meta": {"timestamp": ts, "project": hfss.project_name,
-             "design": hfss.design_name, "aedt_version": d.release},
-    "variables"       : get_variables(),
-    "materials"       : get_materials(),
-    "objects"         : get_objects(),
-    "analysis_setups" : get_setups(),
-    "coord_systems"   : get_coord_systems(),
-    "mesh_ops"        : get_mesh_ops(),
-    "reports"         : get_reports(),
-    "history"         : hfss.odesign.GetModelHistory()
-}
-data["boundaries"], data["excitations"] = get_bounds_ports()
-
-# ───────── save JSON / CSV ───────── #
 base = f"HFSS_Extract_{hfss.project_name}_{hfss.design_name}_{ts}"
-with open(base + ".json", "w", encoding="utf-8") as f:
-    json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-print("JSON  →", base + ".json")
-
-if EXPORT_CSV:
-    with open(base + "_variables.csv", "w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f); w.writerow(["Variable", "Value"])
-        for k, v in data["variables"].items(): w.writerow([k, v])
-    print("CSV   →", base + "_variables.csv")
-
-hfss.release_desktop(close_projects=False, close_desktop=False)
-print("✅  Extraction finished.")
\ No newline at end of file
+spool = SectionSpool(base + ".objects.part")        # objects stream here
+columns = ObjectColumns() if EXPORT_TABLES else None  # parquet rows, same pass
+tele  = Telemetry(status_path=base + ".status.json" if TELEMETRY_FILE else None,
+                  port=TELEMETRY_PORT,
+                  meta={"project": hfss.project_name, "design": hfss.design_name})
+tele.gauge("bytes_written", lambda: spool.bytes)
+tele.gauge("objects_written", lambda: spool.count)
+
+def sink(pair):
+    spool.write(pair)
+    if columns is not None:
+        columns.write(pair)
+
+with tele, spool:                      # "failed" status on an exception; .part removed
+    data = {"meta": {"timestamp": ts, "project": hfss.project_name,
+                     "design": hfss.design_name, "aedt_version": d.release,
+                     "schema": SCHEMA_VERSION}}
+    if FILTER.selective or FILTER.sections != ALL.sections:
+        data["meta"]["filter"] = FILTER.describe()     # partial dump – say so
+    # every non-object section (variables … excitations), timed one by one
+    sections = collect_sections(hfss, FILTER, timed=tele.section)
+    for key in ("variables", "materials", "material_library"):
+        if key in sections:
+            data[key] = sections.pop(key)
+    if FILTER.wants("objects"):
+        with tele.section("objects"):
+            data["objects"] = get_objects(material_index(data), sink)
+    data.update(sections)
+    # per-entry digest + per-section roots (objects were stamped in the pipeline)
+    roots = add_digests(data, {k: v for k, v in DIGEST_FIELDS.items() if k != "objects"})
+    if "objects" in data:
+        roots["objects"] = merkle_root(data["objects"])
+    faces = (collect_face_table(hfss, list(data["objects"]))
+             if EXPORT_FACE_GEOMETRY and "objects" in data else None)
+
+    # ───────── save JSON / CSV ───────── #
+    if faces is not None:
+        data["face_geometry"] = faces.save(base + "_faces.bin")
+        log.info("FACES → %s", base + "_faces.bin")
+    if EXPORT_SOLUTIONS:
+        data["solutions"] = export_solutions(hfss, base + "_solutions")
+        log.info("SOLN  → %s", base + "_solutions")
+    save_dump(data, base + ".json", {"objects": spool})
+    log.info("JSON  → %s", base + ".json")
+
+    if EXPORT_CSV and "variables" in data:
+        with open(base + "_variables.csv", "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f); w.writerow(["Variable", "Value"])
+            for k, v in data["variables"].items(): w.writerow([k, v])
+        log.info("CSV   → %s", base + "_variables.csv")
+    if EXPORT_TABLES:
+        export_tables(data, base, columns)
+
+    hfss.release_desktop(close_projects=False, close_desktop=False)
+log.info("✅  Extraction finished.")
+log.flush()
\ No newline at end of file
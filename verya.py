@@ -15,9 +15,12 @@ Usage
     python hfss_rebuild_from_dump.py -d dump.json -o C:\Temp\Rebuilt.aedt -v 2024.2
 """
 
-import os, json, argparse
+import os, argparse
 from pyaedt import Desktop, Hfss
 
+from boundary_registry import create_boundaries
+from design_model import load_design
+
 
 # ───────────────────────── CLI parsing ───────────────────────── #
 cli = argparse.ArgumentParser(description="Rebuild HFSS model from JSON dump")
@@ -60,15 +63,14 @@ else:
 print("→ Rebuilding into", hfss.project_name, "/", hfss.design_name)
 
 # ───────────────────── load dump file ───────────────────────── #
-with open(dump_path, "r", encoding="utf-8") as f:
-    dump = json.load(f)
+dump = load_design(dump_path)           # compact, schema-checked records
 
 # ───────────────────── 1. variables ─────────────────────────── #
-for k, v in dump["variables"].items():
+for k, v in dump.variables.items():
     hfss[k] = v
 
 # ───────────────────── 2. materials ─────────────────────────── #
-for m in dump["materials"]:
+for m in dump.materials:
     if m not in hfss.materials.material_keys:
         hfss.materials.add_material(m)
 
@@ -81,10 +83,10 @@ def as_float(val):
         return 0.0
 
 # ───────────────────── 3. geometry ──────────────────────────── #
-for name, obj in dump["objects"].items():
-    prim = obj.get("primitive", "box").lower()
-    p    = obj.get("params", {})
-    mat  = obj["material"]
+for name, obj in dump.objects.items():
+    prim = obj.primitive.lower()
+    p    = obj.params
+    mat  = obj.material
 
     # create primitive by type
     if prim == "box":
@@ -104,45 +106,27 @@ for name, obj in dump["objects"].items():
         o = mdl.create_sphere(position=center, radius=radius, name=name)
     else:
         # fallback: bounding-box block
-        bb = obj["bounding_box"]
-        size = [as_float(bb["x_max"]) - as_float(bb["x_min"]),
-                as_float(bb["y_max"]) - as_float(bb["y_min"]),
-                as_float(bb["z_max"]) - as_float(bb["z_min"])]
-        pos  = [bb["x_min"], bb["y_min"], bb["z_min"]]
+        bb = obj.bbox                       # (x0, y0, z0, x1, y1, z1)
+        if len(bb) < 6:
+            print("⚠ skipped", name, "–", obj.primitive, "without a bounding box")
+            continue
+        size = [as_float(bb[3]) - as_float(bb[0]),
+                as_float(bb[4]) - as_float(bb[1]),
+                as_float(bb[5]) - as_float(bb[2])]
+        pos  = list(bb[:3])
         o = mdl.create_box(pos, size, name=name)
 
     o.material_name = mat
-    if obj.get("color") is not None:
-        o.color = tuple(obj["color"])
+    if obj.color is not None:
+        o.color = obj.color
 
 # ───────────────────── 4. ports & boundaries ────────────────── #
-bmod = hfss.boundaries
-for b in dump["boundaries"].values():
-    faces = b.get("faces", [])
-    if not faces:
-        continue
-    t = b["type"].lower()
-    if "radiat" in t:
-        bmod.create_radiation_boundary(faces, name=b["name"])
-    elif "perfecte" in t or "pec" in t:
-        bmod.create_perfect_e_boundary(faces, name=b["name"])
-    # extend with other boundary types as needed
-
-for p in dump["excitations"].values():
-    faces = p.get("faces", [])
-    if not faces:
-        continue
-    t = p["type"].lower()
-    if "wave" in t:
-        num = int(p["props"].get("PortNum", 1))
-        bmod.create_wave_port(faces, port_number=num, name=p["name"])
-    elif "lumped" in t:
-        bmod.create_lumped_port(faces, name=p["name"])
+create_boundaries(hfss, dump.boundaries)
 
 # ───────────────────── 5. analysis setups ───────────────────── #
-for s_name, s in dump["analysis_setups"].items():
-    stp = hfss.analysis_setup.create_setup(s_name, s["props"])
-    for sw_name, sw in s["sweeps"].items():
+for s_name, s in dump.setups.items():    # frequency grids already expanded
+    stp = hfss.analysis_setup.create_setup(s_name, s.props)
+    for sw_name, sw in s.sweeps.items():
         stp.add_sweep(sw_name, sw)
 
 hfss.save_project()
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+"""
+HFSS WATCH – keep a live dump of the active design fresh while you edit
+  • change detection is a polled signature, no AEDT events needed:
+      .aedt / .aedtresults  mtime + size      (every save)
+      object / boundary / variable counts     (3 cheap calls per poll)
+  • debounce + coalescing: a burst of saves / edits re-extracts once, after
+    the signature has been quiet for --debounce seconds; edits made while an
+    extraction runs trigger exactly one follow-up run
+  • incremental objects: one RunScript() – a small IronPython script walks
+    every object *inside* AEDT and writes a signature line (attributes,
+    vertex count, vertex bbox and sums) – so a refresh costs one round-trip
+    plus full fetches of the added / changed objects only; vanished ones are
+    dropped.  Without RunScript only the name delta is used (added objects
+    fetched, the rest reused).  Every --full-every runs (and on the first)
+    all objects are fetched
+  • other sections are re-collected only when their signature moved:
+      variables          names + values
+      boundaries / ports GetBoundaries() + the project file
+      history            the object signatures
+      everything else    the project file (i.e. on save)
+    the per-entry digests report what actually changed
+  • the live dump is replaced atomically: readers never see a partial file
+
+Usage
+-----
+    python watch_extract.py                       # active design
+    python watch_extract.py -p C:\\prj\\a.aedt -d HFSSDesign1 --debounce 3
+  or from an extractor script (fir.py / skssjj.py: WATCH = True)
+    watch(hfss)                                   # Ctrl+C stops
+"""
+import os, io, ast, time, tempfile, argparse
+
+from extract_pipeline import fetch_object, normalize_object, save_dump
+from dump_digest import add_digests, DIGEST_FIELDS, merkle_root
+from dump_schema import SCHEMA_VERSION
+from extract_filter import ALL, SECTIONS, ExtractFilter
+from extract_sections import collect_sections, material_index
+from extract_log import get_logger
+
+log = get_logger("watch")
+
+
+# ───────── change signature ───────── #
+def file_signature(project_path):
+    """(mtime_ns, size) of the project file and its results folder"""
+    out = []
+    if project_path:
+        for p in (project_path, os.path.splitext(project_path)[0] + ".aedtresults"):
+            try:
+                st = os.stat(p)
+                out.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                out.append(None)
+    return tuple(out)
+
+
+def session_signature(hfss):
+    """counts that move on most unsaved edits – one RPC each"""
+    sig = []
+    for fn in (lambda: len(hfss.modeler.oeditor.GetMatchedObjectName("*")),
+               lambda: hfss.odesign.GetModule("BoundarySetup").GetNumBoundaries(),
+               lambda: len(hfss.odesign.GetVariables())):
+        try:
+            sig.append(fn())
+        except Exception:
+            sig.append(None)
+    return tuple(sig)
+
+
+# runs inside AEDT (IronPython 2.7) – keep it py2 compatible
+_SIG_SCRIPT = r'''
+import ScriptEnv
+ScriptEnv.Initialize("Ansoft.ElectronicsDesktop")
+oProject = oDesktop.SetActiveProject(%(project)r)
+oDesign  = oProject.SetActiveDesign(%(design)r)
+oEditor  = oDesign.SetActiveEditor("3D Modeler")
+TAB = "Geometry3DAttributeTab"
+
+out = open(%(out)r, "w")
+for n in oEditor.GetMatchedObjectName("*"):
+    try:
+        attrs = [(p, oEditor.GetPropertyValue(TAB, n, p))
+                 for p in oEditor.GetProperties(TAB, n)]
+        vs = [[float(x) for x in oEditor.GetVertexPosition(v)]
+              for v in oEditor.GetVertexIDsFromObject(n)]
+    except Exception:
+        continue
+    geo = [len(vs)]
+    for i in range(3):
+        col = [p[i] for p in vs] or [0.0]
+        geo += [min(col), max(col), sum(col)]
+    out.write(repr([n, attrs, geo]) + "\n")
+out.close()
+'''
+
+
+def object_signatures(hfss):
+    """{name: signature} for every object in one RunScript(); None if unavailable"""
+    fd, out = tempfile.mkstemp(suffix=".sig")
+    os.close(fd)
+    script = out[:-4] + "_sig.py"
+    with io.open(script, "w", encoding="utf-8") as f:
+        f.write(_SIG_SCRIPT % {"project": hfss.project_name, "design": hfss.design_name,
+                               "out": out})
+    try:
+        hfss.odesktop.RunScript(script)
+        sigs = {}
+        with open(out, "r", encoding="utf-8") as f:
+            for line in f:
+                name, attrs, geo = ast.literal_eval(line)
+                sigs[name] = repr((sorted(attrs), geo))
+        return sigs
+    except Exception as e:
+        log.warning("⚠ object signature script failed (%s) – name delta only", e)
+        return None
+    finally:
+        for p in (script, out):
+            try:
+                os.remove(p)
+            except OSError:
+                pass
+
+
+def section_signatures(hfss, project, objects_sig):
+    """section → cheap signature; a moved signature means: collect it again"""
+    od = hfss.odesign
+    try:
+        variables = tuple((n, od.GetVariableValue(n)) for n in od.GetVariables())
+    except Exception:
+        variables = None
+    try:
+        bnd = tuple(od.GetModule("BoundarySetup").GetBoundaries())
+    except Exception:
+        bnd = None
+    saved = file_signature(project)
+    sig = {key: saved for key in SECTIONS if key != "objects"}
+    sig.update(variables=variables, boundaries=(bnd, saved), excitations=(bnd, saved),
+               history=objects_sig)
+    return sig
+
+
+def project_file(hfss):
+    path = getattr(hfss, "project_file", None)
+    if path:
+        return path
+    try:
+        return os.path.join(hfss.project_path, hfss.project_name + ".aedt")
+    except Exception:
+        return None
+
+
+# ───────── incremental dump ───────── #
+class LiveDump(object):
+    """Re-extracts into one fixed file, reusing unchanged object entries."""
+
+    def __init__(self, hfss, path, flt=ALL, full_every=20):
+        self.hfss, self.path, self.flt = hfss, path, flt
+        self.full_every = max(1, full_every)
+        self.project = project_file(hfss)
+        self.data, self.runs = None, 0
+        self._obj_sigs, self._sec_sigs = {}, {}
+
+    def _objects(self, full, mat_index, sigs):
+        mdl = self.hfss.modeler
+        prev = (self.data or {}).get("objects") or {}
+        names = self.flt.object_names(mdl)
+        if names is None:
+            names = [n for n in mdl.oeditor.GetMatchedObjectName("*")
+                     if self.flt.keep_name(n)]
+        by_name = getattr(mdl, "objects_by_name", None) or {}
+        region = self.flt.keep_bbox if self.flt.region else None
+        out, fetched = {}, 0
+        for n in names:
+            old = prev.get(n)
+            if not full and old is not None and (
+                    sigs is None or sigs.get(n) == self._obj_sigs.get(n)):
+                out[n] = old                         # unchanged – no RPC at all
+                continue
+            raw = fetch_object(mdl, n, by_name.get(n), strict=True, region=region)
+            fetched += 1
+            if raw is not None:
+                out[n] = normalize_object(raw, mat_index)[1]
+        return out, fetched
+
+    def refresh(self):
+        """one (incremental) extraction → {section: (added, changed, removed)}"""
+        hfss, flt, prev = self.hfss, self.flt, self.data or {}
+        full = self.data is None or self.runs % self.full_every == 0
+        sigs = object_signatures(hfss) if flt.wants("objects") or flt.wants("history") \
+            else None
+        sec_sigs = section_signatures(hfss, self.project,
+                                      None if sigs is None else merkle_root(sigs))
+        stale = [k for k in SECTIONS if k != "objects" and flt.wants(k) and
+                 (full or k not in prev or sec_sigs[k] is None or
+                  sec_sigs[k] != self._sec_sigs.get(k))]
+        sections = collect_sections(hfss, ExtractFilter(stale)) if stale else {}
+        if "materials" not in stale and "material_library" in prev:
+            sections["material_library"] = prev["material_library"]
+        for key in SECTIONS:
+            if key != "objects" and key not in sections and key in prev:
+                sections[key] = prev[key]            # signature unchanged → reuse
+        data = {"meta": {"timestamp": time.strftime("%Y%m%d_%H%M%S"),
+                         "project": hfss.project_name, "design": hfss.design_name,
+                         "schema": SCHEMA_VERSION, "live": True}}
+        if flt.selective or flt.sections != ALL.sections:
+            data["meta"]["filter"] = flt.describe()
+        for key in ("variables", "materials", "material_library"):
+            if key in sections:
+                data[key] = sections.pop(key)
+        fetched = 0
+        if flt.wants("objects"):
+            data["objects"], fetched = self._objects(full, material_index(data), sigs)
+        data.update(sections)
+
+        roots = add_digests(data, {k: v for k, v in DIGEST_FIELDS.items() if k != "objects"})
+        if "objects" in data:
+            roots["objects"] = merkle_root({n: e["digest"] for n, e in data["objects"].items()})
+        changes = self._changes(self.data, data)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        save_dump(data, tmp)
+        os.replace(tmp, self.path)
+        self.data = data
+        self._obj_sigs = sigs if sigs is not None else {}
+        self._sec_sigs = sec_sigs
+        self.runs += 1
+        log.info("✓ %s → %s  (%s, %d objects fetched, %d sections collected)",
+                 "full" if full else "incremental", self.path,
+                 _fmt(changes) or "no changes", fetched, len(stale),
+                 event="refresh", changes=changes, fetched=fetched, collected=stale)
+        return changes
+
+    @staticmethod
+    def _changes(old, new):
+        if old is None:
+            return {}
+        out = {}
+        for section, root in new.get("digests", {}).items():
+            if old.get("digests", {}).get(section) == root:
+                continue                             # Merkle root equal → skip
+            a, b = old.get(section) or {}, new.get(section) or {}
+            added = sum(1 for n in b if n not in a)
+            removed = sum(1 for n in a if n not in b)
+            changed = sum(1 for n, e in b.items() if n in a and
+                          isinstance(e, dict) and e.get("digest") != a[n].get("digest"))
+            out[section] = (added, changed, removed)
+        return out
+
+
+def _fmt(changes):
+    return ", ".join(f"{s} +{a} ~{c} -{r}" for s, (a, c, r) in changes.items())
+
+
+# ───────── watch loop ───────── #
+def watch(hfss, path=None, interval=2.0, debounce=2.0, full_every=20, flt=ALL,
+          max_runs=None):
+    """Poll, debounce, re-extract; returns after *max_runs* refreshes or Ctrl+C."""
+    project = project_file(hfss)
+    path = path or f"HFSS_Live_{hfss.project_name}_{hfss.design_name}.json"
+    live = LiveDump(hfss, path, flt, full_every)
+
+    def signature():
+        return file_signature(project) + session_signature(hfss)
+
+    seen = signature()
+    live.refresh()
+    log.info("→ watching %s / %s every %.1fs (Ctrl+C stops)",
+             hfss.project_name, hfss.design_name, interval)
+    dirty_since = None
+    try:
+        while max_runs is None or live.runs < max_runs:
+            time.sleep(interval)
+            sig = signature()
+            if sig != seen:                          # still moving → restart the quiet timer
+                seen, dirty_since = sig, time.monotonic()
+                continue
+            if dirty_since is not None and time.monotonic() - dirty_since >= debounce:
+                dirty_since = None                   # edits during refresh → next signature differs
+                live.refresh()
+    except KeyboardInterrupt:
+        log.info("■ watch stopped after %d refreshes", live.runs)
+    log.flush()
+    return live
+
+
+def main():
+    cli = argparse.ArgumentParser(description="Keep a live dump of an HFSS design up to date")
+    cli.add_argument("-p", "--project", help=".aedt file (default: active project)")
+    cli.add_argument("-d", "--design", help="design name (default: active design)")
+    cli.add_argument("-o", "--output", help="live dump path")
+    cli.add_argument("-v", "--version", help="AEDT version, e.g. 2024.2")
+    cli.add_argument("-i", "--interval", type=float, default=2.0, help="poll seconds")
+    cli.add_argument("--debounce", type=float, default=2.0,
+                     help="quiet seconds before re-extracting")
+    cli.add_argument("--full-every", type=int, default=20,
+                     help="every N-th refresh fetches all objects")
+    args = cli.parse_args()
+
+    from pyaedt import Desktop, Hfss
+
+    Desktop(specified_version=args.version, new_desktop=False)
+    if args.project:
+        hfss = Hfss(projectname=os.path.abspath(args.project), designname=args.design,
+                    specified_version=args.version, new_desktop=False, close_on_exit=False)
+    else:
+        hfss = Hfss(designname=args.design, specified_version=args.version,
+                    new_desktop=False, close_on_exit=False)
+    if hfss is False:
+        raise RuntimeError("No active HFSS design – select one in AEDT and re-run.")
+    try:
+        watch(hfss, args.output, args.interval, args.debounce, args.full_every)
+    finally:
+        hfss.release_desktop(close_projects=False, close_desktop=False)
+
+
+if __name__ == "__main__":
+    main()
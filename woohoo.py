@@ -31,8 +31,20 @@ import json
 import csv
 import traceback
 from datetime import datetime
+from itertools import groupby
 from typing import Dict, List, Any, Optional, Tuple
 
+from script_templates import ScriptTemplates, ScriptWriter, box_rows_from_bboxes
+from material_library import extract_material_library, material_table
+from boundary_table import split_name_type_pairs
+from freq_grid import compress_props
+from columnar_export import export_tables
+from capabilities import (get_probe, CapabilityError, COM_OBJECT_LIST_STRATEGIES,
+                          COM_MATERIAL_STRATEGIES, COM_HISTORY_STRATEGIES)
+from extract_log import get_logger
+
+log = get_logger("woohoo")
+
 class HFSSPropertyExtractor:
 “”“Advanced HFSS Property Extractor using COM API”””
 
@@ -156,9 +168,9 @@ def extract_design_variables(self) -> Dict[str, Any]:
                     try:
                         var_value = self.design.GetVariableValue(var_name)
                         variables[var_name] = var_value
-                        print(f"  {var_name} = {var_value}")
+                        log.debug("  %s = %s", var_name, var_value)
                     except Exception as e:
-                        print(f"  ✗ Could not get value for {var_name}: {e}")
+                        log.warn("Could not get value for %s: %s", var_name, e)
                         variables[var_name] = "ERROR"
         except Exception as e1:
             print(f"  Method 1 failed: {e1}")
@@ -171,7 +183,7 @@ def extract_design_variables(self) -> Dict[str, Any]:
                     try:
                         var_value = self.design.GetVariableValue(var_name)
                         variables[var_name] = var_value
-                        print(f"  {var_name} = {var_value}")
+                        log.debug("  %s = %s", var_name, var_value)
                     except Exception:
                         variables[var_name] = "ERROR"
             except Exception as e2:
@@ -186,10 +198,27 @@ def extract_design_variables(self) -> Dict[str, Any]:
     return variables
 
 def extract_materials(self) -> Dict[str, Dict[str, Any]]:
-    """Extract material properties"""
+    """Extract material properties (bulk library read, cached per project)"""
     materials = {}
     try:
         print("\n🧪 Extracting Materials...")
+        
+        # Bulk path: parse the saved project's material library in one read –
+        # only while the file on disk is current (unsaved edits → COM path)
+        project_file = os.path.join(self.project.GetPath(), self.project.GetName() + ".aedt")
+        try:
+            unsaved = bool(self.project.IsModified())
+        except Exception:
+            unsaved = True
+        library = (extract_material_library(project_file=project_file)
+                   if os.path.isfile(project_file) and not unsaved else {})
+        if library:
+            table, _ = material_table(library)
+            for mat_id, props in table.items():
+                materials[props["name"]] = dict(props, id=mat_id)
+            print(f"  Found {len(materials)} materials in project library (bulk read)")
+            return materials
+        
         def_manager = self.project.GetDefinitionManager()
         
         # Try multiple methods to get materials
@@ -230,10 +259,10 @@ def extract_materials(self) -> Dict[str, Dict[str, Any]]:
                     material_props["extraction_error"] = str(e)
                 
                 materials[mat_name] = material_props
-                print(f"  {mat_name}: recorded")
+                log.debug("  %s: recorded", mat_name)
                 
             except Exception as e:
-                print(f"  ✗ Error processing material {mat_name}: {e}")
+                log.warn("Error processing material %s: %s", mat_name, e)
                 materials[mat_name] = {"error": str(e)}
         
         if not materials:
@@ -251,56 +280,39 @@ def extract_3d_objects(self) -> Dict[str, Dict[str, Any]]:
         print("\n📦 Extracting 3D Objects...")
         editor = self.design.SetActiveEditor("3D Modeler")
         
-        # Get all object names - try multiple methods
-        all_objects = []
+        # Object enumeration path resolved once per AEDT version
+        probe = get_probe(self.desktop)
         try:
-            # Method 1: Get solids
-            solid_objects = editor.GetObjectsInGroup("Solids")
-            if solid_objects:
-                all_objects.extend(solid_objects)
-                print(f"  Found {len(solid_objects)} solid objects")
-        except Exception as e:
-            print(f"  Could not get solids: {e}")
-        
+            all_objects = probe.call("object_list", COM_OBJECT_LIST_STRATEGIES, editor)
+        except CapabilityError as e:
+            print(f"  Could not list objects: {e}")
+            all_objects = []
         try:
-            # Method 2: Get unclassified objects
-            unclassified_objects = editor.GetObjectsInGroup("UnClassified")
-            if unclassified_objects:
-                all_objects.extend(unclassified_objects)
-                print(f"  Found {len(unclassified_objects)} unclassified objects")
-        except Exception as e:
-            print(f"  Could not get unclassified objects: {e}")
-        
+            get_material = (probe.bind("object_material", COM_MATERIAL_STRATEGIES,
+                                       editor, all_objects[0]) if all_objects else None)
+        except CapabilityError:
+            get_material = None             # every object → "Unknown"
         try:
-            # Method 3: Get all objects (fallback)
-            if not all_objects:
-                all_names = editor.GetObjectName()  # This might return all object names
-                if isinstance(all_names, str):
-                    all_objects = [all_names]
-                elif isinstance(all_names, (list, tuple)):
-                    all_objects = list(all_names)
-        except Exception as e:
-            print(f"  Fallback method failed: {e}")
+            get_history = (probe.bind("object_history", COM_HISTORY_STRATEGIES,
+                                      editor, all_objects[0]) if all_objects else None)
+        except CapabilityError:
+            get_history = None              # no object_type → template comments
         
         # Remove duplicates
         all_objects = list(set(all_objects)) if all_objects else []
         print(f"  Processing {len(all_objects)} total objects")
+        bar = log.progress("objects", total=len(all_objects))
         
         for obj_name in all_objects:
+            bar.update()
             try:
                 obj_props = {"name": obj_name}
                 
                 # Get material assignment - this is usually reliable
                 try:
-                    material = editor.GetPropertyValue("Attributes", "Material", obj_name)
-                    obj_props["Material"] = material
+                    obj_props["Material"] = get_material(editor, obj_name)
                 except Exception:
-                    # Try alternative method
-                    try:
-                        material = editor.GetMaterial(obj_name)
-                        obj_props["Material"] = material
-                    except Exception:
-                        obj_props["Material"] = "Unknown"
+                    obj_props["Material"] = "Unknown"
                 
                 # Get object visibility/display properties
                 try:
@@ -320,20 +332,21 @@ def extract_3d_objects(self) -> Dict[str, Dict[str, Any]]:
                 except Exception as e:
                     obj_props["bbox_error"] = str(e)
                 
-                # Try to get object type information
+                # Object type from the creation history (CreateBox:1 → "Box")
                 try:
-                    # This is complex and version-dependent
-                    # For now, just mark as extracted
-                    obj_props["extracted"] = True
+                    obj_props["creation_history"] = get_history(editor, obj_name)
+                    self._parse_object_geometry(editor, obj_name, obj_props)
                 except Exception:
                     pass
+                obj_props["extracted"] = True
                 
                 objects[obj_name] = obj_props
-                print(f"  {obj_name}: {obj_props.get('Material', 'Unknown material')}")
+                log.debug("  %s: %s", obj_name, obj_props.get("Material", "Unknown material"))
                 
             except Exception as e:
-                print(f"  ✗ Error extracting object {obj_name}: {e}")
+                log.warn("Error extracting object %s: %s", obj_name, e)
                 objects[obj_name] = {"error": str(e)}
+        bar.close()
         
         if not objects:
             print("  No 3D objects found")
@@ -376,7 +389,7 @@ def _parse_object_geometry(self, editor, obj_name: str, obj_props: Dict[str, Any
         obj_props["geometry_parse_error"] = str(e)
 
 def extract_boundaries_excitations(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-    """Extract boundaries and excitations"""
+    """Extract boundaries and excitations (names + types from one call each)"""
     boundaries = {}
     excitations = {}
     
@@ -386,29 +399,30 @@ def extract_boundaries_excitations(self) -> Tuple[Dict[str, Any], Dict[str, Any]
         
         # Extract boundaries
         try:
-            boundary_names = boundary_module.GetBoundaries()
-            print(f"  Found {len(boundary_names)} boundaries")
+            boundary_types = split_name_type_pairs(boundary_module.GetBoundaries())
+            print(f"  Found {len(boundary_types)} boundaries")
             
-            for bnd_name in boundary_names:
+            for bnd_name, bnd_type in boundary_types.items():
                 try:
                     bnd_props = {"name": bnd_name}
                     
-                    # Get boundary type - this method usually exists
-                    try:
-                        bnd_type = boundary_module.GetBoundaryType(bnd_name)
-                        bnd_props["type"] = bnd_type
-                    except Exception:
-                        bnd_props["type"] = "Unknown"
+                    # Older releases return names only - probe the type then
+                    if bnd_type is None:
+                        try:
+                            bnd_type = boundary_module.GetBoundaryType(bnd_name)
+                        except Exception:
+                            bnd_type = "Unknown"
+                    bnd_props["type"] = bnd_type
                     
                     # Getting detailed properties is complex and version-dependent
                     # For now, just record basic info
                     bnd_props["extracted"] = True
                     
                     boundaries[bnd_name] = bnd_props
-                    print(f"  Boundary: {bnd_name} ({bnd_props.get('type', 'Unknown')})")
+                    log.debug("  Boundary: %s (%s)", bnd_name, bnd_props.get("type", "Unknown"))
                     
                 except Exception as e:
-                    print(f"  ✗ Error processing boundary {bnd_name}: {e}")
+                    log.warn("Error processing boundary %s: %s", bnd_name, e)
                     boundaries[bnd_name] = {"error": str(e)}
                     
         except Exception as e:
@@ -416,28 +430,29 @@ def extract_boundaries_excitations(self) -> Tuple[Dict[str, Any], Dict[str, Any]
         
         # Extract excitations
         try:
-            excitation_names = boundary_module.GetExcitations()
-            print(f"  Found {len(excitation_names)} excitations")
+            excitation_types = split_name_type_pairs(boundary_module.GetExcitations())
+            print(f"  Found {len(excitation_types)} excitations")
             
-            for exc_name in excitation_names:
+            for exc_name, exc_type in excitation_types.items():
                 try:
                     exc_props = {"name": exc_name}
                     
-                    # Get excitation type
-                    try:
-                        exc_type = boundary_module.GetExcitationType(exc_name)
-                        exc_props["type"] = exc_type
-                    except Exception:
-                        exc_props["type"] = "Unknown"
+                    # Older releases return names only - probe the type then
+                    if exc_type is None:
+                        try:
+                            exc_type = boundary_module.GetExcitationType(exc_name)
+                        except Exception:
+                            exc_type = "Unknown"
+                    exc_props["type"] = exc_type
                     
                     # Record basic info
                     exc_props["extracted"] = True
                     
                     excitations[exc_name] = exc_props
-                    print(f"  Excitation: {exc_name} ({exc_props.get('type', 'Unknown')})")
+                    log.debug("  Excitation: %s (%s)", exc_name, exc_props.get("type", "Unknown"))
                     
                 except Exception as e:
-                    print(f"  ✗ Error processing excitation {exc_name}: {e}")
+                    log.warn("Error processing excitation %s: %s", exc_name, e)
                     excitations[exc_name] = {"error": str(e)}
                     
         except Exception as e:
@@ -467,7 +482,7 @@ def extract_analysis_setup(self) -> Dict[str, Dict[str, Any]]:
                     for i in range(0, len(props), 2):
                         if i + 1 < len(props):
                             setup_props[props[i]] = props[i + 1]
-                    setup_data["properties"] = setup_props
+                    setup_data["properties"] = compress_props(setup_props)
                 except Exception as e:
                     setup_data["properties_error"] = str(e)
                 
@@ -481,15 +496,15 @@ def extract_analysis_setup(self) -> Dict[str, Dict[str, Any]]:
                             for i in range(0, len(props), 2):
                                 if i + 1 < len(props):
                                     sweep_props[props[i]] = props[i + 1]
-                            setup_data["sweeps"][sweep_name] = sweep_props
-                            print(f"    Sweep: {sweep_name}")
+                            setup_data["sweeps"][sweep_name] = compress_props(sweep_props)
+                            log.debug("    Sweep: %s", sweep_name)
                         except Exception as e:
                             setup_data["sweeps"][sweep_name] = {"error": str(e)}
                 except Exception:
                     pass
                 
                 setups[setup_name] = setup_data
-                print(f"  Setup: {setup_name}")
+                log.debug("  Setup: %s", setup_name)
                 
             except Exception as e:
                 setups[setup_name] = {"error": str(e)}
@@ -601,83 +616,108 @@ def save_to_csv(self, filename_prefix: str = None):
         
         print(f"💾 CSV files saved with prefix: {filename_prefix}")
         
+        # Typed columnar tables for pandas / pyarrow (skipped without pyarrow)
+        export_tables(self.extraction_data, filename_prefix)
+        
     except Exception as e:
         print(f"✗ Error saving CSV: {e}")
 
-def generate_recreation_script(self, filename: str = None) -> str:
-    """Generate a Python script to recreate the design"""
+def generate_recreation_script(self, filename: str = None, return_text: bool = False) -> str:
+    """Generate a Python script to recreate the design (rendered through the template layer)
+    
+    Rows are streamed straight into *filename*; returns the file name, or the
+    script text (read back) when *return_text* is set.
+    """
     if not filename:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         project_name = self.extraction_data["metadata"].get("project_name", "unknown")
         design_name = self.extraction_data["metadata"].get("design_name", "unknown")
         filename = f"HFSS_Recreate_{project_name}_{design_name}_{timestamp}.py"
     
-    script_lines = [
-        '"""',
-        'HFSS Design Recreation Script',
-        f'Generated from: {self.extraction_data["metadata"]["project_name"]}',
-        f'Design: {self.extraction_data["metadata"]["design_name"]}',
-        f'Generated on: {self.extraction_data["metadata"]["extraction_time"]}',
-        '"""',
-        '',
-        'import win32com.client',
-        '',
-        'def recreate_hfss_design():',
-        '    """Recreate the HFSS design from extracted properties"""',
-        '    ',
-        '    # Connect to HFSS',
-        '    hfss = win32com.client.Dispatch("Ansoft.ElectronicsDesktop")',
-        '    desktop = hfss.GetDesktop()',
-        '    ',
-        '    # Create new project',
-        f'    project = desktop.NewProject("{self.extraction_data["metadata"]["project_name"]}")',
-        f'    design = project.NewDesign("HFSS", "{self.extraction_data["metadata"]["design_name"]}")',
-        '    editor = design.SetActiveEditor("3D Modeler")',
-        '    ',
-        '    # Set design variables'
-    ]
-    
-    # Add variables
-    for var_name, var_value in self.extraction_data["variables"].items():
-        script_lines.append(f'    design.ChangeProperty("DesignVariables", "{var_name}", "{var_value}")')
-    
-    script_lines.extend([
-        '    ',
-        '    # Create 3D objects',
-        '    # Note: Object recreation requires detailed geometry parameters',
-        '    # This is a template - specific implementation depends on object types'
-    ])
-    
-    # Add object creation templates
-    for obj_name, obj_props in self.extraction_data["objects_3d"].items():
-        material = obj_props.get("Material", "vacuum")
-        script_lines.extend([
-            f'    # Object: {obj_name}',
-            f'    # Material: {material}',
-            f'    # TODO: Add specific creation command based on object type',
-            ''
-        ])
-    
-    script_lines.extend([
-        '    ',
-        '    print("Design recreation template completed!")',
-        '    print("Note: This is a template. Specific geometry creation")',
-        '    print("commands need to be implemented based on object types.")',
-        '',
-        'if __name__ == "__main__":',
-        '    recreate_hfss_design()'
-    ])
-    
-    script_content = '\n'.join(script_lines)
-    
+    meta = self.extraction_data["metadata"]
+    tpl = ScriptTemplates(editor="editor", module="module", design="design",
+                          indent="    ")
+
+    # unrotated boxes with a bounding box become CreateBox rows; every other
+    # primitive stays a template comment (a cylinder is never rebuilt as its bbox)
+    def kind(item):
+        props = item[1]
+        rotated = any(str(h).startswith("Rotate") for h in props.get("creation_history") or ())
+        return ("box" if props.get("object_type") == "Box" and not rotated and
+                isinstance(props.get("bounding_box"), dict) else "comment")
+
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(script_content)
-        print(f"🔧 Recreation script saved to: {filename}")
+        w = ScriptWriter(filename, tpl)
     except Exception as e:
         print(f"✗ Error saving recreation script: {e}")
+        return None
+    with w:
+        w.write_lines([
+            '"""',
+            'HFSS Design Recreation Script',
+            f'Generated from: {meta["project_name"]}',
+            f'Design: {meta["design_name"]}',
+            f'Generated on: {meta["extraction_time"]}',
+            '"""',
+            '',
+            'import win32com.client',
+            '',
+            'def recreate_hfss_design():',
+            '    """Recreate the HFSS design from extracted properties"""',
+            '    ',
+            '    # Connect to HFSS',
+            '    hfss = win32com.client.Dispatch("Ansoft.ElectronicsDesktop")',
+            '    desktop = hfss.GetDesktop()',
+            '    ',
+            '    # Create new project',
+            f'    project = desktop.NewProject("{meta["project_name"]}")',
+            f'    design = project.NewDesign("HFSS", "{meta["design_name"]}")',
+            '    editor = design.SetActiveEditor("3D Modeler")',
+            '    module = design.GetModule("BoundarySetup")',
+            '    ',
+            '    # Set design variables'
+        ])
+        w.write_rows("variable", ({"name": k, "value": v} for k, v in
+                                  self.extraction_data["variables"].items()))
+        w.write_lines([
+            '    ',
+            '    # Create 3D objects',
+            '    # Note: boxes are rebuilt from their bounding box (model units);',
+            '    # other object types are listed as templates'
+        ])
+        # consecutive runs of one kind → one table each, object order kept
+        for k, run in groupby(self.extraction_data["objects_3d"].items(), key=kind):
+            run = list(run)
+            if k == "box":
+                bbs = [[p["bounding_box"][c] for c in ("x_min", "y_min", "z_min",
+                                                       "x_max", "y_max", "z_max")]
+                       for _, p in run]
+                w.write_rows("box", box_rows_from_bboxes(
+                    [n for n, _ in run], bbs, [p.get("Material", "vacuum") for _, p in run],
+                    units=""))
+                continue
+            for obj_name, obj_props in run:
+                w.write_rows("comment", [
+                    {"text": f'Object: {obj_name}'},
+                    {"text": f'Material: {obj_props.get("Material", "vacuum")}'},
+                    {"text": f'TODO: Add specific creation command based on object type '
+                             f'({obj_props.get("object_type", "Unknown")})'}])
+                w.write_block('\n')
+        w.write_lines([
+            '    ',
+            '    print("Design recreation template completed!")',
+            '    print("Note: This is a template. Specific geometry creation")',
+            '    print("commands need to be implemented based on object types.")',
+            '',
+            'if __name__ == "__main__":',
+            '    recreate_hfss_design()'
+        ])
+    print(f"🔧 Recreation script saved to: {filename}")
     
-    return script_content
+    if not return_text:
+        return filename
+    with open(filename, 'r', encoding='utf-8') as f:
+        return f.read()
 
 def print_summary(self):
     """Print a summary of extracted data"""